@@ -0,0 +1,219 @@
+# benchmarks/bench_sheets.py
+"""
+Times the sheet viewer's hot paths on a synthetic workbook and writes
+the results as JSON, optionally comparing them with an earlier run.
+
+    python benchmarks/bench_sheets.py --rows 50000 --cols 30
+    python benchmarks/bench_sheets.py --compare build/bench/<earlier>.json
+
+Benchmarks (each: repeat × number calls, min / median / mean seconds):
+    sheets_model_xlsx    SheetsModel(path) – full parse of the workbook
+    sheets_model_df      SheetsModel(df) – stats + row model only
+    cardtable_load       CardTableModel.load_from_df
+    row_items            RowModel.items() for `--nav-steps` rows
+    qt_repaint           data() for every visible cell × display/check role
+    navigation           next / prev + Value-column repaint, `--nav-steps` times
+    drop_reorder         mimeData + dropMimeData of one card to another row
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "parser"))      # `comp` as in main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pandas as pd                                               # noqa: E402
+
+from workbook_gen import (                                        # noqa: E402
+    WorkbookSpec, add_spec_arguments, ensure_workbook, generate_frame, spec_from_args,
+)
+
+DEFAULT_OUT = ROOT / "build" / "bench"
+DEFAULT_WORKBOOKS = ROOT / "temp" / "bench"
+
+
+# ── timing ──────────────────────────────────────────────────────────
+def measure(fn: Callable[[], object], repeat: int, number: int = 1,
+            setup: Callable[[], object] | None = None) -> dict:
+    """Best-of / median-of `repeat` runs of `number` calls to fn()."""
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append(time.perf_counter() - t0)
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "per_call": min(runs) / number,
+    }
+
+
+# ── suite ───────────────────────────────────────────────────────────
+def run_suite(spec: WorkbookSpec, workbook: Path, repeat: int, nav_steps: int) -> dict:
+    from PySide6.QtCore import QModelIndex, Qt
+    from PySide6.QtWidgets import QApplication, QPushButton
+
+    from comp.sheets.model import SheetsModel
+    from comp.sheets.model_card_table import CardTableModel
+    from comp.sheets.model_api_table import CardTableQtModel
+    from comp.sheets.controller_nav import NavigationController
+
+    app = QApplication.instance() or QApplication([])        # noqa: F841
+    df = generate_frame(spec)
+    results: dict[str, dict] = {}
+
+    def bench(name: str, fn, **kw) -> None:
+        results[name] = measure(fn, **kw)
+        r = results[name]
+        print(f"{name:<20} min {r['min']:9.4f}s  median {r['median']:9.4f}s  "
+              f"({r['repeat']}×{r['number']})", flush=True)
+
+    bench("sheets_model_xlsx", lambda: SheetsModel(workbook), repeat=max(1, repeat // 2))
+    bench("sheets_model_df", lambda: SheetsModel(df), repeat=repeat)
+    bench("cardtable_load", lambda: CardTableModel.load_from_df(df), repeat=repeat)
+
+    model = SheetsModel(df)
+    rows = model.rows
+    steps = min(nav_steps, rows.row_count)
+
+    def walk_items() -> None:
+        for i in range(steps):
+            rows.index = i
+            rows.items()
+    bench("row_items", walk_items, repeat=repeat)
+
+    qt = CardTableQtModel(model)
+    qt.show_all = True
+    roles = (Qt.DisplayRole, Qt.CheckStateRole)
+
+    def repaint(columns=range(3)) -> None:
+        for r in range(qt.rowCount()):
+            for c in columns:
+                ix = qt.index(r, c)
+                for role in roles:
+                    qt.data(ix, role)
+
+    def fresh_row() -> None:
+        qt.invalidate_row()
+    bench("qt_repaint", repaint, repeat=repeat, setup=fresh_row)
+
+    prev_btn, next_btn = QPushButton(), QPushButton()
+    nav = NavigationController(rows, prev_btn, next_btn)
+    nav.rowChanged.connect(qt.invalidate_row)
+    nav.rowChanged.connect(lambda _: repaint((2,)))
+
+    def navigate() -> None:                 # flush(): one repaint per step,
+        for _ in range(steps // 2):         # not one per coalesced burst
+            next_btn.click()
+            nav.flush()
+        for _ in range(steps - steps // 2):
+            prev_btn.click()
+            nav.flush()
+    bench("navigation", navigate, repeat=repeat)
+
+    drops = iter(range(10 ** 9))
+    count = qt.rowCount()
+
+    def drop_once() -> None:
+        i = next(drops)
+        src = i % count
+        dest = (src + count // 2) % (count + 1)
+        mime = qt.mimeData([qt.index(src, 0)])
+        qt.dropMimeData(mime, Qt.MoveAction, dest, 0, QModelIndex())
+    bench("drop_reorder", drop_once, repeat=repeat, number=50)
+
+    return results
+
+
+# ── report ──────────────────────────────────────────────────────────
+def environment() -> dict:
+    import PySide6
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "pyside6": PySide6.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Benchmarks whose min time grew by more than `tolerance` (fraction)."""
+    if current["spec"] != baseline.get("spec"):
+        print("note: baseline was run with a different workbook spec")
+    slower = []
+    print(f"\n{'benchmark':<20} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, r in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if old is None:
+            continue
+        ratio = r["min"] / old["min"] if old["min"] else float("inf")
+        flag = "  REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{name:<20} {old['min']:10.4f} {r['min']:10.4f} {ratio:7.2f}{flag}")
+        if flag:
+            slower.append(name)
+    return slower
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the sheet viewer's hot paths.")
+    add_spec_arguments(ap)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--nav-steps", type=int, default=200)
+    ap.add_argument("--workbook-dir", type=Path, default=DEFAULT_WORKBOOKS,
+                    help="where generated workbooks are kept between runs")
+    ap.add_argument("--out", type=Path, help=f"JSON result file (default: {DEFAULT_OUT}/…)")
+    ap.add_argument("--compare", type=Path, help="earlier JSON result to compare with")
+    ap.add_argument("--tolerance", type=float, default=0.2,
+                    help="allowed slowdown vs --compare before failing (default 0.2)")
+    args = ap.parse_args(argv)
+
+    spec = spec_from_args(args)
+    t0 = time.perf_counter()
+    workbook = ensure_workbook(spec, args.workbook_dir)
+    print(f"workbook {workbook} ({time.perf_counter() - t0:.1f}s)")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "env": environment(),
+        "spec": {k: getattr(spec, k) for k in spec.__dataclass_fields__},
+        "workbook_bytes": workbook.stat().st_size,
+        "results": run_suite(spec, workbook, args.repeat, args.nav_steps),
+    }
+
+    out = args.out or DEFAULT_OUT / f"{time.strftime('%Y%m%d-%H%M%S')}_{spec.slug}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"results → {out}")
+
+    if args.compare:
+        slower = compare(report, json.loads(args.compare.read_text()), args.tolerance)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
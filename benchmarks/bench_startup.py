@@ -0,0 +1,148 @@
+# benchmarks/bench_startup.py
+"""
+Cold-start time of the GUI: time to the first (main) window and where
+the import time goes, checked against a budget.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget 1.5 --top 25
+
+Every run is a fresh interpreter (`python -X importtime`) that builds
+MainApp, shows it, processes the first events and exits:
+    first_window   wall time from process spawn to the window on screen
+    imports        cumulative import time per top-level package (best run)
+    deferred       modules that must not be loaded yet (pandas, openpyxl,
+                   the sheets / user-form subsystems)
+
+Exit status 1 when the best run exceeds --budget or a deferred module was
+imported before the first window – usable as a regression check.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PARSER_DIR = ROOT / "src" / "parser"                  # `comp` as in main.py
+DEFAULT_OUT = ROOT / "build" / "bench"
+DEFAULT_BUDGET = 1.5                                  # seconds to first window
+
+DEFERRED = ("pandas", "openpyxl", "comp.sheets", "comp.user_form")
+
+_MARK = "FIRST_WINDOW "
+_CHILD = f"""
+import json, sys
+from PySide6.QtWidgets import QApplication
+from comp.main import MainApp
+app = QApplication(sys.argv)
+main_app = MainApp(excel_path="unused.xlsx")
+main_app.show()
+app.processEvents()
+loaded = [m for m in {DEFERRED!r} if m in sys.modules]
+print({_MARK!r} + json.dumps(loaded), flush=True)
+"""
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+# ── one cold start ──────────────────────────────────────────────────
+def cold_start(python: str = sys.executable) -> dict:
+    """Spawn the GUI once; first-window time, deferred modules, import times."""
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+           "PYTHONPATH": str(PARSER_DIR)}
+    with tempfile.TemporaryFile("w+") as log:      # importtime log: no pipe to fill
+        t0 = time.perf_counter()
+        proc = subprocess.Popen([python, "-X", "importtime", "-c", _CHILD], cwd=PARSER_DIR,
+                                env=env, stdout=subprocess.PIPE, stderr=log, text=True)
+        first_window = loaded = None
+        for line in proc.stdout:
+            if line.startswith(_MARK):
+                first_window = time.perf_counter() - t0
+                loaded = json.loads(line[len(_MARK):])
+        proc.wait()
+        log.seek(0)
+        stderr = log.read()
+    if proc.returncode != 0 or first_window is None:
+        raise RuntimeError(f"GUI start failed (exit {proc.returncode}):\n{stderr[-2000:]}")
+    return {"first_window": first_window, "deferred_loaded": loaded,
+            "imports": import_breakdown(stderr)}
+
+
+def import_breakdown(importtime_log: str) -> dict[str, float]:
+    """`-X importtime` output → cumulative seconds per top-level package."""
+    totals: dict[str, float] = {}
+    for m in _IMPORT_LINE.finditer(importtime_log):
+        if m.group(3) == " ":                        # outermost import only
+            package = m.group(4).split(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(m.group(2)) / 1e6
+    return dict(sorted(totals.items(), key=lambda kv: -kv[1]))
+
+
+# ── report ──────────────────────────────────────────────────────────
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(),
+            "platform": platform.platform(), "cpus": os.cpu_count()}
+
+
+def print_report(runs: list[dict], best: dict, top: int) -> None:
+    times = [r["first_window"] for r in runs]
+    print(f"first window  min {min(times):.3f}s  median {statistics.median(times):.3f}s"
+          f"  ({len(runs)} cold starts)")
+    imports = best["imports"]
+    print(f"\n{'package':<28}{'import s':>10}{'share':>8}")
+    for package, seconds in list(imports.items())[:top]:
+        print(f"{package:<28}{seconds:10.3f}{seconds / best['first_window']:8.0%}")
+    print(f"{'(all imports)':<28}{sum(imports.values()):10.3f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Measure and check the GUI cold start.")
+    ap.add_argument("--repeat", type=int, default=5, help="cold starts (best one counts)")
+    ap.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                    help=f"max seconds to the first window (default {DEFAULT_BUDGET})")
+    ap.add_argument("--top", type=int, default=15, help="packages shown in the breakdown")
+    ap.add_argument("--out", type=Path, help=f"JSON result file (default: {DEFAULT_OUT}/…)")
+    args = ap.parse_args(argv)
+
+    runs = [cold_start() for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda r: r["first_window"])
+    print_report(runs, best, args.top)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "env": environment(),
+        "budget": args.budget,
+        "first_window": [r["first_window"] for r in runs],
+        "imports": best["imports"],
+        "deferred_loaded": best["deferred_loaded"],
+    }
+    out = args.out or DEFAULT_OUT / f"startup_{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nresults → {out}")
+
+    failed = False
+    if best["first_window"] > args.budget:
+        print(f"OVER BUDGET: {best['first_window']:.3f}s > {args.budget:.3f}s")
+        failed = True
+    eager = sorted({m for r in runs for m in r["deferred_loaded"]})
+    if eager:
+        print(f"IMPORTED BEFORE FIRST WINDOW: {', '.join(eager)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# benchmarks/workbook_gen.py
+"""
+Deterministic synthetic workbooks for the benchmarks.
+
+Same WorkbookSpec (incl. seed) → same DataFrame → same file, so runs on
+different commits compare like with like.
+
+    python benchmarks/workbook_gen.py temp/bench/wide.xlsx --rows 50000 --cols 40
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["WorkbookSpec", "generate_frame", "write_workbook", "ensure_workbook",
+           "add_spec_arguments", "spec_from_args"]
+
+CHILD_COLUMN = "children"
+CHILD_SEP = "\n"
+
+_ALPHABET = np.array(list("abcdefghijklmnopqrstuvwxyz      ABCDEFG0123456789"))
+
+
+@dataclass(frozen=True, slots=True)
+class WorkbookSpec:
+    """
+    Shape of a synthetic sheet.
+
+    • rows × cols        – data rows, columns incl. `id` and `children`
+    • text_len_*         – text cell length ~ lognormal(median, sigma), capped
+    • numeric / date     – share of the remaining columns (rest is text)
+    • child_ratio        – share of rows whose `children` cell holds 2..max
+                           newline-separated values (others hold one)
+    • null_share         – share of empty cells in data columns
+    """
+    rows: int = 10_000
+    cols: int = 20
+    text_len_median: float = 24.0
+    text_len_sigma: float = 1.0
+    text_len_max: int = 2_000
+    numeric_share: float = 0.3
+    date_share: float = 0.1
+    child_ratio: float = 0.2
+    max_children: int = 5
+    null_share: float = 0.02
+    seed: int = 0
+
+    @property
+    def slug(self) -> str:
+        """Short stable id for file names (spec hash)."""
+        raw = json.dumps(asdict(self), sort_keys=True).encode()
+        return f"r{self.rows}_c{self.cols}_{hashlib.blake2b(raw, digest_size=4).hexdigest()}"
+
+
+# ── frame ───────────────────────────────────────────────────────────
+def generate_frame(spec: WorkbookSpec) -> pd.DataFrame:
+    rng = np.random.default_rng(spec.seed)
+    n = spec.rows
+    data: dict[str, object] = {"id": np.arange(n, dtype=np.int64)}
+
+    k = np.ones(n, dtype=np.int64)
+    multi = rng.random(n) < spec.child_ratio
+    k[multi] = rng.integers(2, max(spec.max_children, 2) + 1, multi.sum())
+    children = _texts(rng, int(k.sum()), spec, median=8.0)
+    bounds = np.concatenate(([0], np.cumsum(k)))
+    data[CHILD_COLUMN] = [CHILD_SEP.join(children[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+
+    rest = max(spec.cols - 2, 0)
+    n_num = round(rest * spec.numeric_share)
+    n_date = min(round(rest * spec.date_share), rest - n_num)
+    for i in range(rest):
+        if i < n_num:
+            col = (rng.integers(0, 1_000_000, n) if i % 2 == 0
+                   else rng.normal(1_000, 250, n).round(4))
+            name = f"num_{i}"
+        elif i < n_num + n_date:
+            start = np.datetime64("2015-01-01T00:00:00", "s").astype(np.int64)
+            secs = rng.integers(0, 10 * 365 * 86_400, n) + start
+            col = pd.to_datetime(secs, unit="s")
+            name = f"date_{i}"
+        else:
+            col = np.array(_texts(rng, n, spec), dtype=object)
+            name = f"text_{i}"
+        data[name] = _with_nulls(rng, col, spec.null_share)
+
+    return pd.DataFrame(data)
+
+
+def _texts(rng: np.random.Generator, count: int, spec: WorkbookSpec,
+           median: float | None = None) -> list[str]:
+    """`count` random strings, lognormal lengths, sliced from one pool."""
+    lengths = rng.lognormal(np.log(median or spec.text_len_median), spec.text_len_sigma, count)
+    lengths = np.clip(lengths.astype(np.int64), 1, spec.text_len_max)
+    pool = "".join(rng.choice(_ALPHABET, spec.text_len_max * 64))
+    starts = rng.integers(0, len(pool) - spec.text_len_max, count)
+    return [pool[s:s + ln].strip() or "x" for s, ln in zip(starts, lengths)]
+
+
+def _with_nulls(rng: np.random.Generator, col, share: float):
+    if share <= 0:
+        return col
+    s = pd.Series(col)
+    return s.mask(rng.random(len(s)) < share)
+
+
+# ── files ───────────────────────────────────────────────────────────
+def write_workbook(df: pd.DataFrame, path: Path | str, sheet: str = "Sheet1") -> Path:
+    """openpyxl write-only; much faster than DataFrame.to_excel for big sheets."""
+    from openpyxl import Workbook
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet)
+    ws.append([str(c) for c in df.columns])
+    cells = df.astype(object).where(df.notna(), None)
+    for row in cells.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def ensure_workbook(spec: WorkbookSpec, directory: Path | str) -> Path:
+    """Path of the spec's workbook in `directory`, generated on first use."""
+    path = Path(directory) / f"bench_{spec.slug}.xlsx"
+    if not path.exists():
+        write_workbook(generate_frame(spec), path)
+    return path
+
+
+def add_spec_arguments(ap: argparse.ArgumentParser) -> None:
+    defaults = WorkbookSpec()
+    for name, value in asdict(defaults).items():
+        ap.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+
+
+def spec_from_args(args: argparse.Namespace) -> WorkbookSpec:
+    return WorkbookSpec(**{k: getattr(args, k) for k in asdict(WorkbookSpec())})
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Write a synthetic benchmark workbook.")
+    ap.add_argument("target", type=Path)
+    add_spec_arguments(ap)
+    args = ap.parse_args()
+    print(write_workbook(generate_frame(spec_from_args(args)), args.target))
@@ -1,4 +1,13 @@
-from .main import main    # import your real entry
+import sys
+
+
+def main():
+    if len(sys.argv) > 1:                   # arguments → headless batch mode
+        from .cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    from .main import main as gui_main      # import your real entry
+    gui_main()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
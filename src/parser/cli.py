@@ -0,0 +1,161 @@
+# src/parser/cli.py
+"""
+Headless batch mode: load → card layout → join → date filter → export,
+for many workbooks at once on a process pool. No Qt widgets are imported.
+
+    parser data/*.xlsx --out-dir build/ --layout layout.json \\
+           --join Children --sep ";" --date-column Date \\
+           --date-from 2024-01-01 --date-to 2024-06-30 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# `comp` is imported absolutely, as in main.py; make that resolve under
+# `python -m parser` too (and in worker processes, which re-import this).
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="parser", description="Refine Excel workbooks headless.")
+    ap.add_argument("files", nargs="+", type=Path, help="workbooks to process")
+    ap.add_argument("--out-dir", type=Path, required=True, help="where refined files go")
+    ap.add_argument("--format", choices=("xlsx", "csv", "parquet"), default="xlsx")
+    ap.add_argument("--sheet", help="sheet to process (default: the first)")
+    ap.add_argument("--layout", type=Path,
+                    help="card layout saved by CardTableModel.to_json (derived cards included)")
+    ap.add_argument("--join", action="append", default=[], metavar="COLUMN",
+                    help="join children of COLUMN into extra rows (repeatable)")
+    ap.add_argument("--sep", default="\\n", help="child separator; \\n and \\t allowed (default \\n)")
+    ap.add_argument("--date-column", help="datetime column to filter on")
+    ap.add_argument("--date-from", help="first day kept (YYYY-MM-DD)")
+    ap.add_argument("--date-to", help="last day kept (YYYY-MM-DD)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="parallel worker processes (default: CPU count)")
+    ap.add_argument("--cache-dir", type=Path, help="parsed-workbook cache directory")
+    ap.add_argument("--compact", action="store_true",
+                    help="memory-compact dtypes after loading; prints per-column memory")
+    return ap
+
+
+# ── one workbook (runs in a worker process) ────────────────────────
+def process_file(path: Path, opts: dict) -> dict:
+    import pandas as pd
+    from comp.sheets.model import SheetsModel
+    from comp.sheets.helper_cache import WorkbookCache
+    from comp.sheets.helper_export import plan_export, export_plan
+
+    timings: dict[str, float] = {}
+    t0 = time.perf_counter()
+
+    def lap(stage: str) -> None:
+        nonlocal t0
+        now = time.perf_counter()
+        timings[stage] = now - t0
+        t0 = now
+
+    cache = WorkbookCache(opts["cache_dir"]) if opts["cache_dir"] else None
+    model = SheetsModel(path, sheet=opts["sheet"], cache=cache, compact=opts["compact"] or None)
+    rows_in = model.row_count
+    lap("load")
+
+    if opts["layout"]:
+        model.apply_layout(json.loads(Path(opts["layout"]).read_text(encoding="utf-8")))
+    if opts["join"]:
+        model.join_children(model.card_ids(opts["join"]), opts["sep"])
+    if opts["date_column"]:
+        index = model.rows.date_index(opts["date_column"])
+        start = pd.Timestamp(opts["date_from"]) if opts["date_from"] else index.min
+        end = (pd.Timestamp(opts["date_to"]) + pd.Timedelta(days=1) - pd.Timedelta(1, "ns")
+               if opts["date_to"] else index.max)
+        model.rows.set_filter(index.positions(start, end))
+    lap("process")
+
+    fmt = opts["format"]
+    target = Path(opts["out_dir"]) / f"{path.stem}_refined.{fmt}"
+    model.ensure_derived()                      # the layout's derived cards, for these rows
+    stats = export_plan(plan_export(model.rows, model.cardtable), target, fmt)
+    lap("export")
+
+    report = model.compact_report
+    return {"file": str(path), "target": str(target), "rows_in": rows_in,
+            "rows_out": stats.rows, "timings": timings,
+            "memory": report.table() if report is not None else None}
+
+
+_ESCAPES = {"\\n": "\n", "\\t": "\t", "\\\\": "\\"}
+
+
+def _unescape(sep: str) -> str:
+    """\\n, \\t and \\\\ as typed in a shell; anything else (e.g. "→") as is."""
+    return re.sub(r"\\[nt\\]", lambda m: _ESCAPES[m.group()], sep)
+
+
+# ── driver ──────────────────────────────────────────────────────────
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    opts = {
+        "out_dir": str(args.out_dir),
+        "format": args.format,
+        "sheet": args.sheet,
+        "layout": str(args.layout) if args.layout else None,
+        "join": args.join,
+        "sep": _unescape(args.sep),
+        "date_column": args.date_column,
+        "date_from": args.date_from,
+        "date_to": args.date_to,
+        "cache_dir": str(args.cache_dir) if args.cache_dir else None,
+        "compact": args.compact,
+    }
+
+    started = time.perf_counter()
+    results, failures = [], 0
+    workers = max(1, min(args.workers, len(args.files)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_file, f, opts): f for f in args.files}
+        for fut in as_completed(futures):
+            try:
+                res = fut.result()
+            except Exception as exc:
+                failures += 1
+                print(f"FAIL  {futures[fut]}: {type(exc).__name__}: {exc}", file=sys.stderr)
+                continue
+            results.append(res)
+            print(_line(res), flush=True)
+            if res["memory"]:
+                print(res["memory"], flush=True)
+
+    _summary(results, failures, workers, time.perf_counter() - started)
+    return 1 if failures else 0
+
+
+def _line(res: dict) -> str:
+    t = res["timings"]
+    total = sum(t.values())
+    rate = res["rows_in"] / total if total else 0.0
+    return (f"OK    {Path(res['file']).name:<32} {res['rows_in']:>9,} → {res['rows_out']:>9,} rows  "
+            f"load {t['load']:6.2f}s  process {t['process']:6.2f}s  export {t['export']:6.2f}s  "
+            f"{rate:>10,.0f} rows/s")
+
+
+def _summary(results: list[dict], failures: int, workers: int, wall: float) -> None:
+    rows = sum(r["rows_in"] for r in results)
+    busy = sum(sum(r["timings"].values()) for r in results)
+    print("-" * 72)
+    print(f"{len(results)} files ok, {failures} failed, {workers} workers, "
+          f"{rows:,} rows in {wall:.2f}s wall ({busy:.2f}s busy) → "
+          f"{rows / wall if wall else 0:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
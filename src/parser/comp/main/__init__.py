@@ -3,9 +3,9 @@ from .view import MainAppWindow
 from .controller import MainAppController
 
 class MainApp:
-    def __init__(self, excel_path):
+    def __init__(self, excel_path, cache_dir=None):
         self.view = MainAppWindow()
-        self.controller = MainAppController(self.view, excel_path)
+        self.controller = MainAppController(self.view, excel_path, cache_dir)
 
     def show(self):
         self.view.show()
\ No newline at end of file
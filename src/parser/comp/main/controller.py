@@ -1,22 +1,105 @@
 # src/parser/comp/main/controller.py
-from comp.user_form import UserFormWindow
-from comp.sheets import SheetsWindow    #   entry point into Sheets
+#   The user form and the sheets subsystem (pandas, openpyxl) are imported
+#   on first use, so the main window comes up without them
+#   (benchmarks/bench_startup.py keeps that under a time budget).
 
 class MainAppController:
-    def __init__(self, view, excel_path):
+    def __init__(self, view, excel_path, cache_dir=None):
         self.view = view
         self._connect_signals()
         self.excel_path = excel_path
+        self.cache_dir = cache_dir
+        self._cache = None
+        self._models = None
+        self.loader = None
+        self.sheets_windows = []                    # open Sheets windows
+
+    @property
+    def cache(self):
+        """WorkbookCache under cache_dir (None without one); made on first use."""
+        if self._cache is None and self.cache_dir:
+            from comp.sheets.helper_cache import WorkbookCache
+            self._cache = WorkbookCache(self.cache_dir)
+        return self._cache
+
+    @property
+    def models(self):
+        """Loaded SheetsModels, shared by windows on the same file (ref-counted)."""
+        if self._models is None:
+            from comp.sheets.helper_model_cache import SheetsModelCache
+            self._models = SheetsModelCache()
+        return self._models
 
     def _connect_signals(self):
         self.view.launch_user_form_btn.clicked.connect(self._show_user_form)
         self.view.launch_sheets_btn.clicked.connect(self._show_sheets_viewer)
+        self.view.cancel_load_btn.clicked.connect(self._cancel_load)
 
     def _show_user_form(self):
+        from comp.user_form import UserFormWindow
         self.user_form = UserFormWindow()
         self.user_form.show()
 
     def _show_sheets_viewer(self):
+        #   a workbook already in memory opens at once, with its card
+        #   order / visibility as left in the other windows; the window
+        #   gets its own sheet / join / row state (SheetsModel.share)
+        model = self.models.acquire(self.excel_path)
+        if model is not None:
+            self._open_sheets_window(model.share(), shared_from=model)
+            self.view.load_status.setText(
+                f"Opened {self.excel_path} from memory ({model.row_count:,} rows)")
+            return
+
+        #   loads in the background; Sheets MVC opens on the first chunk
+        #   and keeps filling in while the rest is parsed
+        from comp.sheets.controller_loader import SheetsLoader
+        self.loader = SheetsLoader(self.excel_path, cache=self.cache)
+        self.loader.modelReady.connect(self._on_model_ready)
+        self.loader.progress.connect(self._on_load_progress)
+        self.loader.finished.connect(lambda: self._end_load("Loaded"))
+        self.loader.canceled.connect(lambda: self._end_load("Loading cancelled", complete=False))
+        self.loader.failed.connect(
+            lambda msg: self._end_load(f"Load failed – {msg}", complete=False))
+
+        self.view.load_progress.setRange(0, 0)      # busy until first chunk
+        self.view.load_status.setText(f"Loading {self.excel_path} …")
+        self.view.set_loading(True)
+        self.loader.start()
+
+    def _on_model_ready(self, model):
+        self.models.add(self.excel_path, model)
+        self._open_sheets_window(model, self.loader)
+
+    def _open_sheets_window(self, model, loader=None, shared_from=None):
         #   calls up Sheets MVC
-        self.sheets_window = SheetsWindow(self.excel_path)
-        self.sheets_window.show()
\ No newline at end of file
+        from comp.sheets import SheetsWindow    #   entry point into Sheets
+        window = SheetsWindow(model, loader=loader)
+        cached = model if shared_from is None else shared_from
+        window.view.closed.connect(lambda: self._on_sheets_closed(window, cached))
+        self.sheets_windows.append(window)
+        window.show()
+
+    def _on_sheets_closed(self, window, cached):
+        self.sheets_windows.remove(window)
+        self.models.release(cached)
+
+    def _on_load_progress(self, rows: int, total: int):
+        self.view.load_progress.setRange(0, max(total, rows))
+        self.view.load_progress.setValue(rows)
+
+    def _cancel_load(self):
+        if self.loader is not None:
+            self.loader.cancel()
+
+    def _end_load(self, text: str, complete: bool = True):
+        self.view.set_loading(False)
+        loader, self.loader = self.loader, None
+        model = loader.model
+        if model is not None and not complete:
+            self.models.discard(model)              # partial: never reused
+        rows = model.row_count if model else 0
+        text = f"{text} ({rows:,} rows)"
+        if model is not None and model.compact_report is not None:
+            text += f" – {model.compact_report}"
+        self.view.load_status.setText(text)
@@ -1,5 +1,8 @@
 # src/parser/comp/main/view.py
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QPushButton
+from PySide6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QProgressBar, QLabel,
+)
 
 class MainAppWindow(QMainWindow):
     def __init__(self):
@@ -9,10 +12,29 @@ class MainAppWindow(QMainWindow):
         self.launch_user_form_btn = QPushButton("Open User Form")
         self.launch_sheets_btn = QPushButton("View Excel File")
 
+        # background-load feedback (hidden while idle)
+        self.load_progress = QProgressBar()
+        self.load_progress.setFormat("%v / %m rows")
+        self.cancel_load_btn = QPushButton("Cancel")
+        self.load_status = QLabel()
+
+        progress_row = QHBoxLayout()
+        progress_row.addWidget(self.load_progress, stretch=1)
+        progress_row.addWidget(self.cancel_load_btn)
+
         layout = QVBoxLayout()
         layout.addWidget(self.launch_user_form_btn)
         layout.addWidget(self.launch_sheets_btn)
+        layout.addLayout(progress_row)
+        layout.addWidget(self.load_status)
 
         central = QWidget()
         central.setLayout(layout)
         self.setCentralWidget(central)
+
+        self.set_loading(False)
+
+    def set_loading(self, active: bool) -> None:
+        self.load_progress.setVisible(active)
+        self.cancel_load_btn.setVisible(active)
+        self.launch_sheets_btn.setEnabled(not active)
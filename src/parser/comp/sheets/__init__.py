@@ -1,30 +1,12 @@
 # src/parser/comp/sheets/__init__.py
-from PySide6.QtWidgets import QApplication, QMainWindow
-
-from .model                 import SheetsModel     #  main Sheets Model
-from .widgets               import SheetsWidget
-from .view                  import SheetsView
-from .controller            import SheetsController   # main Sheets Controller
-
+#   SheetsWindow pulls in the Qt widget stack, so it is imported on first
+#   use; models and helpers stay importable headless (see parser.cli).
 
 __all__ = ["SheetsWindow"]
 
 
-class SheetsWindow:
-    """Top-level façade used by the application."""
-
-    def __init__(self, path_or_df):
-        # 1. model layer
-        self.model  = SheetsModel(path_or_df)
-
-        # 2. view layer
-        self.widget = SheetsWidget()
-        self.view   = SheetsView(self.widget)
-
-        # 3. controller layer (CardViewController internally
-        #    creates NavigationController & TableSizer)
-        self.controller = SheetsController(self.model, self.widget)
-
-    # delegate show ----------------------------------------------------
-    def show(self):
-        self.view.show()
\ No newline at end of file
+def __getattr__(name):
+    if name == "SheetsWindow":
+        from .window import SheetsWindow
+        return SheetsWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,29 @@
 # src/parser/comp/sheets/controller.py
 
 from __future__ import annotations
-from PySide6.QtCore    import Qt, QModelIndex
-from PySide6.QtWidgets import QAbstractItemView
+from PySide6.QtCore    import Qt, QModelIndex, QSignalBlocker
+from PySide6.QtGui     import QAction, QKeySequence
+from PySide6.QtWidgets import QAbstractItemView, QApplication, QInputDialog, QMessageBox
 from .helper_table_sizer import set_initial_sizing
+from .helper_row_heights import RowHeights
 from .model_api_table    import CardTableQtModel
+from .model_api_grid     import RowGridQtModel
 from .controller_nav     import NavigationController
+from .controller_prefetch import RowPrefetcher
+from .controller_loader  import SheetsLoader
+from .controller_date_filter import DateFilterController
+from .controller_duplicates import DuplicateController
+from .controller_export  import ExportController
+from .controller_search  import SearchController
+from .controller_profile import ProfileController
 from .helper_tri_state  import TriStateDelegate, TRI_FLAG
+from .helper_profiler   import span
 
 
 class SheetsController:
     COL_SELECT, COL_FIELD, COL_VALUE = range(3)
 
-    def __init__(self, model, widget):
+    def __init__(self, model, widget, loader=None):
         self.model  = model
         self.widget = widget
         self.view   = widget.table  # QTableView
@@ -35,8 +46,15 @@ class SheetsController:
         delegate = TriStateDelegate(self.view)
         self.view.setItemDelegateForColumn(self.COL_SELECT, delegate)
 
-        # 2) initial sizing
+        # 2) initial sizing; row heights from a measurement cache, refit
+        #    on navigation and whenever rows are added / moved / reset
         set_initial_sizing(self.widget, self.model)
+        self.row_heights = RowHeights(self.view)
+        for signal in (self.qt_model.modelReset, self.qt_model.layoutChanged,
+                       self.qt_model.rowsInserted, self.qt_model.rowsRemoved,
+                       self.qt_model.rowsMoved):
+            signal.connect(self._fit_rows)
+        self.view.horizontalHeader().sectionResized.connect(self._on_column_resized)
 
         # 3) navigation
         self.nav = NavigationController(
@@ -44,8 +62,39 @@ class SheetsController:
             self.widget.prev_btn,
             self.widget.next_btn
         )
+        self.nav.rowChanged.connect(self.qt_model.invalidate_row)
         self.nav.rowChanged.connect(self._on_row_changed)
         self._on_row_changed(self.model.rows.index)
+        self.widget.goto_edit.returnPressed.connect(self._go_to_row)
+
+        # 3a) read-ahead: previews of the neighbouring rows, off-thread
+        self.prefetcher = RowPrefetcher(self.model, self.qt_model, self.widget)
+        self.nav.rowChanged.connect(self.prefetcher.schedule)
+
+        # 3b) long values: the table shows previews; the full text is in
+        #     the tooltip, the detail pane (current cell) and Ctrl+C
+        self.view.selectionModel().currentRowChanged.connect(self._update_detail)
+        self.qt_model.modelReset.connect(self._update_detail)
+        copy = QAction("Copy value", self.view)
+        copy.setShortcut(QKeySequence.Copy)
+        copy.setShortcutContext(Qt.WidgetShortcut)
+        copy.triggered.connect(self._copy_values)
+        self.view.addAction(copy)
+        self.view.setContextMenuPolicy(Qt.ActionsContextMenu)
+
+        # 3c) column profiles: computed off-thread when a Field tooltip
+        #     is first shown (or for all cards), cached with the workbook
+        self.profiler = ProfileController(self.model, self.widget)
+        self.qt_model.profileWanted.connect(self.profiler.request)
+        profile_all = QAction("Profile all columns", self.view)
+        profile_all.triggered.connect(self.profiler.profile_all)
+        self.view.addAction(profile_all)
+
+        # 3d) derived fields: expressions over other cards, appended as
+        #     cards and computed a whole column at a time when first shown
+        derived = QAction("Add derived field…", self.view)
+        derived.triggered.connect(self._add_derived)
+        self.view.addAction(derived)
 
         # 4) show/hide toggle
         self.widget.toggle_show_btn.clicked.connect(self._toggle_show_mode)
@@ -54,6 +103,53 @@ class SheetsController:
         self.view.setColumnHidden(self.COL_SELECT, True)
         self.widget.toggle_show_btn.setText("Show")
 
+        # 4b) pre-processors: join children, date-range filter
+        self.widget.join_btn.clicked.connect(self._toggle_join)
+        self.date_filter = DateFilterController(self.model, self.widget)
+        self.date_filter.filterChanged.connect(self.nav.refresh)
+
+        # 4a') grid view: all rows as in a spreadsheet, paged in lazily;
+        #      its current row and the card view's record stay in step
+        self.grid_model = RowGridQtModel(self.model)
+        self.widget.grid.setModel(self.grid_model)
+        self.widget.view_mode_btn.clicked.connect(self._toggle_grid)
+        self.widget.grid.selectionModel().currentRowChanged.connect(self._on_grid_row)
+        self.nav.rowChanged.connect(self._sync_grid)
+        self.date_filter.filterChanged.connect(self.grid_model.reset_rows)
+        self.grid_model.modelReset.connect(self._sync_grid)
+
+        # 4b') search box: background inverted index, jump to hits
+        self.search = SearchController(self.model, self.widget)
+        self.search.jumped.connect(self.nav.refresh)
+        self.nav.rowChanged.connect(self.search.on_row_changed)
+        self.date_filter.filterChanged.connect(self.search.refresh)
+
+        # 4b''') duplicates: row-hash groups, navigation through one group
+        self.duplicates = DuplicateController(self.model, self.widget)
+        for slot in (self.nav.refresh, self.grid_model.reset_rows, self.search.refresh):
+            self.duplicates.filterChanged.connect(slot)
+        self.date_filter.filterChanged.connect(self.duplicates.reset)
+
+        # 4c) export of the refined workbook (kept cards, current rows)
+        self.exporter = ExportController(self.model, self.widget)
+
+        # 4d) sheet selector: other sheets are parsed on first selection
+        names = self.model.sheet_names
+        self.widget.sheet_combo.addItems(names)
+        if self.model.sheet_name in names:
+            self.widget.sheet_combo.setCurrentIndex(names.index(self.model.sheet_name))
+        for w in (self.widget.sheet_label, self.widget.sheet_combo):
+            w.setVisible(len(names) > 1)
+        self.widget.sheet_combo.currentTextChanged.connect(self._select_sheet)
+
+        # 5) streamed workbook: the remaining rows arrive in the background,
+        #    either through the caller's loader or one started here
+        self.loader = None
+        if loader is not None:
+            self._watch_loader(loader)
+        elif self.model.loading:
+            self._start_loader()
+
     def _setup_drag_drop(self) -> None:
         """
         Turn on internal‐move drag & drop for the table view.
@@ -76,9 +172,209 @@ class SheetsController:
         # 4) force a full layout pass so the checkboxes appear/disappear
         self.qt_model.layoutChanged.emit()
 
+    # separators offered by the join dialog
+    JOIN_SEPARATORS = {"new line": "\n", ";": ";", ",": ",", "|": "|"}
+
+    def _toggle_join(self):
+        """Join children of one column into extra rows, or undo the join."""
+        if self.model.joined:
+            self.model.clear_join()
+            self._set_rows()
+            return
+        if self.model.loading:
+            QMessageBox.information(self.widget, "Join children",
+                                    "Wait until the workbook has finished loading.")
+            return
+
+        cards = list(self.model.cardtable.ordered_cards())
+        titles = [c.title for c in cards]
+        title, ok = QInputDialog.getItem(
+            self.widget, "Join children", "Column holding the children:", titles, 0, False)
+        if not ok:
+            return
+        column = cards[titles.index(title)].id      # by id: numeric / date headers too
+        sep, ok = QInputDialog.getItem(
+            self.widget, "Join children", "Children separated by:",
+            list(self.JOIN_SEPARATORS), 0, False)
+        if not ok:
+            return
+
+        try:
+            result = self.model.join_children([column], self.JOIN_SEPARATORS[sep])
+        except (ValueError, RuntimeError) as exc:
+            QMessageBox.warning(self.widget, "Join children", str(exc))
+            return
+        self._set_rows()
+        QMessageBox.information(self.widget, "Join children", str(result))
+
+    DERIVED_HINT = ("Expression over other fields (titles with spaces in `backticks`), e.g.\n"
+                    "  `Amount` * 1.2\n"
+                    "  `First name` + ' ' + `Last name`\n"
+                    "  `Order date`.dt.year\n"
+                    "  where(`Qty` > 0, `Amount` / `Qty`, 0)")
+
+    def _add_derived(self):
+        """Ask for a title and an expression; the new card is appended last."""
+        if self.model.loading:
+            QMessageBox.information(self.widget, "Derived field",
+                                    "Wait until the workbook has finished loading.")
+            return
+        title, ok = QInputDialog.getText(self.widget, "Derived field", "Title:")
+        if not ok or not title.strip():
+            return
+        expression, ok = QInputDialog.getText(self.widget, "Derived field", self.DERIVED_HINT)
+        if not ok or not expression.strip():
+            return
+        try:
+            self.model.add_derived(title, expression)
+        except (ValueError, RuntimeError) as exc:     # ExpressionError is a ValueError
+            QMessageBox.warning(self.widget, "Derived field", str(exc))
+
+    def _set_rows(self):
+        """Point navigation and the Qt model at the model's current RowModel."""
+        self.widget.join_btn.setText("Undo join" if self.model.joined else "Join children…")
+        self.duplicates.reset()
+        self.grid_model.reset_rows()
+        self.nav.set_rows(self.model.rows)
+        self.date_filter.rebind()
+        self.search.rebind()
+
+    def _select_sheet(self, name: str) -> None:
+        """Switch to another sheet; it streams in like the first one did."""
+        if not name or name == self.model.sheet_name:
+            return
+        try:
+            self.model.select_sheet(name)
+        except (KeyError, RuntimeError, ValueError, OSError) as exc:
+            QMessageBox.warning(self.widget, "Select sheet", str(exc))
+            with QSignalBlocker(self.widget.sheet_combo):
+                self.widget.sheet_combo.setCurrentText(self.model.sheet_name)
+            return
+        self.qt_model.rebind()
+        self.grid_model.rebind()
+        set_initial_sizing(self.widget, self.model)
+        self._set_rows()
+        if self.model.loading:
+            self._start_loader()
+
+    def _start_loader(self) -> None:
+        loader = SheetsLoader(self.model)
+        self._watch_loader(loader)
+        loader.start()
+
+    def _watch_loader(self, loader, on: bool = True) -> None:
+        if on:
+            self.loader = loader
+            self.widget.sheet_combo.setEnabled(False)   # one stream at a time
+        for signal, slot in ((loader.progress, self._update_row_label),
+                             (loader.progress, self.grid_model.grow),
+                             (loader.finished, self._on_loaded),
+                             (loader.canceled, self._on_loaded),
+                             (loader.failed, self._on_loaded)):
+            if on:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
+
+    def close(self) -> None:
+        """
+        The window closed: stop its background work and let go of the
+        model's signals – the SheetsModel may be shared with other windows
+        and kept for reuse; a stream in progress carries on without us.
+        """
+        for worker in (self.search, self.profiler, self.prefetcher, self.exporter):
+            worker.cancel()
+        if self.loader is not None:
+            self._watch_loader(self.loader, on=False)
+            self.loader = None
+        self.qt_model.release()
+        self.grid_model.release()
+
+    def _on_loaded(self, *_):
+        self.widget.sheet_combo.setEnabled(True)
+        self.date_filter.rebind()
+        self.search.rebind()
+        self._update_row_label()
+        self.prefetcher.schedule()
+
+    def _toggle_grid(self) -> None:
+        """Switch between the record (Field / Value) and the grid view."""
+        grid = self.widget.grid.isHidden()
+        self.widget.grid.setVisible(grid)
+        self.view.setVisible(not grid)
+        self.widget.toggle_show_btn.setEnabled(not grid)
+        self.widget.view_mode_btn.setText("Card view" if grid else "Grid view")
+        if grid:
+            self.widget.value_detail.setVisible(False)
+            self._sync_grid()
+        else:
+            self._update_detail()
+
+    def _sync_grid(self, *_) -> None:
+        """Select and show the current record in the grid."""
+        grid = self.widget.grid
+        rows = self.model.rows
+        if grid.isHidden() or not rows.row_count:
+            return
+        self.grid_model.ensure_loaded(rows.index)
+        column = max(grid.currentIndex().column(), 0)
+        index = self.grid_model.index(rows.index, column)
+        if grid.currentIndex().row() != rows.index:
+            grid.setCurrentIndex(index)
+        grid.scrollTo(index)
+
+    def _on_grid_row(self, current: QModelIndex, _previous=None) -> None:
+        if current.isValid() and current.row() != self.model.rows.index:
+            self.nav.go_to(current.row())
+
+    def _go_to_row(self) -> None:
+        text = self.widget.goto_edit.text()
+        if text:
+            self.nav.go_to(int(text) - 1)           # row numbers as shown: 1-based
+
     def _on_row_changed(self, idx: int) -> None:
         """Refresh the 'Value' column and row heights when the current row changes."""
         top    = self.qt_model.index(0, self.COL_VALUE)
         bottom = self.qt_model.index(self.qt_model.rowCount() - 1, self.COL_VALUE)
         self.qt_model.dataChanged.emit(top, bottom, [Qt.DisplayRole])
-        self.view.resizeRowsToContents()
+        self._fit_rows()
+        self._update_row_label()
+        self._update_detail()
+
+    def _update_detail(self, *_) -> None:
+        """Show the full value of the current table row when it is truncated."""
+        row = self.view.currentIndex().row()
+        pane = self.widget.value_detail
+        if row < 0 or self.view.isHidden() or not self.qt_model.is_truncated(row):
+            pane.setVisible(False)
+            return
+        text = self.qt_model.full_text(row)
+        if pane.toPlainText() != text:
+            pane.setPlainText(text)
+        pane.setVisible(True)
+
+    def _copy_values(self) -> None:
+        """Ctrl+C: full values of the selected rows, one per line."""
+        rows = sorted({ix.row() for ix in self.view.selectionModel().selectedIndexes()})
+        if not rows and self.view.currentIndex().isValid():
+            rows = [self.view.currentIndex().row()]
+        texts = [t for t in map(self.qt_model.full_text, rows) if t is not None]
+        if texts:
+            QApplication.clipboard().setText("\n".join(texts))
+
+    def _fit_rows(self, *_) -> None:
+        with span("row_heights"):
+            self.row_heights.apply()
+
+    def _on_column_resized(self, *_) -> None:
+        if self.view.wordWrap():            # heights only depend on width when wrapping
+            self._fit_rows()
+
+    def _update_row_label(self, *_) -> None:
+        rows = self.model.rows
+        text = f"Row {rows.index + 1:,} / {rows.row_count:,}"
+        if rows.filtered:
+            text += f" (filtered from {rows.total_count:,})"
+        if self.model.loading:
+            text += " (loading…)"
+        self.widget.row_label.setText(text)
@@ -0,0 +1,107 @@
+# src/parser/comp/sheets/controller_date_filter.py
+from __future__ import annotations
+
+import pandas as pd
+from PySide6.QtCore import QObject, QDate, QSignalBlocker, Signal
+
+
+class DateFilterController(QObject):
+    """
+    Pre-processor "pick records from specific dates": narrows navigation
+    to a DateIndex range; emits filterChanged.
+    """
+
+    filterChanged: Signal = Signal()
+
+    def __init__(self, sheets_model, widget) -> None:
+        super().__init__(widget)
+        self.model = sheets_model
+        self.w = widget
+
+        self.w.date_col.currentIndexChanged.connect(self._on_column_changed)
+        self.w.date_from.dateChanged.connect(self._on_range_changed)
+        self.w.date_to.dateChanged.connect(self._on_range_changed)
+        self.w.date_filter_chk.toggled.connect(self._apply)
+
+        self.rebind()
+
+    # ── public ──────────────────────────────────────────────────────
+    def rebind(self) -> None:
+        """Re-read datetime columns, e.g. after rows were swapped or loaded."""
+        rows = self.model.rows
+        columns = rows.datetime_columns()
+        current = self.w.date_col.currentData()
+
+        with QSignalBlocker(self.w.date_col):
+            self.w.date_col.clear()
+            for col in columns:
+                self.w.date_col.addItem(str(col), col)
+            if current in columns:
+                self.w.date_col.setCurrentIndex(columns.index(current))
+
+        self.w.date_bar.setVisible(bool(columns))
+        if columns:
+            self._on_column_changed(keep_range=current in columns)
+        elif rows.filtered:
+            self._apply(False)
+
+    # ── slots ───────────────────────────────────────────────────────
+    def _on_column_changed(self, *_, keep_range: bool = False) -> None:
+        index = self._index()
+        if index is None or not len(index):
+            self.w.date_count.setText("no dates")
+            return
+        lo, hi = _qdate(index.min), _qdate(index.max)
+        with QSignalBlocker(self.w.date_from), QSignalBlocker(self.w.date_to):
+            for edit in (self.w.date_from, self.w.date_to):
+                edit.setDateRange(lo, hi)
+            if not keep_range:
+                self.w.date_from.setDate(lo)
+                self.w.date_to.setDate(hi)
+        self._on_range_changed()
+
+    def _on_range_changed(self, *_) -> None:
+        index = self._index()
+        if index is None:
+            return
+        start, end = self._range()
+        self.w.date_count.setText(
+            f"{index.count(start, end):,} rows in range "
+            f"({index.min:%Y-%m-%d} – {index.max:%Y-%m-%d})"
+        )
+        if self.w.date_filter_chk.isChecked():
+            self._apply(True)
+
+    def _apply(self, enabled: bool) -> None:
+        rows = self.model.rows
+        index = self._index()
+        if enabled and index is not None:
+            positions = index.positions(*self._range())
+            if not len(positions):
+                self.w.date_count.setText("no rows in range – filter off")
+                with QSignalBlocker(self.w.date_filter_chk):
+                    self.w.date_filter_chk.setChecked(False)
+                positions = None
+            rows.set_filter(positions)
+        else:
+            with QSignalBlocker(self.w.date_filter_chk):
+                self.w.date_filter_chk.setChecked(False)
+            rows.set_filter(None)
+        self.filterChanged.emit()
+
+    # ── helpers ─────────────────────────────────────────────────────
+    def _index(self):
+        col = self.w.date_col.currentData()
+        if col is None:
+            return None
+        return self.model.rows.date_index(col)
+
+    def _range(self) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """Inclusive [from 00:00, to 23:59:59.999999999]."""
+        start = pd.Timestamp(self.w.date_from.date().toPython())
+        end = pd.Timestamp(self.w.date_to.date().toPython())
+        return start, end + pd.Timedelta(days=1) - pd.Timedelta(1, "ns")
+
+
+def _qdate(ts: pd.Timestamp) -> QDate:
+    return QDate(ts.year, ts.month, ts.day)
@@ -0,0 +1,122 @@
+# src/parser/comp/sheets/controller_duplicates.py
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QApplication, QInputDialog, QMessageBox
+
+ALL_FIELDS, VISIBLE_FIELDS = "All fields", "Visible fields"
+MATCHES = {"Exact": False, "Ignore case and spacing": True}
+
+
+class DuplicateController(QObject):
+    """
+    Pre-processor "records which occur more than once": browses the
+    groups of a DuplicateIndex; emits filterChanged.
+    """
+
+    filterChanged: Signal = Signal()
+
+    def __init__(self, sheets_model, widget) -> None:
+        super().__init__(widget)
+        self.model = sheets_model
+        self.w = widget
+        self._index = None                  # DuplicateIndex being browsed
+        self._rows = None                   # … of this RowModel
+        self._base = None                   # its filter before browsing
+        self._group: int | None = None      # None: all duplicated rows
+
+        self.w.dup_btn.clicked.connect(self.find)
+        self.w.dup_prev_btn.clicked.connect(lambda: self._step(-1))
+        self.w.dup_next_btn.clicked.connect(lambda: self._step(+1))
+        self.w.dup_all_btn.clicked.connect(self._show_all)
+        self.w.dup_clear_btn.clicked.connect(self.clear)
+        self.w.dup_bar.setVisible(False)
+
+    # ── public ──────────────────────────────────────────────────────
+    def find(self) -> None:
+        if self.model.loading:
+            QMessageBox.information(self.w, "Duplicates",
+                                    "Wait until the workbook has finished loading.")
+            return
+        cards = self.model.cardtable.ordered_cards()
+        choices = [ALL_FIELDS, VISIBLE_FIELDS, *(c.title for c in cards)]
+        fields, ok = QInputDialog.getItem(
+            self.w, "Duplicates", "Rows are duplicates when these are equal:", choices, 0, False)
+        if not ok:
+            return
+        match, ok = QInputDialog.getItem(
+            self.w, "Duplicates", "Compare text:", list(MATCHES), 0, False)
+        if not ok:
+            return
+        if fields == ALL_FIELDS:
+            columns = None
+        elif fields == VISIBLE_FIELDS:
+            columns = [c.id for c in cards if c.show and not c.disabled]
+        else:
+            columns = [cards[choices.index(fields) - 2].id]
+        if columns == []:
+            QMessageBox.information(self.w, "Duplicates", "No visible fields to compare.")
+            return
+
+        self.clear()                        # search the view, not a group
+        if columns is not None:             # all fields: derived ones add nothing
+            self.model.ensure_derived(c for c in cards if c.id in columns)
+        rows = self.model.rows
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            index = rows.duplicate_index(columns, normalize=MATCHES[match])
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not len(index):
+            QMessageBox.information(self.w, "Duplicates", str(index))
+            return
+
+        self._index, self._rows = index, rows
+        self._base = rows.view_positions() if rows.filtered else None
+        self.w.dup_label.setText(f"Duplicates ({fields.lower()}): {index}")
+        self.w.dup_bar.setVisible(True)
+        group = index.group_of(rows.position) if rows.row_count else None
+        self._show_group(0 if group is None else group)
+
+    def clear(self) -> None:
+        """Leave the duplicates and restore the view they were found in."""
+        if self._index is None:
+            return
+        rows, base = self._rows, self._base
+        self.reset()
+        if rows is self.model.rows:
+            rows.set_filter(base)
+            self.filterChanged.emit()
+
+    def reset(self, *_) -> None:
+        """Forget the groups (rows swapped or filtered elsewhere)."""
+        self._index = self._rows = self._base = self._group = None
+        self.w.dup_bar.setVisible(False)
+
+    # ── browsing ────────────────────────────────────────────────────
+    def _step(self, delta: int) -> None:
+        if self._index is None:
+            return
+        g = -1 if self._group is None and delta > 0 else self._group or 0
+        self._show_group((g + delta) % len(self._index))
+
+    def _show_group(self, g: int) -> None:
+        self._group = g
+        positions = self._index.group(g)
+        self.w.dup_group_label.setText(
+            f"group {g + 1:,} / {len(self._index):,} · {len(positions):,} rows")
+        self._apply(positions)
+
+    def _show_all(self) -> None:
+        if self._index is None:
+            return
+        self._group = None
+        self.w.dup_group_label.setText(f"all {self._index.duplicated_rows:,} rows")
+        self._apply(self._index.positions())
+
+    def _apply(self, positions) -> None:
+        if self._rows is not self.model.rows:       # rows swapped meanwhile
+            self.reset()
+            return
+        self._rows.set_filter(positions)
+        self.filterChanged.emit()
@@ -0,0 +1,111 @@
+# src/parser/comp/sheets/controller_export.py
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+
+from .helper_export import ExportCancelled, export_plan, plan_export
+from .helper_task import Task, TaskSet, TaskSignals
+
+FILE_FILTERS = "Excel workbook (*.xlsx);;CSV (*.csv);;Parquet (*.parquet)"
+_FILTER_SUFFIX = re.compile(r"\(\*(\.\w+)\)")          # "CSV (*.csv)" → ".csv"
+
+
+class _ExportSignals(TaskSignals):
+    progress: Signal = Signal(int, int, float)
+    finished: Signal = Signal(str)
+    canceled: Signal = Signal(str)
+
+
+class _ExportTask(Task):
+    """Writes an ExportPlan."""
+
+    Signals = _ExportSignals
+
+    def __init__(self, plan, target) -> None:
+        super().__init__()
+        self._plan = plan
+        self._target = target
+
+    def work(self) -> None:
+        try:
+            stats = export_plan(self._plan, self._target,
+                                progress=self.signals.progress.emit,
+                                cancelled=self.cancel_event.is_set)
+        except ExportCancelled as exc:
+            self.signals.canceled.emit(str(exc))
+        else:
+            self.signals.finished.emit(str(stats))
+
+
+class ExportController(QObject):
+    """Export button: writes the refined workbook (xlsx / csv / parquet) in the background."""
+
+    def __init__(self, sheets_model, widget) -> None:
+        super().__init__(widget)
+        self.model = sheets_model
+        self.widget = widget
+        self._task: _ExportTask | None = None
+        self._tasks = TaskSet()
+        self._dialog: QProgressDialog | None = None
+        widget.export_btn.clicked.connect(self.export)
+
+    def export(self) -> None:
+        if self.model.loading:
+            QMessageBox.information(self.widget, "Export",
+                                    "Wait until the workbook has finished loading.")
+            return
+        target, selected = QFileDialog.getSaveFileName(
+            self.widget, "Export refined workbook", "", FILE_FILTERS)
+        if not target:
+            return
+        if not Path(target).suffix and (m := _FILTER_SUFFIX.search(selected)):
+            target += m.group(1)                    # "report" + CSV filter → report.csv
+
+        kept = [c for c in self.model.cardtable.cards if c.show and not c.disabled]
+        self.model.ensure_derived(kept)             # derived cards: computed now
+        plan = plan_export(self.model.rows, self.model.cardtable)
+        self._task = _ExportTask(plan, target)
+        sig = self._task.signals
+        sig.progress.connect(self._on_progress)
+        sig.finished.connect(lambda msg: self._done("Export finished", msg))
+        sig.canceled.connect(lambda msg: self._done("Export cancelled", msg))
+        sig.failed.connect(lambda msg: self._done("Export failed", msg))
+
+        self._dialog = QProgressDialog("Exporting…", "Cancel", 0, len(plan.positions), self.widget)
+        self._dialog.setWindowModality(Qt.WindowModal)
+        self._dialog.setMinimumDuration(300)
+        self._dialog.canceled.connect(self._task.cancel)
+        self.widget.export_btn.setEnabled(False)
+        self._tasks.start(self._task)
+
+    def cancel(self) -> None:
+        """Stop a running export; nothing is shown when it ends (the window is gone)."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        for signal in (task.signals.progress, task.signals.finished,
+                       task.signals.canceled, task.signals.failed):
+            signal.disconnect()
+        if self._dialog is not None:
+            self._dialog.close()
+            self._dialog = None
+
+    # -------------------------------------------------------------------
+    def _on_progress(self, done: int, total: int, rate: float) -> None:
+        if self._dialog is not None:
+            self._dialog.setValue(done)
+            self._dialog.setLabelText(f"Exporting… {done:,} / {total:,} rows ({rate:,.0f} rows/s)")
+
+    def _done(self, title: str, message: str) -> None:
+        self._task = None
+        if self._dialog is not None:
+            self._dialog.canceled.disconnect()
+            self._dialog.close()
+            self._dialog = None
+        self.widget.export_btn.setEnabled(True)
+        QMessageBox.information(self.widget, title, message)
@@ -0,0 +1,146 @@
+# src/parser/comp/sheets/controller_loader.py
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QThreadPool, QCoreApplication, Signal
+
+from .model import SheetsModel
+from .helper_stream_reader import CHUNK_ROWS
+from .helper_task import Task, TaskSignals
+
+
+class _LoadSignals(TaskSignals):
+    modelReady: Signal = Signal(object)
+    chunkReady: Signal = Signal(object)
+    finished: Signal = Signal()
+    canceled: Signal = Signal()
+
+
+class _LoadTask(Task):
+    """Opens the workbook unless given a model, then reads its chunks (GUI thread appends)."""
+
+    Signals = _LoadSignals
+
+    def __init__(self, source, cache, chunk_rows: int, compact: bool | None) -> None:
+        super().__init__()
+        self._source = source
+        self._cache = cache
+        self._chunk_rows = chunk_rows
+        self._compact = compact
+        self._gui_thread = QCoreApplication.instance().thread()
+
+    def work(self) -> None:
+        model = self._source
+        if not isinstance(model, SheetsModel):
+            model = SheetsModel(self._source, stream=True,
+                                chunk_rows=self._chunk_rows, cache=self._cache,
+                                compact=self._compact)
+            model.cardtable.moveToThread(self._gui_thread)
+            if self.cancelled:
+                model.stop_loading()
+                self.signals.canceled.emit()
+                return
+            self.signals.modelReady.emit(model)
+
+        chunks = model.pending_chunks()
+        try:
+            for df in chunks:
+                if self.cancelled:
+                    self.signals.canceled.emit()
+                    return
+                self.signals.chunkReady.emit(df)
+        finally:
+            chunks.close()                     # releases the workbook
+        self.signals.finished.emit()
+
+
+class _FinishTask(Task):
+    """Runs SheetsModel.finish_loading's job (compaction, cache write)."""
+
+    def __init__(self, job) -> None:
+        super().__init__()
+        self.swap = None                        # for the GUI thread; None on an error
+        self._job = job
+
+    def work(self) -> None:
+        self.swap = self._job()
+
+
+class SheetsLoader(QObject):
+    """
+    Loads a SheetsModel (path or streamed model) in the background;
+    emits progress(rows, total), then finished, canceled or failed.
+    """
+
+    modelReady: Signal = Signal(object)
+    progress: Signal = Signal(int, int)
+    finished: Signal = Signal()
+    canceled: Signal = Signal()
+    failed: Signal = Signal(str)
+
+    def __init__(self, source, *, cache=None, chunk_rows: int = CHUNK_ROWS,
+                 compact: bool | None = None) -> None:
+        super().__init__()
+        self.model: SheetsModel | None = source if isinstance(source, SheetsModel) else None
+        self._running = False
+
+        self._finish: _FinishTask | None = None
+        self._task = _LoadTask(source, cache, chunk_rows, compact)
+        sig = self._task.signals
+        sig.modelReady.connect(self._on_model_ready)
+        sig.chunkReady.connect(self._on_chunk)
+        sig.finished.connect(self._on_finished)
+        sig.canceled.connect(self._on_canceled)
+        sig.failed.connect(self._on_failed)
+
+        QCoreApplication.instance().aboutToQuit.connect(self.cancel)
+
+    # ── control ─────────────────────────────────────────────────────
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._running = True
+        QThreadPool.globalInstance().start(self._task)
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+    # -------------------------------------------------------------------
+    def _on_model_ready(self, model) -> None:
+        self.model = model
+        self.modelReady.emit(model)
+        self._emit_progress()
+
+    def _on_chunk(self, df) -> None:
+        self.model.append_chunk(df)
+        self._emit_progress()
+
+    def _on_finished(self) -> None:
+        job = self.model.finish_loading(defer=True)
+        self._emit_progress()
+        self._finish = _FinishTask(job)
+        self._finish.signals.done.connect(self._on_finish_done)
+        QThreadPool.globalInstance().start(self._finish)
+
+    def _on_finish_done(self, task: _FinishTask) -> None:
+        self._finish = None
+        self._running = False
+        if task.swap is not None:                   # else the rows stay as loaded
+            task.swap()
+        self.finished.emit()
+
+    def _on_canceled(self) -> None:
+        self._running = False
+        if self.model is not None:
+            self.model.stop_loading()
+        self.canceled.emit()
+
+    def _on_failed(self, message: str) -> None:
+        self._running = False
+        if self.model is not None:
+            self.model.stop_loading()
+        self.failed.emit(message)
+
+    def _emit_progress(self) -> None:
+        self.progress.emit(self.model.row_count, self.model.rows_total)
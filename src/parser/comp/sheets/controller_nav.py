@@ -1,11 +1,15 @@
 # src/parser/comp/sheets/controller_nav.py
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .helper_profiler import profiled
+
+COALESCE_MS = 40        # at most one rowChanged per this many ms while stepping
 
 
 class NavigationController(QObject):
     """
-    Handles prev/next buttons with wrap-around,
-    emits rowChanged(idx).
+    Handles prev/next buttons with wrap-around and go_to(index),
+    emits rowChanged(idx) – at most every COALESCE_MS while stepping.
     """
 
     rowChanged: Signal = Signal(int)
@@ -13,14 +17,57 @@ class NavigationController(QObject):
     def __init__(self, row_model, prev_btn, next_btn):
         super().__init__()
         self._rows = row_model
+        self._pending = False
+        self._throttle = QTimer(self)
+        self._throttle.setSingleShot(True)
+        self._throttle.setInterval(COALESCE_MS)
+        self._throttle.timeout.connect(self._on_throttle)
         prev_btn.clicked.connect(self._prev)
         next_btn.clicked.connect(self._next)
 
+    def set_rows(self, row_model) -> None:
+        """Navigate another RowModel (e.g. a pre-processed view)."""
+        self._rows = row_model
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-announce the current row (after the rows or their filter changed)."""
+        self._pending = False
+        self.rowChanged.emit(self._rows.index)
+
+    def go_to(self, index: int) -> None:
+        """Jump to row `index` of the current view (clamped), repaint at once."""
+        if not self._rows.row_count:
+            return
+        self._rows.index = min(max(index, 0), self._rows.row_count - 1)
+        self.refresh()
+
+    def flush(self) -> None:
+        """Emit a step still held back by the throttle now."""
+        if self._pending:
+            self._throttle.stop()
+            self.refresh()
+
     # -------------------------------------------------------------------
+    @profiled("navigation")
     def _prev(self):
-        self._rows.index = (self._rows.index - 1) % self._rows.row_count
-        self.rowChanged.emit(self._rows.index)
+        self._step(-1)
 
+    @profiled("navigation")
     def _next(self):
-        self._rows.index = (self._rows.index + 1) % self._rows.row_count
-        self.rowChanged.emit(self._rows.index)
\ No newline at end of file
+        self._step(+1)
+
+    def _step(self, delta: int) -> None:
+        if not self._rows.row_count:
+            return
+        self._rows.index = (self._rows.index + delta) % self._rows.row_count
+        if self._throttle.isActive():
+            self._pending = True            # burst: repaint when the interval ends
+            return
+        self.rowChanged.emit(self._rows.index)
+        self._throttle.start()
+
+    def _on_throttle(self) -> None:
+        if self._pending:
+            self.refresh()
+            self._throttle.start()          # still stepping: keep the rate bounded
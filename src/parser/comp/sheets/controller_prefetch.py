@@ -0,0 +1,85 @@
+# src/parser/comp/sheets/controller_prefetch.py
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+from PySide6.QtWidgets import QApplication
+
+from .helper_preview import make_preview
+from .helper_task import Task, TaskSet, TaskSignals
+from .model_api_table import PREVIEW_CACHE
+
+PREFETCH_ROWS = 8       # rows formatted ahead and behind the current one
+
+
+class _PrefetchSignals(TaskSignals):
+    row: Signal = Signal(object, int, object)   # (task, position, [Preview])
+
+
+class _PrefetchTask(Task):
+    """Formats the previews of some rows of a DataFrame snapshot."""
+
+    Signals = _PrefetchSignals
+
+    def __init__(self, rows, positions: list[int]) -> None:
+        super().__init__()
+        self.rows = rows
+        self.version = rows.version             # derived columns filled in since: stale
+        self._df = rows._df
+        self._positions = positions
+
+    def work(self) -> None:
+        for pos in self._positions:
+            if self.cancelled:
+                return
+            values = list(self._df.iloc[pos])              # as RowModel.values_at
+            self.signals.row.emit(self, pos, [make_preview(v) for v in values])
+
+
+class RowPrefetcher(QObject):
+    """
+    Formats the previews of the rows around the current one on a
+    one-thread pool, for the Qt model's preview cache.
+    """
+
+    def __init__(self, sheets_model, qt_model, parent=None,
+                 rows_each_way: int = PREFETCH_ROWS) -> None:
+        super().__init__(parent)
+        self.model = sheets_model
+        self.qt_model = qt_model
+        self.rows_each_way = rows_each_way
+        self._task: _PrefetchTask | None = None
+        self._tasks = TaskSet()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        QApplication.instance().aboutToQuit.connect(self.cancel)
+
+    def schedule(self, *_) -> None:
+        self.cancel()
+        if self.model.loading:                      # frame still growing
+            return
+        rows = self.model.rows
+        count = rows.row_count
+        if count < 2:
+            return
+        cards = max(1, rows._df.shape[1])
+        each_way = min(self.rows_each_way, PREVIEW_CACHE // (4 * cards), (count - 1) // 2 + 1)
+        wanted = []
+        for k in range(1, each_way + 1):
+            for i in (rows.index + k, rows.index - k):
+                pos = rows.position_of(i % count)
+                if pos not in wanted and not self.qt_model.has_previews(pos):
+                    wanted.append(pos)
+        if not wanted:
+            return
+        self._task = _PrefetchTask(rows, wanted)
+        self._task.signals.row.connect(self._on_row)
+        self._tasks.start(self._task, self._pool)
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _on_row(self, task: _PrefetchTask, position: int, previews: list) -> None:
+        if task.version == task.rows.version:
+            self.qt_model.store_previews(task.rows, position, previews)
@@ -0,0 +1,86 @@
+# src/parser/comp/sheets/controller_profile.py
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+from PySide6.QtWidgets import QApplication
+
+from .helper_column_profile import profile_column
+from .helper_task import Task, TaskSet, TaskSignals
+
+
+class _ProfileSignals(TaskSignals):
+    ready: Signal = Signal(object, int, object)    # (CardTableModel, card id, ColumnProfile)
+
+
+class _ProfileTask(Task):
+    """Profiles one column of a DataFrame snapshot."""
+
+    Signals = _ProfileSignals
+
+    def __init__(self, cardtable, df, card_id: int, store) -> None:
+        super().__init__()
+        self.cardtable = cardtable
+        self.card_id = card_id
+        self.store = store                      # SheetsModel.profile_store() of the sheet
+        self._df = df
+
+    def work(self) -> None:
+        if not self.cancelled:
+            profile = profile_column(self._df.iloc[:, self.card_id])
+            self.signals.ready.emit(self.cardtable, self.card_id, profile)
+
+
+class ProfileController(QObject):
+    """
+    Column profiles on a one-thread pool: request(card_id) first, then
+    profile_all(); a sheet's profiles go to the cache once it is done.
+    """
+
+    def __init__(self, sheets_model, parent=None) -> None:
+        super().__init__(parent)
+        self.model = sheets_model
+        self._tasks = TaskSet()
+        self._queued: set[tuple[int, int]] = set()    # (id(cardtable), card id)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        QApplication.instance().aboutToQuit.connect(self.cancel)
+
+    def request(self, card_id: int) -> None:
+        self._start([card_id], priority=1)
+
+    def profile_all(self) -> None:
+        self._start([c.id for c in self.model.cardtable.ordered_cards()], priority=0)
+
+    def cancel(self) -> None:
+        self._tasks.cancel()
+
+    # -------------------------------------------------------------------
+    def _start(self, card_ids: list[int], priority: int) -> None:
+        if self.model.loading:
+            return
+        ct = self.model.cardtable
+        self.model.ensure_derived([ct.by_id(cid) for cid in card_ids], source=True)
+        df = self.model.source_frame
+        store = self.model.profile_store()
+        for cid in card_ids:
+            key = (id(ct), cid)
+            if ct.by_id(cid).profile is not None or key in self._queued:
+                continue
+            task = _ProfileTask(ct, df, cid, store)
+            task.signals.ready.connect(self._on_ready)
+            task.signals.done.connect(self._on_done)
+            self._queued.add(key)
+            self._tasks.start(task, self._pool, priority)
+
+    def _on_ready(self, cardtable, card_id: int, profile) -> None:
+        cardtable.set_profile(card_id, profile)
+
+    def _on_done(self, task: _ProfileTask) -> None:
+        self._queued.discard((id(task.cardtable), task.card_id))
+        if task.store is None or any(t.cardtable is task.cardtable
+                                     for t in self._tasks if t is not task):
+            return
+        profiles = task.cardtable.profiles_to_dict()
+        if profiles:
+            store = task.store
+            QThreadPool.globalInstance().start(lambda: store(profiles))
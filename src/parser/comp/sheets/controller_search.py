@@ -0,0 +1,183 @@
+# src/parser/comp/sheets/controller_search.py
+from __future__ import annotations
+
+import numpy as np
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QApplication
+
+from .helper_task import Task, TaskSet, TaskSignals
+from .model_search_index import SearchCancelled, SearchIndex
+
+
+class _IndexSignals(TaskSignals):
+    ready: Signal = Signal(object, object)      # (RowModel, SearchIndex)
+
+
+class _IndexTask(Task):
+    """Builds a SearchIndex of one RowModel's frame."""
+
+    Signals = _IndexSignals
+
+    def __init__(self, rows) -> None:
+        super().__init__()
+        self._rows = rows
+        self._df = rows._df
+
+    def work(self) -> None:
+        try:
+            index = SearchIndex.build(self._df, cancelled=self.cancel_event.is_set)
+        except SearchCancelled:
+            return
+        self.signals.ready.emit(self._rows, index)
+
+
+class SearchController(QObject):
+    """
+    Search box over the current rows (SearchIndex built in the
+    background); emits jumped() after moving to a hit.
+    """
+
+    jumped: Signal = Signal()
+
+    def __init__(self, sheets_model, widget) -> None:
+        super().__init__(widget)              # dies with the widget: late builds are dropped
+        self.model = sheets_model
+        self.w = widget
+        self._index: SearchIndex | None = None
+        self._index_rows = None                 # RowModel the index belongs to
+        self._index_version = None              # … and its RowModel.version
+        self._task: _IndexTask | None = None   # current build
+        self._tasks = TaskSet()
+        self._cards = None                      # CardTableModel being watched
+        self._hits = np.empty(0, dtype=np.int64)
+
+        self.w.search_edit.textChanged.connect(self.refresh)
+        self.w.search_edit.returnPressed.connect(self._on_return)
+        self.w.search_next_btn.clicked.connect(lambda: self.step(+1))
+        self.w.search_prev_btn.clicked.connect(lambda: self.step(-1))
+        self.w.search_scope_chk.toggled.connect(self.refresh)
+        self._watch_cards()
+        QApplication.instance().aboutToQuit.connect(self.cancel)
+
+        self.rebind()
+
+    # ── public ──────────────────────────────────────────────────────
+    def rebind(self) -> None:
+        """(Re)build the index if the rows changed; call after loads / swaps."""
+        self._watch_cards()
+        rows = self.model.rows
+        if rows is self._index_rows and (self._index is not None or self._task is not None):
+            self.refresh()
+            return
+        self.cancel()
+        self._index, self._index_rows, self._index_version = None, rows, rows.version
+        if not self.model.loading:
+            self._task = _IndexTask(rows)
+            self._task.signals.ready.connect(self._on_ready)
+            self._task.signals.failed.connect(self._on_failed)
+            self._tasks.start(self._task)
+        self.refresh()
+
+    def refresh(self, *_) -> None:
+        """Re-run the query (text, scope or filter changed) and update the count."""
+        text = self.w.search_edit.text()
+        if not text.strip():
+            self._hits = np.empty(0, dtype=np.int64)
+            self.w.search_count.setText("")
+            return
+        if self._index is None:
+            self._hits = np.empty(0, dtype=np.int64)
+            self.w.search_count.setText(
+                "indexing after load…" if self.model.loading else "indexing…")
+            return
+
+        hits = self._index.query(text, self._scope())
+        rows = self.model.rows
+        if rows.filtered:
+            hits = np.intersect1d(hits, rows.view_positions(), assume_unique=True)
+        self._hits = hits
+        self._update_label()
+
+    def step(self, direction: int) -> None:
+        """Jump to the next (+1) / previous (-1) hit after the current row."""
+        hits = self._hits
+        if not len(hits):
+            return
+        rows = self.model.rows
+        current = rows.position if rows.row_count else -1
+        if direction > 0:
+            i = int(np.searchsorted(hits, current, "right"))
+            target = hits[i] if i < len(hits) else hits[0]
+        else:
+            i = int(np.searchsorted(hits, current, "left")) - 1
+            target = hits[i] if i >= 0 else hits[-1]
+        if rows.seek(int(target)):
+            self._update_label()
+            self.jumped.emit()
+
+    def on_row_changed(self, *_) -> None:
+        """Keep the "i / n" hit label in step with ordinary navigation."""
+        if len(self._hits):
+            self._update_label()
+
+    def cancel(self) -> None:
+        """Stop a running index build (its result is dropped)."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # ── slots ───────────────────────────────────────────────────────
+    def _on_return(self) -> None:
+        back = QApplication.keyboardModifiers() & Qt.ShiftModifier
+        self.step(-1 if back else +1)
+
+    def _on_ready(self, rows, index: SearchIndex) -> None:
+        if rows is not self._index_rows or rows is not self.model.rows:   # stale build
+            return
+        self._task = None
+        self._index = index
+        self.refresh()
+
+    def _on_failed(self, message: str) -> None:
+        self._task = None
+        self.w.search_count.setText(f"index failed – {message}")
+
+    # ── helpers ─────────────────────────────────────────────────────
+    def _scope(self) -> list[int] | None:
+        if not self.w.search_scope_chk.isChecked():
+            return None
+        return [c.id for c in self.model.cardtable.cards if c.show and not c.disabled]
+
+    def _update_label(self) -> None:
+        hits = self._hits
+        text = f"{len(hits):,} rows match"
+        rows = self.model.rows
+        if len(hits) and rows.row_count:
+            i = int(np.searchsorted(hits, rows.position))
+            if i < len(hits) and hits[i] == rows.position:
+                text = f"{i + 1:,} / {len(hits):,} rows match"
+        self.w.search_count.setText(text)
+
+    def _watch_cards(self) -> None:
+        """Scoped queries follow card visibility (per sheet CardTableModel)."""
+        ct = self.model.cardtable
+        if self._cards is ct:
+            return
+        if self._cards is not None:
+            self._cards.cardStateChanged.disconnect(self._on_cards_changed)
+            self._cards.visibilityChanged.disconnect(self._on_cards_changed)
+            self._cards.derivedReady.disconnect(self._on_derived_ready)
+        self._cards = ct
+        ct.cardStateChanged.connect(self._on_cards_changed)
+        ct.visibilityChanged.connect(self._on_cards_changed)
+        ct.derivedReady.connect(self._on_derived_ready)
+
+    def _on_cards_changed(self, *_) -> None:
+        if self.w.search_scope_chk.isChecked():
+            self.refresh()
+
+    def _on_derived_ready(self, *_) -> None:
+        rows = self.model.rows
+        if rows is self._index_rows and rows.version != self._index_version:
+            self._index_rows = None                 # rebuilt with the new column
+            self.rebind()
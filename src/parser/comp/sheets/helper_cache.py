@@ -0,0 +1,209 @@
+# src/parser/comp/sheets/helper_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import shutil
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from .helper_compact import ARROW_STRING
+from .helper_profiler import profiled
+
+__all__ = ["WorkbookCache"]
+
+try:                                    # parquet needs pyarrow (optional)
+    import pyarrow  # noqa: F401
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+
+
+class WorkbookCache:
+    """
+    On-disk cache of parsed workbooks.
+
+    • One directory per entry, keyed by path + size + mtime + content hash
+      (+ sheet name for any sheet but the first):
+         meta.json   – source identity, format, timestamps
+         stats.json  – per-card size stats (CardTableModel.stats_to_list)
+         profiles.json – column profiles, added as they are computed
+         frame.*     – the DataFrame (parquet if pyarrow is present,
+                       pickle otherwise or when parquet can't hold it)
+    • Least-recently-used entries are evicted above `max_bytes`.
+    """
+
+    def __init__(self, root: Path | str, max_bytes: int = 1 << 30) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._keys: dict[tuple, str] = {}       # (path, size, mtime, sheet) → key
+
+    # ── lookup / store ──────────────────────────────────────────────
+    @profiled("cache_load")
+    def load(self, path, sheet: str | None = None) -> tuple[pd.DataFrame, list[dict]] | None:
+        """
+        Return (df, card stats) for an unchanged workbook, else None. An
+        entry that cannot be read is dropped (a miss, stored again).
+        """
+        entry = self.root / self.key(path, sheet)
+        if not entry.is_dir():
+            return None
+        try:
+            meta = json.loads((entry / "meta.json").read_text())
+            stats = json.loads((entry / "stats.json").read_text())
+            frame = entry / f"frame.{meta['format']}"
+            df = pd.read_parquet(frame) if meta["format"] == "parquet" \
+                else pd.read_pickle(frame)
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError):   # incomplete, corrupt, or another pandas
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        if meta["format"] == "parquet":
+            _restore_strings(df, meta.get("arrow_strings", ()))
+
+        meta["used"] = time.time()
+        (entry / "meta.json").write_text(json.dumps(meta, indent=2))
+        return df, stats
+
+    @profiled("cache_store")
+    def store(self, path, df: pd.DataFrame, stats: list[dict],
+              sheet: str | None = None) -> None:
+        entry = self.root / self.key(path, sheet)
+        tmp = entry.with_name(entry.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        fmt = "pickle"
+        if _HAS_ARROW and all(isinstance(c, str) for c in df.columns):
+            try:
+                df.to_parquet(tmp / "frame.parquet", index=False)
+                fmt = "parquet"
+            except Exception:           # mixed-type object columns etc.
+                (tmp / "frame.parquet").unlink(missing_ok=True)
+        if fmt == "pickle":
+            df.to_pickle(tmp / "frame.pickle")
+
+        src = Path(path).resolve()
+        now = time.time()
+        meta = {"source": str(src), "sheet": sheet, "format": fmt, "rows": len(df),
+                "created": now, "used": now,
+                "arrow_strings": [i for i, t in enumerate(df.dtypes)     # compacted text
+                                  if ARROW_STRING is not None and t == ARROW_STRING]}
+        (tmp / "stats.json").write_text(json.dumps(stats))
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+
+        shutil.rmtree(entry, ignore_errors=True)
+        tmp.rename(entry)
+        self._evict()
+
+    # ── column profiles ─────────────────────────────────────────────
+    def load_profiles(self, path, sheet: str | None = None) -> dict[str, dict]:
+        """Profiles stored for an unchanged workbook ({} if none)."""
+        try:
+            return json.loads((self.root / self.key(path, sheet) / "profiles.json").read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def store_profiles(self, path, profiles: dict[str, dict],
+                       sheet: str | None = None) -> bool:
+        """Merge profiles into an existing entry; False if it is not cached."""
+        entry = self.root / self.key(path, sheet)
+        if not (entry / "meta.json").is_file():
+            return False
+        merged = {**self.load_profiles(path, sheet), **profiles}
+        tmp = entry / "profiles.json.tmp"
+        tmp.write_text(json.dumps(merged))
+        tmp.replace(entry / "profiles.json")
+        return True
+
+    # ── inspection / maintenance ────────────────────────────────────
+    def entries(self) -> list[dict]:
+        """Metadata of every entry (plus key and bytes), oldest use first."""
+        out = []
+        for entry in self._entry_dirs():
+            try:
+                meta = json.loads((entry / "meta.json").read_text())
+            except (OSError, ValueError):
+                continue
+            meta["key"] = entry.name
+            meta["bytes"] = _dir_bytes(entry)
+            out.append(meta)
+        return sorted(out, key=lambda m: m["used"])
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(_dir_bytes(e) for e in self._entry_dirs())
+
+    def clear(self) -> None:
+        for entry in self._entry_dirs():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    # ── keys ────────────────────────────────────────────────────────
+    def key(self, path, sheet: str | None = None) -> str:
+        """Entry key; hashed once per unchanged file (size + mtime)."""
+        src = Path(path).resolve()
+        st = src.stat()
+        memo = (src, st.st_size, st.st_mtime_ns, sheet)
+        key = self._keys.get(memo)
+        if key is None:
+            key = self._keys[memo] = self._hash(src, st, sheet)
+        return key
+
+    @staticmethod
+    def _hash(src: Path, st, sheet: str | None) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{src}|{st.st_size}|{st.st_mtime_ns}|".encode())
+        if sheet is not None:
+            h.update(f"sheet={sheet}|".encode())
+        with open(src, "rb") as fh:
+            while block := fh.read(1 << 20):
+                h.update(block)
+        return h.hexdigest()
+
+    # ── internal helpers ────────────────────────────────────────────
+    def _entry_dirs(self) -> list[Path]:
+        if not self.root.is_dir():
+            return []
+        return [p for p in self.root.iterdir()
+                if p.is_dir() and not p.name.endswith(".tmp")]
+
+    def _evict(self) -> None:
+        entries = self.entries()
+        total = sum(e["bytes"] for e in entries)
+        for e in entries:                          # oldest use first
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self.root / e["key"], ignore_errors=True)
+            total -= e["bytes"]
+
+
+def _restore_strings(df: pd.DataFrame, positions) -> None:
+    # compacted text (ARROW_STRING, NaN blanks) reads back from parquet
+    # with <NA> blanks – restore those columns only, as stored
+    for pos in positions:
+        df.isetitem(pos, df.iloc[:, pos].astype(ARROW_STRING))
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Inspect or clear the workbook cache.")
+    ap.add_argument("root", help="cache directory, e.g. temp/cache")
+    ap.add_argument("--clear", action="store_true", help="delete every entry")
+    args = ap.parse_args()
+
+    cache = WorkbookCache(args.root)
+    if args.clear:
+        cache.clear()
+    for e in cache.entries():
+        print(f"{e['key']}  {e['bytes']:>12,} B  {e['rows']:>9,} rows  "
+              f"{e['format']:<7}  {e['source']}"
+              + (f" [{e['sheet']}]" if e.get("sheet") else ""))
+    print(f"total: {cache.total_bytes:,} B")
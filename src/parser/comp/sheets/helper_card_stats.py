@@ -0,0 +1,166 @@
+# src/parser/comp/sheets/helper_card_stats.py
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .helper_profiler import profiled
+
+__all__ = ["LenStats", "column_stats", "frame_stats"]
+
+CHUNK_ROWS = 65_536     # rows stringified at a time (object/fallback path)
+PARALLEL_MIN_CELLS = 200_000
+
+_POW10 = np.array([10 ** k for k in range(1, 20)], dtype=np.uint64)
+_NS_DAY = 86_400 * 10 ** 9
+_NS_SEC = 10 ** 9
+
+
+@dataclass(frozen=True, slots=True)
+class LenStats:
+    """Displayed-length stats of one column: str(value).rstrip()."""
+    count: int
+    total: int
+    min: int
+    max: int
+
+    @property
+    def avg(self) -> int:
+        return self.total // self.count if self.count else 0
+
+    def merge(self, other: "LenStats") -> "LenStats":
+        if not self.count:
+            return other
+        if not other.count:
+            return self
+        return LenStats(
+            count=self.count + other.count,
+            total=self.total + other.total,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+        )
+
+
+EMPTY = LenStats(0, 0, 0, 0)
+
+
+# ── public API ──────────────────────────────────────────────────────
+def column_stats(series: pd.Series, sample: int | None = None) -> LenStats:
+    """
+    Same numbers as series.astype(str).str.rstrip().str.len(), without
+    building a string per cell where the dtype allows it:
+      • int / bool      – width from magnitude (digits + sign)
+      • float64         – integral values from magnitude, the rest via
+                          a fixed-width numpy string buffer per chunk
+      • datetime64[ns]  – constant width from the column-wide format
+      • anything else   – stringified chunk by chunk
+    sample=N looks at N evenly spaced rows only (approximate min/max).
+    """
+    if sample is not None and len(series) > sample:
+        pos = np.linspace(0, len(series) - 1, sample).astype(np.int64)
+        series = series.iloc[pos]
+
+    if series.empty:
+        return EMPTY
+
+    dtype = series.dtype
+    if dtype == np.bool_:
+        return _from_lens(np.where(series.to_numpy(), 4, 5))
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return _from_lens(_int_lens(series.to_numpy()))
+    if dtype == np.float64:
+        return _float_stats(series.to_numpy())
+    if dtype == "datetime64[ns]":
+        return _datetime_stats(series.to_numpy())
+    return _generic_stats(series)
+
+
+@profiled("card_stats")
+def frame_stats(df: pd.DataFrame, sample: int | None = None,
+                workers: int | None = None) -> list[LenStats]:
+    """column_stats() for every column, in parallel on wide/large frames."""
+    cols = [df.iloc[:, i] for i in range(df.shape[1])]
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1) if df.size >= PARALLEL_MIN_CELLS else 1
+    if workers <= 1 or len(cols) < 2:
+        return [column_stats(s, sample) for s in cols]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda s: column_stats(s, sample), cols))
+
+
+# ── dtype paths ─────────────────────────────────────────────────────
+def _from_lens(lens: np.ndarray) -> LenStats:
+    return LenStats(
+        count=len(lens), total=int(lens.sum()),
+        min=int(lens.min()), max=int(lens.max()),
+    )
+
+
+def _int_lens(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == "u":
+        mag = values.astype(np.uint64)
+        sign = 0
+    else:
+        v = values.astype(np.int64)
+        mag = np.abs(v).view(np.uint64)      # int64 min wraps to 2**63: fine
+        sign = v < 0
+    return np.searchsorted(_POW10, mag, side="right") + 1 + sign
+
+
+def _float_stats(values: np.ndarray) -> LenStats:
+    acc = EMPTY
+    for start in range(0, len(values), CHUNK_ROWS):
+        chunk = values[start:start + CHUNK_ROWS]
+        # x.0 below 1e16 prints as its integer part + ".0"
+        whole = np.isfinite(chunk) & (np.abs(chunk) < 1e16) & (chunk == np.trunc(chunk))
+        lens = np.empty(len(chunk), dtype=np.int64)
+        if whole.any():
+            w = chunk[whole]
+            lens[whole] = _int_lens(w.astype(np.int64)) + 2 + (np.signbit(w) & (w == 0))
+        if not whole.all():
+            lens[~whole] = np.char.str_len(chunk[~whole].astype(str))
+        acc = acc.merge(_from_lens(lens))
+    return acc
+
+
+def _datetime_stats(values: np.ndarray) -> LenStats:
+    ns = values.view(np.int64)
+    valid = ~np.isnat(values)
+    n_valid = int(valid.sum())
+    if not n_valid:
+        return LenStats(len(ns), 3 * len(ns), 3, 3)
+
+    v = ns[valid]
+    if not (v % _NS_DAY).any():
+        width = 10                               # 2020-01-31
+    else:
+        frac = v % _NS_SEC
+        if not frac.any():
+            width = 19                           # 2020-01-31 12:00:00
+        elif not (frac % 10 ** 6).any():
+            width = 23                           # … .123
+        elif not (frac % 10 ** 3).any():
+            width = 26                           # … .123456
+        else:
+            width = 29                           # … .123456789
+
+    n_nat = len(ns) - n_valid
+    return LenStats(
+        count=len(ns),
+        total=width * n_valid + 3 * n_nat,
+        min=3 if n_nat else width,
+        max=width,
+    )
+
+
+def _generic_stats(series: pd.Series) -> LenStats:
+    acc = EMPTY
+    for start in range(0, len(series), CHUNK_ROWS):
+        chunk = series.iloc[start:start + CHUNK_ROWS]
+        lens = chunk.astype(str).str.rstrip().str.len().to_numpy()
+        acc = acc.merge(_from_lens(lens))
+    return acc
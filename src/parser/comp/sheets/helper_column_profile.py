@@ -0,0 +1,118 @@
+# src/parser/comp/sheets/helper_column_profile.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .helper_profiler import profiled
+
+__all__ = ["ColumnProfile", "profile_column", "TOP_VALUES"]
+
+TOP_VALUES = 5
+
+# pd.api.types.infer_dtype() → profile kind (object / string columns)
+_INFERRED = {
+    "string": "text", "empty": "empty",
+    "integer": "integer", "floating": "float", "mixed-integer-float": "float",
+    "decimal": "float", "boolean": "boolean",
+    "datetime": "datetime", "datetime64": "datetime", "date": "datetime",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnProfile:
+    """
+    What one column holds: kind (text / integer / float / datetime /
+    boolean / mixed / empty), blanks, distinct values, the most common
+    values and – for numbers and dates – min / max (JSON-ready: numbers
+    as int / float, dates as text).
+    """
+    kind: str
+    rows: int
+    nulls: int
+    distinct: int
+    top: tuple[tuple[str, int], ...] = ()
+    min: int | float | str | None = None
+    max: int | float | str | None = None
+
+    def summary(self) -> str:
+        lines = [f"{self.kind} · {self.rows:,} rows · {self.nulls:,} blank · "
+                 f"{self.distinct:,} distinct"]
+        if self.min is not None:
+            lines.append(f"min {self.min} · max {self.max}")
+        if self.top:
+            lines.append("top: " + ", ".join(f"{_clip(v)} ×{n:,}" for v, n in self.top))
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "rows": self.rows, "nulls": self.nulls,
+                "distinct": self.distinct, "top": [list(t) for t in self.top],
+                "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "ColumnProfile":
+        return cls(kind=d["kind"], rows=d["rows"], nulls=d["nulls"],
+                   distinct=d["distinct"], top=tuple((v, n) for v, n in d["top"]),
+                   min=d.get("min"), max=d.get("max"))
+
+
+@profiled("column_profile")
+def profile_column(series: pd.Series, top: int = TOP_VALUES) -> ColumnProfile:
+    """
+    Profile one column with vectorized pandas operations: one isna(),
+    one value_counts() (distinct + top values from the same hash pass)
+    and min / max on the typed values.
+    """
+    rows = len(series)
+    values = series.dropna()
+    nulls = rows - len(values)
+    if values.empty:
+        return ColumnProfile("empty", rows, nulls, 0)
+
+    kind = _kind(values)
+    if values.dtype == object:                  # counts keyed by typed values, as
+        values = values.infer_objects()         # value_counts() used to infer them
+    try:
+        counts = values.value_counts(sort=True)
+    except TypeError:                           # unhashable cells (lists …)
+        counts = values.astype(str).value_counts(sort=True)
+    counts = counts[counts > 0]                 # unused categories
+    top_values = tuple((str(v), int(n)) for v, n in counts.head(top).items())
+
+    lo = hi = None
+    if kind in ("integer", "float"):
+        numbers = pd.to_numeric(values, errors="coerce")
+        lo, hi = _scalar(numbers.min()), _scalar(numbers.max())
+    elif kind == "datetime":
+        dates = pd.to_datetime(values, errors="coerce")
+        lo, hi = str(dates.min()), str(dates.max())
+    return ColumnProfile(kind, rows, nulls, len(counts), top_values, lo, hi)
+
+
+def _kind(values: pd.Series) -> str:
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):     # compacted: infer_dtype says "categorical"
+        values = dtype.categories
+        dtype = values.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    return _INFERRED.get(pd.api.types.infer_dtype(values, skipna=True), "mixed")
+
+
+def _scalar(value):
+    """numpy scalar → int / float (JSON); NaN (nothing numeric) → None."""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def _clip(text: str, width: int = 40) -> str:
+    text = text.replace("\n", " ")
+    return repr(text if len(text) <= width else text[:width - 1] + "…")
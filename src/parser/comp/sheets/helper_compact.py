@@ -0,0 +1,166 @@
+# src/parser/comp/sheets/helper_compact.py
+"""
+Memory-compact DataFrames: dtype changes that keep every displayed value
+(str(cell), as the Value column shows it) exactly as it was.
+
+    PARSER_COMPACT=1     in src/parser/.env: SheetsModel compacts by default
+
+• int columns      – smallest integer dtype holding the range
+• text columns     – category when few distinct values
+                     (ratio ≤ max_category_ratio), else Arrow-backed
+                     strings with NaN blanks (ARROW_STRING; needs pyarrow)
+• floats stay float64 (float32 prints differently); datetimes, bools,
+  mixed-type columns and text with None blanks (would print as "nan")
+  stay as they are
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .helper_profiler import profiled      # also loads src/parser/.env
+
+__all__ = ["ARROW_STRING", "ColumnMemory", "CompactReport", "compact_frame",
+           "default_enabled", "widened"]
+
+
+def _arrow_string() -> pd.StringDtype | None:
+    try:                                # pandas ≥ 2.3 (the "pyarrow_numpy" alias is deprecated)
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:                   # pandas 2.2: no na_value yet
+        pass
+    except ImportError:                 # Arrow strings need pyarrow (optional)
+        return None
+    try:
+        return pd.StringDtype("pyarrow_numpy")
+    except (ImportError, ValueError):
+        return None
+
+
+ARROW_STRING: pd.StringDtype | None = _arrow_string()   # compacted text columns
+
+MAX_CATEGORY_RATIO = 0.5      # distinct / non-blank values for a category
+
+
+def default_enabled() -> bool:
+    return os.getenv("PARSER_COMPACT", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnMemory:
+    column: str
+    dtype_before: str
+    dtype_after: str
+    bytes_before: int
+    bytes_after: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompactReport:
+    columns: tuple[ColumnMemory, ...]
+
+    @property
+    def bytes_before(self) -> int:
+        return sum(c.bytes_before for c in self.columns)
+
+    @property
+    def bytes_after(self) -> int:
+        return sum(c.bytes_after for c in self.columns)
+
+    def __str__(self) -> str:
+        before, after = self.bytes_before, self.bytes_after
+        changed = sum(c.dtype_before != c.dtype_after for c in self.columns)
+        saved = 1 - after / before if before else 0.0
+        return (f"memory {_mib(before)} → {_mib(after)} ({saved:.0%} less, "
+                f"{changed} of {len(self.columns)} columns compacted)")
+
+    def table(self) -> str:
+        """Per-column before / after, largest saving first."""
+        lines = [f"{'column':<28}{'before':>16}{'after':>16}{'MiB before':>12}{'MiB after':>12}"]
+        for c in sorted(self.columns, key=lambda c: c.bytes_after - c.bytes_before):
+            lines.append(f"{str(c.column)[:27]:<28}{c.dtype_before:>16}{c.dtype_after:>16}"
+                         f"{c.bytes_before / 2**20:12.2f}{c.bytes_after / 2**20:12.2f}")
+        lines.append(str(self))
+        return "\n".join(lines)
+
+
+@profiled("compact_frame")
+def compact_frame(df: pd.DataFrame, *, max_category_ratio: float = MAX_CATEGORY_RATIO,
+                  arrow_strings: bool = True) -> tuple[pd.DataFrame, CompactReport]:
+    """Return (compacted copy of df, per-column memory report)."""
+    out: dict[object, pd.Series] = {}
+    report = []
+    for pos, name in enumerate(df.columns):
+        series = df.iloc[:, pos]
+        compacted = _compact_column(series, max_category_ratio, arrow_strings)
+        out[pos] = compacted
+        report.append(ColumnMemory(
+            column=str(name),
+            dtype_before=str(series.dtype),
+            dtype_after=str(compacted.dtype),
+            bytes_before=int(series.memory_usage(index=False, deep=True)),
+            bytes_after=int(compacted.memory_usage(index=False, deep=True)),
+        ))
+    result = pd.DataFrame(out, index=df.index, copy=False)
+    result.columns = df.columns                 # positions above: duplicate titles ok
+    return result, CompactReport(tuple(report))
+
+
+def widened(s: pd.Series) -> pd.Series:
+    """
+    A (compacted) column in dtypes safe to compute with, e.g. for derived
+    cards: narrow integers → int64 (nullable ones → Int64), categories →
+    their categories' dtype. Anything else is returned as it is.
+    """
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        try:
+            return s.astype(dtype.categories.dtype)
+        except (TypeError, ValueError):         # e.g. int categories with blanks
+            return s.astype(object)
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iu" and dtype.itemsize < 8:
+            return s.astype(np.int64)
+        return s
+    if pd.api.types.is_integer_dtype(dtype) and dtype.itemsize < 8:
+        return s.astype("Int64")
+    return s
+
+
+def _compact_column(s: pd.Series, max_category_ratio: float, arrow_strings: bool) -> pd.Series:
+    dtype = s.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return pd.to_numeric(s, downcast="integer" if dtype.kind == "i" else "unsigned")
+    if dtype != object or s.empty:
+        return s
+
+    blank = s.isna()
+    values = s[~blank]
+    if values.empty or pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return s                                # blank or mixed-type column
+    if blank.any() and not all(isinstance(v, float) for v in s[blank]):
+        return s                                # None / NaT blanks: kept as shown
+    if values.nunique() <= max_category_ratio * len(values):
+        return s.astype("category")
+    if arrow_strings and ARROW_STRING is not None:
+        return s.astype(ARROW_STRING)
+    return s
+
+
+def _mib(n: int) -> str:
+    return f"{n / 2**20:,.1f} MiB"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Show what compaction saves on a workbook.")
+    ap.add_argument("path", help="xlsx workbook")
+    ap.add_argument("--sheet", help="sheet (default: the first)")
+    args = ap.parse_args()
+
+    frame = pd.read_excel(args.path, sheet_name=args.sheet or 0)
+    print(compact_frame(frame)[1].table())
@@ -0,0 +1,198 @@
+# src/parser/comp/sheets/helper_derived.py
+"""
+Derived columns: an expression over other fields, evaluated on whole
+columns – every operator / method works on a Series at once, never row
+by row.
+
+    `First name` + " " + `Last name`     text: + concatenates
+    Amount * 1.2 - Discount              arithmetic, comparisons, & | ~, not
+    `Order date`.dt.year                 accessors and methods in ATTRIBUTES
+    where(Qty > 0, Amount / Qty, 0)      FUNCTIONS below
+
+Field titles that are not plain identifiers go in backticks. Blank cells
+stay blank through arithmetic and concatenation (text() turns them into
+"" first). Python syntax, restricted to the nodes handled here: no
+subscripts, lambdas or comprehensions, and only the attributes listed –
+pure computations, nothing that writes or reaches outside the columns.
+"""
+from __future__ import annotations
+
+import ast
+import operator
+import re
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["evaluate", "field_names", "FUNCTIONS", "ATTRIBUTES", "ExpressionError"]
+
+
+class ExpressionError(ValueError):
+    """Expression that cannot be parsed or evaluated (message for the user)."""
+
+
+def _where(cond, a, b):
+    index = next((x.index for x in (cond, a, b) if isinstance(x, pd.Series)), None)
+    return pd.Series(np.where(np.asarray(cond, dtype=bool), a, b), index=index)
+
+
+def _text(x):
+    if isinstance(x, pd.Series):
+        return x.astype(str).where(x.notna(), "")
+    return "" if x is None else str(x)
+
+
+FUNCTIONS: dict[str, Callable] = {
+    "where":  _where,                                               # cond ? a : b
+    "text":   _text,                                                # blanks → ""
+    "number": lambda x: pd.to_numeric(x, errors="coerce"),
+    "date":   lambda x: pd.to_datetime(x, errors="coerce"),
+    "abs":    abs,
+    "round":  lambda x, digits=0: x.round(digits),
+}
+
+# Series, .str and .dt attributes an expression may use (allow-list)
+ATTRIBUTES: frozenset[str] = frozenset({
+    # Series
+    "str", "dt", "abs", "round", "clip", "fillna", "where", "mask", "isna", "notna",
+    "astype", "between", "isin", "replace", "shift", "diff", "pct_change", "rank",
+    "cumsum", "cumprod", "cummin", "cummax", "sum", "mean", "median", "min", "max",
+    "std", "count", "nunique",
+    # .str
+    "lower", "upper", "title", "capitalize", "casefold", "strip", "lstrip", "rstrip",
+    "len", "slice", "get", "cat", "contains", "startswith", "endswith", "match",
+    "fullmatch", "find", "pad", "zfill", "center", "ljust", "rjust", "repeat",
+    "isdigit", "isalpha", "isalnum", "isnumeric", "isspace", "isupper", "islower",
+    # .dt
+    "year", "month", "day", "hour", "minute", "second", "quarter", "dayofweek",
+    "day_of_week", "dayofyear", "day_of_year", "weekday", "days_in_month", "date",
+    "time", "days", "total_seconds", "strftime", "normalize", "floor", "ceil",
+    "month_name", "day_name", "is_month_start", "is_month_end",
+})
+
+
+def _not(x):
+    if isinstance(x, (pd.Series, np.ndarray)):
+        return ~x                                   # element-wise
+    return not x
+
+
+_BINARY = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow, ast.BitAnd: operator.and_, ast.BitOr: operator.or_,
+}
+_COMPARE = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+    ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_UNARY = {ast.USub: operator.neg, ast.UAdd: operator.pos,
+          ast.Not: _not, ast.Invert: operator.invert}
+
+_BACKTICK = re.compile(r"`([^`]+)`")
+
+
+def field_names(expression: str) -> set[str]:
+    """Field titles an expression refers to (functions excluded)."""
+    tree, quoted = _parse(expression)
+    return {quoted.get(n.id, n.id) for n in ast.walk(tree)
+            if isinstance(n, ast.Name) and n.id not in FUNCTIONS}
+
+
+def evaluate(expression: str, fields: Mapping[str, pd.Series], index: pd.Index) -> pd.Series:
+    """
+    Value of `expression` for every row: `fields` maps titles to columns
+    (all on `index`); a scalar result is repeated for every row.
+    """
+    tree, quoted = _parse(expression)
+    try:
+        value = _Evaluator(fields, quoted).visit(tree.body)
+    except ExpressionError:
+        raise
+    except Exception as exc:                    # pandas / numpy on these columns
+        raise ExpressionError(f"{type(exc).__name__}: {exc}") from exc
+    if isinstance(value, pd.DataFrame):
+        raise ExpressionError("the expression gives a table, not one value per row")
+    if not isinstance(value, pd.Series):
+        return pd.Series([value] * len(index), index=index)
+    if len(value) != len(index):
+        raise ExpressionError(f"the expression gives {len(value):,} values for {len(index):,} rows")
+    return value.set_axis(index)
+
+
+# ── internals ───────────────────────────────────────────────────────
+def _parse(expression: str) -> tuple[ast.Expression, dict[str, str]]:
+    quoted: dict[str, str] = {}
+
+    def name(m: re.Match) -> str:
+        key = f"_f{len(quoted)}"
+        quoted[key] = m.group(1)
+        return key
+
+    try:
+        return ast.parse(_BACKTICK.sub(name, expression.strip()), mode="eval"), quoted
+    except SyntaxError as exc:
+        raise ExpressionError(f"syntax error: {exc.msg}") from exc
+
+
+class _Evaluator(ast.NodeVisitor):
+    def __init__(self, fields: Mapping[str, pd.Series], quoted: dict[str, str]) -> None:
+        self.fields = fields
+        self.quoted = quoted
+
+    def generic_visit(self, node):
+        raise ExpressionError(f"not supported in expressions: {type(node).__name__}")
+
+    def visit_Constant(self, node):
+        return node.value
+
+    def visit_Name(self, node):
+        title = self.quoted.get(node.id, node.id)
+        if title in self.fields:
+            return self.fields[title]
+        if node.id in FUNCTIONS:
+            return FUNCTIONS[node.id]
+        raise ExpressionError(f"unknown field {title!r}")
+
+    def visit_Attribute(self, node):
+        if node.attr not in ATTRIBUTES:
+            raise ExpressionError(f"not allowed: .{node.attr}")
+        return getattr(self.visit(node.value), node.attr)
+
+    def visit_Call(self, node):
+        func = self.visit(node.func)
+        if not callable(func):
+            raise ExpressionError(f"{ast.unparse(node.func)} is not a function")
+        args = [self.visit(a) for a in node.args]
+        kwargs = {k.arg: self.visit(k.value) for k in node.keywords if k.arg is not None}
+        return func(*args, **kwargs)
+
+    def visit_BinOp(self, node):
+        op = _BINARY.get(type(node.op))
+        if op is None:
+            return self.generic_visit(node.op)
+        return op(self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node):
+        return _UNARY[type(node.op)](self.visit(node.operand))
+
+    def visit_BoolOp(self, node):                # and / or → element-wise & / |
+        op = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        values = [self.visit(v) for v in node.values]
+        result = values[0]
+        for v in values[1:]:
+            result = op(result, v)
+        return result
+
+    def visit_Compare(self, node):               # a < b < c → (a < b) & (b < c)
+        left, result = self.visit(node.left), None
+        for op, comparator in zip(node.ops, node.comparators):
+            fn = _COMPARE.get(type(op))
+            if fn is None:
+                return self.generic_visit(op)
+            right = self.visit(comparator)
+            part = fn(left, right)
+            result = part if result is None else result & part
+            left = right
+        return result
@@ -0,0 +1,183 @@
+# src/parser/comp/sheets/helper_export.py
+from __future__ import annotations
+
+import csv
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["ExportPlan", "ExportStats", "ExportCancelled", "plan_export",
+           "export_plan", "EXPORT_FORMATS"]
+
+EXPORT_FORMATS = ("xlsx", "csv", "parquet")
+CHUNK_ROWS = 5_000
+
+# progress(rows written, rows total, rows/sec)
+Progress = Callable[[int, int, float], None]
+
+
+class ExportCancelled(Exception):
+    """Raised inside export_plan() when `cancelled()` turns true."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExportPlan:
+    """What to write: a frame, its rows (positions) and columns (positions)."""
+    df: pd.DataFrame
+    positions: np.ndarray
+    columns: list[int]
+    titles: list[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ExportStats:
+    path: Path
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.rows:,} rows → {self.path.name} "
+                f"in {self.seconds:.1f}s ({self.rows_per_sec:,.0f} rows/s)")
+
+
+# ── planning ────────────────────────────────────────────────────────
+def plan_export(rows, cardtable) -> ExportPlan:
+    """
+    The refined workbook: rows of the current view (join / filter
+    applied) and only the kept cards – shown, not disabled – in the
+    user's order. Call on the GUI thread; the plan is safe to hand to
+    a worker afterwards.
+    """
+    cards = [c for c in cardtable.ordered_cards() if c.show and not c.disabled]
+    return ExportPlan(
+        df=rows._df,
+        positions=rows.view_positions(),
+        columns=[c.id for c in cards],
+        titles=[c.title for c in cards],
+    )
+
+
+# ── writing ─────────────────────────────────────────────────────────
+def export_plan(plan: ExportPlan, target, fmt: str | None = None,
+                chunk_rows: int = CHUNK_ROWS,
+                progress: Progress | None = None,
+                cancelled: Callable[[], bool] | None = None) -> ExportStats:
+    """
+    Stream `plan` to `target` chunk by chunk, so memory stays flat in
+    the row count. Format from `fmt` or the file suffix. Written to a
+    .part file first; an existing target is only replaced on success.
+    """
+    target = Path(target)
+    fmt = (fmt or target.suffix.lstrip(".")).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"export: unsupported format {fmt!r} (use {', '.join(EXPORT_FORMATS)})")
+
+    writer = {"xlsx": _XlsxWriter, "csv": _CsvWriter, "parquet": _ParquetWriter}[fmt]
+    part = target.with_name(target.name + ".part")
+    total = len(plan.positions)
+    t0 = time.perf_counter()
+    done = 0
+
+    try:
+        with writer(part, plan.titles) as out:
+            for start in range(0, total, chunk_rows):
+                if cancelled is not None and cancelled():
+                    raise ExportCancelled(f"export cancelled after {done:,} rows")
+                pos = plan.positions[start:start + chunk_rows]
+                chunk = plan.df.iloc[pos, plan.columns]
+                chunk.columns = plan.titles
+                out.write(chunk)
+                done += len(chunk)
+                if progress is not None:
+                    elapsed = time.perf_counter() - t0
+                    progress(done, total, done / elapsed if elapsed else 0.0)
+        os.replace(part, target)
+    finally:
+        part.unlink(missing_ok=True)
+
+    return ExportStats(path=target, rows=done, seconds=time.perf_counter() - t0)
+
+
+def _cells(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Object copy of one chunk with NaN / NaT as None (empty cell)."""
+    return chunk.astype(object).where(chunk.notna(), None)
+
+
+class _XlsxWriter:
+    """openpyxl write-only workbook: rows go straight to the zip stream."""
+
+    def __init__(self, path: Path, titles: Sequence[str]) -> None:
+        from openpyxl import Workbook
+        self._path = path
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet()
+        self._ws.append(list(titles))
+
+    def __enter__(self):
+        return self
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        for row in _cells(chunk).itertuples(index=False, name=None):
+            self._ws.append(row)
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self._wb.save(self._path)
+        else:
+            self._wb.close()
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, titles: Sequence[str]) -> None:
+        self._fh = open(path, "w", newline="", encoding="utf-8")
+        csv.writer(self._fh).writerow(titles)
+
+    def __enter__(self):
+        return self
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        chunk.to_csv(self._fh, header=False, index=False)
+
+    def __exit__(self, *_):
+        self._fh.close()
+
+
+class _ParquetWriter:
+    """pyarrow ParquetWriter, one row group per chunk (pyarrow optional)."""
+
+    def __init__(self, path: Path, titles: Sequence[str]) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("export: parquet needs pyarrow installed") from exc
+        self._pa, self._pq = pa, pq
+        self._path = path
+        self._titles = list(titles)
+        self._writer = None
+        self._schema = None
+
+    def __enter__(self):
+        return self
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        table = self._pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._pq.ParquetWriter(self._path, self._schema)
+        self._writer.write_table(table)
+
+    def __exit__(self, exc_type, *_):
+        if self._writer is None and exc_type is None:        # no rows: header only
+            self.write(pd.DataFrame({t: pd.Series(dtype=object) for t in self._titles}))
+        if self._writer is not None:
+            self._writer.close()
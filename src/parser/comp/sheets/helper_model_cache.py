@@ -0,0 +1,101 @@
+# src/parser/comp/sheets/helper_model_cache.py
+from __future__ import annotations
+
+import gc
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["SheetsModelCache", "MAX_MODELS"]
+
+MAX_MODELS = 2          # SheetsModels kept in memory (in-use ones always are)
+
+
+@dataclass(slots=True)
+class _Entry:
+    model: object           # SheetsModel
+    refs: int = 1
+
+
+class SheetsModelCache:
+    """
+    Loaded SheetsModels shared between windows, keyed by file identity
+    (resolved path + size + mtime: an edited file is a new entry).
+
+    • acquire(path)     – the cached model (+1 reference) or None; None
+                          too while it is still streaming a sheet
+    • add(path, model)  – a freshly loaded model, 1 reference
+    • release(model)    – −1 reference (its window closed)
+    • discard(model)    – never hand it out again (cancelled / failed load)
+
+    A second window works on acquire(path).share(): same parsed sheets,
+    its own current sheet, join view and row; it releases the cached one.
+
+    Above `max_models` entries the least recently used model nobody holds
+    (and that is not still streaming) is dropped, and a collection runs so
+    its DataFrames are freed at once rather than at some later GC pass.
+    """
+
+    def __init__(self, max_models: int = MAX_MODELS) -> None:
+        self.max_models = max(1, max_models)
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+
+    def acquire(self, path):
+        key = self._key(path)
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None or entry.model.loading:
+            return None
+        entry.refs += 1
+        self._entries.move_to_end(key)
+        return entry.model
+
+    def add(self, path, model) -> None:
+        key = self._key(path)
+        if key is None:
+            return
+        self._entries[key] = _Entry(model)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def release(self, model) -> None:
+        for entry in self._entries.values():
+            if entry.model is model:
+                entry.refs = max(0, entry.refs - 1)
+                break
+        self._evict()
+
+    def discard(self, model) -> None:
+        for key, entry in list(self._entries.items()):
+            if entry.model is model:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every model nobody holds."""
+        self._evict(limit=0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refs(self, model) -> int:
+        return next((e.refs for e in self._entries.values() if e.model is model), 0)
+
+    # -------------------------------------------------------------------
+    @staticmethod
+    def _key(path) -> tuple | None:
+        try:
+            src = Path(path).resolve()
+            st = src.stat()
+        except (OSError, TypeError):                # gone, or not a path
+            return None
+        return (str(src), st.st_size, st.st_mtime_ns)
+
+    def _evict(self, limit: int | None = None) -> None:
+        limit = self.max_models if limit is None else limit
+        idle = [k for k, e in self._entries.items()          # oldest use first
+                if e.refs == 0 and not e.model.loading]
+        dropped = 0
+        while len(self._entries) > limit and dropped < len(idle):
+            del self._entries[idle[dropped]]
+            dropped += 1
+        if dropped:
+            gc.collect()            # Qt ↔ Python reference cycles hold the frames
@@ -0,0 +1,51 @@
+# src/parser/comp/sheets/helper_preview.py
+from __future__ import annotations
+
+import textwrap
+from dataclasses import dataclass
+
+__all__ = ["Preview", "make_preview", "tooltip_text",
+           "PREVIEW_CHARS", "PREVIEW_LINES", "TOOLTIP_CHARS"]
+
+PREVIEW_CHARS = 240      # Value column: at most this many characters …
+PREVIEW_LINES = 6        # … on at most this many lines
+TOOLTIP_CHARS = 4_000    # tooltip: longer, still bounded (copy gives all)
+TOOLTIP_WIDTH = 100      # tooltip line width (Qt does not wrap plain text)
+
+
+@dataclass(frozen=True, slots=True)
+class Preview:
+    """Bounded display text of one cell; truncated → the full value differs."""
+    text: str
+    truncated: bool
+
+
+def make_preview(value, max_chars: int = PREVIEW_CHARS,
+                 max_lines: int = PREVIEW_LINES) -> Preview:
+    """
+    Display text of `value` cut to max_chars / max_lines with a trailing
+    "…". Work and result size are bounded by max_chars, not by the
+    length of the value (str values are not copied).
+    """
+    text = value if isinstance(value, str) else str(value)
+    cut = len(text) > max_chars
+    head = text[:max_chars] if cut else text
+    end = -1
+    for _ in range(max_lines):
+        end = head.find("\n", end + 1)
+        if end < 0:
+            break
+    else:                                       # more than max_lines lines
+        head, cut = head[:end], True
+    return Preview(head.rstrip() + " …", True) if cut else Preview(text, False)
+
+
+def tooltip_text(value) -> str:
+    """The value wrapped for a tooltip, cut at TOOLTIP_CHARS."""
+    text = value if isinstance(value, str) else str(value)
+    shown = text[:TOOLTIP_CHARS]
+    lines = [wrapped for line in shown.splitlines()
+             for wrapped in (textwrap.wrap(line, TOOLTIP_WIDTH) or [""])]
+    if len(text) > TOOLTIP_CHARS:
+        lines.append(f"… ({len(text):,} characters – Ctrl+C copies the full value)")
+    return "\n".join(lines)
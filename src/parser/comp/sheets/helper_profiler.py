@@ -0,0 +1,171 @@
+# src/parser/comp/sheets/helper_profiler.py
+"""
+Opt-in instrumentation of the viewer's hot paths, switched in
+src/parser/.env (or the environment):
+
+    PARSER_PROFILE=1          timing spans + call counts
+    PARSER_PROFILE_MEMORY=1   + tracemalloc peak per stage (slow)
+    PARSER_PROFILE_DIR=logs   report directory, relative to the project root
+
+• @profiled("name")    – times every call of a function
+• with span("name"):   – times a block
+• report on exit       – logs/profile-<time>.txt (table) + .json
+
+Switched off, @profiled returns the function itself and span() a shared
+no-op context manager: no wrapper, no clock reads. Memory peaks are
+process-wide, so a stage overlapping one on another thread (background
+load) shares its peak.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+
+__all__ = ["ENABLED", "profiled", "span", "stats", "write_report"]
+
+_PARSER_DIR = Path(__file__).resolve().parents[2]        # src/parser
+_ROOT = _PARSER_DIR.parents[1]
+
+try:                                    # python-dotenv (declared dependency)
+    from dotenv import load_dotenv
+    load_dotenv(_PARSER_DIR / ".env")
+except ImportError:
+    pass
+
+
+def _flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+ENABLED = _flag("PARSER_PROFILE")
+MEMORY = ENABLED and _flag("PARSER_PROFILE_MEMORY")
+REPORT_DIR = _ROOT / os.getenv("PARSER_PROFILE_DIR", "logs")
+
+_NULL = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("calls", "total", "max", "peak")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.peak = 0               # bytes above the stage's start, tracemalloc
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "total_s": self.total,
+                "mean_ms": self.total / self.calls * 1e3 if self.calls else 0.0,
+                "max_ms": self.max * 1e3, "peak_bytes": self.peak}
+
+
+_stages: dict[str, _Stage] = {}
+_lock = threading.Lock()
+_local = threading.local()              # per-thread stack of open memory spans
+_started = time.perf_counter()
+
+
+class _Span:
+    __slots__ = ("name", "memory", "t0", "base", "child_peak")
+
+    def __init__(self, name: str, memory: bool) -> None:
+        self.name = name
+        self.memory = memory and MEMORY
+
+    def __enter__(self):
+        if self.memory:
+            stack = _local.__dict__.setdefault("stack", [])
+            self.base = tracemalloc.get_traced_memory()[0]
+            self.child_peak = 0
+            tracemalloc.reset_peak()
+            stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        elapsed = time.perf_counter() - self.t0
+        peak = 0
+        if self.memory:
+            # reset_peak() in nested spans hides our peak: children hand
+            # theirs (absolute) up the stack
+            absolute = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            stack = _local.stack
+            stack.pop()
+            if stack:
+                stack[-1].child_peak = max(stack[-1].child_peak, absolute)
+            peak = absolute - self.base
+        with _lock:
+            st = _stages.get(self.name)
+            if st is None:
+                st = _stages[self.name] = _Stage()
+            st.calls += 1
+            st.total += elapsed
+            st.max = max(st.max, elapsed)
+            st.peak = max(st.peak, peak)
+        return False
+
+
+def span(name: str, memory: bool = True):
+    """Context manager timing one block (no-op unless PARSER_PROFILE)."""
+    return _Span(name, memory) if ENABLED else _NULL
+
+
+def profiled(name: str, memory: bool = True):
+    """
+    Decorator timing every call. Resolved at import: switched off it
+    returns the function unchanged. memory=False for per-cell hot paths
+    (tracemalloc bookkeeping would dwarf them).
+    """
+    def wrap(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            with _Span(name, memory):
+                return fn(*args, **kwargs)
+        return timed
+    return wrap
+
+
+# ── report ──────────────────────────────────────────────────────────
+def stats() -> dict[str, dict]:
+    with _lock:
+        return {name: st.to_dict() for name, st in sorted(_stages.items())}
+
+
+def write_report(directory: Path | None = None) -> Path | None:
+    """Dump the summary (text table + JSON) to `directory` (default logs/)."""
+    data = stats()
+    if not data:
+        return None
+    directory = Path(directory or REPORT_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    wall = time.perf_counter() - _started
+
+    lines = [f"parser profile {stamp}  wall {wall:.2f}s  memory={'on' if MEMORY else 'off'}",
+             f"{'stage':<28}{'calls':>10}{'total s':>10}{'mean ms':>10}{'max ms':>10}{'peak MiB':>10}"]
+    for name, s in sorted(data.items(), key=lambda kv: -kv[1]["total_s"]):
+        peak = f"{s['peak_bytes'] / 2**20:10.1f}" if MEMORY else f"{'-':>10}"
+        lines.append(f"{name:<28}{s['calls']:>10,}{s['total_s']:>10.3f}"
+                     f"{s['mean_ms']:>10.3f}{s['max_ms']:>10.2f}{peak}")
+
+    text = directory / f"profile-{stamp}.txt"
+    text.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (directory / f"profile-{stamp}.json").write_text(
+        json.dumps({"wall_s": wall, "memory": MEMORY, "stages": data}, indent=2))
+    return text
+
+
+if ENABLED:
+    if MEMORY:
+        tracemalloc.start()
+    atexit.register(write_report)
@@ -0,0 +1,83 @@
+# src/parser/comp/sheets/helper_row_heights.py
+from __future__ import annotations
+
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtWidgets import QStyle, QStyleOptionViewItem, QTableView
+
+__all__ = ["RowHeights"]
+
+_LINE_SEP = "\u2028"      # QStyledItemDelegate shows "\n" as a line separator
+
+
+class RowHeights:
+    """
+    Row heights for a QTableView without resizeRowsToContents().
+
+    • no word wrap (the sheets table) – a cell's height depends only on
+      its line count: measured once per (font, lines)
+    • word wrap – measured per (text, font, column width), bounded cache
+    • apply() resizes only the rows whose height actually changed
+
+    Heights match the default delegate (style CT_ItemViewItem + grid).
+    """
+
+    def __init__(self, table: QTableView, max_texts: int = 20_000) -> None:
+        self.table = table
+        self.max_texts = max_texts
+        self._by_lines: dict[tuple[str, int], int] = {}
+        self._by_text: dict[tuple[str, int, str], int] = {}
+
+    def apply(self) -> None:
+        model = self.table.model()
+        if model is None:
+            return
+        hdr = self.table.verticalHeader()
+        floor = hdr.minimumSectionSize()
+        cols = [c for c in range(model.columnCount()) if not self.table.isColumnHidden(c)]
+        for row in range(model.rowCount()):
+            h = floor
+            for col in cols:
+                text = model.data(model.index(row, col), Qt.DisplayRole)
+                if text is not None:
+                    h = max(h, self.height(str(text), col))
+            if hdr.sectionSize(row) != h:
+                hdr.resizeSection(row, h)
+
+    def height(self, text: str, col: int) -> int:
+        font_key = self.table.font().key()
+        if not self.table.wordWrap():
+            lines = text.count("\n") + 1
+            key = (font_key, lines)
+            h = self._by_lines.get(key)
+            if h is None:
+                h = self._by_lines[key] = self._measure(_LINE_SEP.join("X" * lines))
+            return h
+
+        width = self.table.columnWidth(col)
+        key = (font_key, width, text)
+        h = self._by_text.get(key)
+        if h is None:
+            if len(self._by_text) >= self.max_texts:
+                self._by_text.clear()
+            h = self._by_text[key] = self._measure(text.replace("\n", _LINE_SEP), width)
+        return h
+
+    def clear(self) -> None:
+        """Forget measurements, e.g. after a font change."""
+        self._by_lines.clear()
+        self._by_text.clear()
+
+    # -------------------------------------------------------------------
+    def _measure(self, text: str, width: int | None = None) -> int:
+        t = self.table
+        opt = QStyleOptionViewItem()
+        opt.initFrom(t)
+        opt.font = t.font()
+        opt.fontMetrics = t.fontMetrics()
+        opt.text = text
+        opt.features = QStyleOptionViewItem.HasDisplay
+        if width is not None:
+            opt.features |= QStyleOptionViewItem.WrapText
+            opt.rect = QRect(0, 0, width, 0)
+        h = t.style().sizeFromContents(QStyle.CT_ItemViewItem, opt, QSize(), t).height()
+        return h + (1 if t.showGrid() else 0)
@@ -0,0 +1,102 @@
+# src/parser/comp/sheets/helper_stream_reader.py
+from __future__ import annotations
+
+import zipfile
+from itertools import islice
+from typing import Iterator
+from xml.etree import ElementTree
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from .helper_profiler import span
+
+__all__ = ["XlsxChunkReader", "CHUNK_ROWS", "sheet_names"]
+
+CHUNK_ROWS = 2_000      # rows per streamed DataFrame
+
+
+class XlsxChunkReader:
+    """
+    Streams one worksheet through openpyxl's read-only row iterator.
+
+    • header     – column titles of the first row (named like pd.read_excel)
+    • chunks()   – yields DataFrames of at most `chunk_rows` rows
+    • rows_read  – data rows parsed so far
+    • total_rows – row count from the sheet dimension (None if unknown)
+    """
+
+    def __init__(self, path, sheet_name: str | None = None,
+                 chunk_rows: int = CHUNK_ROWS) -> None:
+        self._wb = load_workbook(path, read_only=True, data_only=True)
+        ws = self._wb[sheet_name] if sheet_name else self._wb.worksheets[0]
+
+        self._rows = ws.iter_rows(values_only=True)
+        self.header: list = _mangle(next(self._rows, ()))
+        self.chunk_rows = chunk_rows
+        self.rows_read = 0
+        self.total_rows: int | None = ws.max_row - 1 if ws.max_row else None
+
+    # ── streaming ───────────────────────────────────────────────────
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        try:
+            while True:
+                with span("file_read.chunk"):
+                    batch = list(islice(self._rows, self.chunk_rows))
+                    frame = self._to_frame(batch) if batch else None
+                if frame is None:
+                    break
+                self.rows_read += len(frame)
+                if len(frame):
+                    yield frame
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._wb.close()
+
+    # ── internal helpers ────────────────────────────────────────────
+    def _to_frame(self, batch: list[tuple]) -> pd.DataFrame:
+        width = len(self.header)
+        rows = [
+            (r + (None,) * (width - len(r)))[:width]
+            for r in batch
+            if any(v is not None for v in r)      # read_excel skips blanks
+        ]
+        df = pd.DataFrame(rows, columns=self.header)
+
+        # empty cells: NaN like read_excel, not None
+        for col in df.columns[df.dtypes == object]:
+            s = df[col]
+            df[col] = s.where(s.notna(), np.nan)
+        return df
+
+
+def sheet_names(path) -> list[str]:
+    """
+    Sheet names in workbook order, from xl/workbook.xml only – no cell,
+    style or shared-string parsing. Non-zip workbooks (.xls) fall back
+    to pandas.
+    """
+    if not zipfile.is_zipfile(path):
+        with pd.ExcelFile(path) as xl:
+            return [str(n) for n in xl.sheet_names]
+    with zipfile.ZipFile(path) as zf:
+        root = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+    return [el.get("name") for el in root.iter() if el.tag.rsplit("}", 1)[-1] == "sheet"]
+
+
+def _mangle(header: tuple) -> list:
+    """Name blank / duplicate titles the way pd.read_excel does."""
+    seen: dict = {}
+    names = []
+    for i, title in enumerate(header):
+        name = f"Unnamed: {i}" if title is None else title
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
@@ -2,14 +2,15 @@
 from __future__ import annotations
 from PySide6.QtGui import QFontMetrics
 
+from .helper_preview import PREVIEW_CHARS
+
 def set_initial_sizing(view, model) -> None:
     tbl = view.table  # now a QTableView
     hdr = tbl.horizontalHeader()
 
-    # row heights
+    # row heights (fitted to contents by helper_row_heights.RowHeights)
     row_h = hdr.height()
     tbl.verticalHeader().setDefaultSectionSize(row_h)
-    tbl.resizeRowsToContents()
 
     # fixed “select” column
     tbl.setColumnWidth(view.COL_SELECT, 30)
@@ -21,7 +22,7 @@ def set_initial_sizing(view, model) -> None:
 
     # compute Value-column width using table’s font
     fm_value = tbl.fontMetrics()
-    val_w    = int(fm_value.averageCharWidth() * 0.85 * model.value_len)
+    val_w    = int(fm_value.averageCharWidth() * 0.85 * min(model.value_len, PREVIEW_CHARS))
     tbl.setColumnWidth(view.COL_VALUE, val_w)
 
     hdr.setStretchLastSection(True)
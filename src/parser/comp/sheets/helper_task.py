@@ -0,0 +1,71 @@
+# src/parser/comp/sheets/helper_task.py
+from __future__ import annotations
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+__all__ = ["Task", "TaskSignals", "TaskSet"]
+
+
+class TaskSignals(QObject):
+    """Base signals of a Task; subclasses add their results."""
+
+    failed: Signal = Signal(str)                # "Type: message"
+    done: Signal = Signal(object)               # the task, always last
+
+
+class Task(QRunnable):
+    """
+    Background job for the sheet controllers: work() runs on a pool
+    thread. Build it on the GUI thread – frames it reads are snapshots
+    taken there – and keep it alive until done (TaskSet).
+    """
+
+    Signals: type[TaskSignals] = TaskSignals
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = self.Signals()
+        self.cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def run(self) -> None:
+        try:
+            self.work()
+        except Exception as exc:                # reported, never raised into Qt
+            self.signals.failed.emit(f"{type(exc).__name__}: {exc}")
+        finally:
+            self.signals.done.emit(self)
+
+    def work(self) -> None:
+        raise NotImplementedError
+
+
+class TaskSet:
+    """Started tasks, each held until it emits done."""
+
+    def __init__(self) -> None:
+        self._tasks: set[Task] = set()
+
+    def start(self, task: Task, pool: QThreadPool | None = None, priority: int = 0) -> None:
+        task.signals.done.connect(self._tasks.discard)
+        self._tasks.add(task)
+        (pool or QThreadPool.globalInstance()).start(task, priority)
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def __iter__(self):
+        return iter(list(self._tasks))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
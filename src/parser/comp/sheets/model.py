@@ -1,24 +1,457 @@
 # src/parser/comp/sheets/model.py
 from __future__ import annotations
 
+import copy
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Sequence
+
 import pandas as pd
 
 from .model_row import RowModel
+from .model_card import Card
 from .model_card_table import CardTableModel
+from .helper_card_stats import column_stats
+from .helper_derived import ExpressionError, evaluate, field_names
+from .helper_stream_reader import XlsxChunkReader, CHUNK_ROWS, sheet_names
+from .helper_cache import WorkbookCache
+from .model_join import JoinResult, join_children
+from .helper_profiler import profiled
+from .helper_compact import CompactReport, compact_frame, default_enabled, widened
 
 __all__ = ["SheetsModel"]    # lowercase per PEP8
 
+MAX_SHEETS = 4          # parsed sheets kept in memory (LRU)
+CHECK_ROWS = 50         # rows a new derived card is test-evaluated on
+
+
+@dataclass(slots=True)
+class _Sheet:
+    """One parsed sheet: its rows, cards, stream – shared by share() copies."""
+    name: str | None
+    source_rows: RowModel | None = None     # rows before pre-processors
+    cardtable: CardTableModel | None = None
+    chunks: Iterator[pd.DataFrame] | None = None
+    total_rows: int | None = None
+    cache: WorkbookCache | None = None      # set until stored / restored
+    cache_key: str | None = None            # sheet part of the cache key
+    compact_report: CompactReport | None = None
+    joined: weakref.WeakSet = field(default_factory=weakref.WeakSet)   # join views, any window
+
+
+@dataclass(slots=True)
+class _View:
+    """One SheetsModel's own state on a sheet (see share())."""
+    sheet: _Sheet
+    base: RowModel                          # cursor over sheet.source_rows
+    rows: RowModel                          # base, or a pre-processed view
+
+
 class SheetsModel:
     """
     Aggregates a RowModel + CardTableModel.
     Controllers and the Qt‐table model read only from this façade.
+
+    With stream=True only the header and the first chunk of rows are
+    parsed here; the rest comes from pending_chunks() and is folded in
+    through append_chunk() (see controller_loader.SheetsLoader).
+
+    With a WorkbookCache an unchanged workbook is restored from disk
+    (DataFrame + card stats) without parsing; a miss is stored once
+    the workbook is fully loaded.
+
+    Sheets: `sheet_names` comes from the workbook metadata; a sheet is
+    parsed when first selected (select_sheet) and keeps its own RowModel
+    and CardTableModel in an LRU of `max_sheets`. rows / cardtable and
+    everything below always refer to the current sheet.
+
+    compact=True (default: PARSER_COMPACT in .env) swaps each fully
+    loaded sheet's DataFrame for a memory-compact copy before it is
+    cached; compact_report holds the per-column memory before / after.
+
+    share() makes a SheetsModel for another window on the same workbook:
+    the parsed sheets (frames, cards and their layout) are shared, the
+    current sheet, join view, filter and row are each window's own.
+
+    Derived cards (add_derived) are expressions over the other cards,
+    evaluated a whole column at a time (helper_derived) and only when
+    something needs the values – ensure_derived() from whatever shows or
+    exports them. A join view starts uncomputed and derives its own.
     """
 
-    def __init__(self, path_or_df):
-        df = path_or_df if isinstance(path_or_df, pd.DataFrame) \
-                        else pd.read_excel(path_or_df)
-        self.rows      = RowModel(df)
-        self.cardtable = CardTableModel.load_from_df(df)
+    def __init__(self, path_or_df, *, sheet: str | None = None,
+                 stream: bool = False,
+                 chunk_rows: int = CHUNK_ROWS,
+                 cache: WorkbookCache | None = None,
+                 max_sheets: int = MAX_SHEETS,
+                 compact: bool | None = None):
+        self._path = path_or_df
+        self._is_frame = isinstance(path_or_df, pd.DataFrame)
+        self._stream = stream
+        self._chunk_rows = chunk_rows
+        self._workbook_cache = None if self._is_frame else cache
+        self._sheet_names: list[str] | None = None
+        self.max_sheets = max(1, max_sheets)
+        self.compact = default_enabled() if compact is None else compact
+
+        # parsed sheets, least recently selected first
+        self._sheets: OrderedDict[str | None, _Sheet] = OrderedDict()
+        self._views: dict[str | None, _View] = {}     # this model's rows per sheet
+        self._sheet = self._open_sheet(sheet)
+        self._sheets[self._sheet.name] = self._sheet
+        if not self.loading:
+            self._store_in_cache()
+
+    def _open_sheet(self, name: str | None) -> _Sheet:
+        """Parse one sheet (or restore it from the cache) into a _Sheet."""
+        if not self._is_frame and name is None and self.sheet_names:
+            name = self.sheet_names[0]
+        first = self.sheet_names[0] if self.sheet_names else None
+        sheet = _Sheet(name)
+        sheet.cache_key = None if name == first else name   # first sheet: plain key
+        sheet.cache = self._workbook_cache
+
+        hit = sheet.cache.load(self._path, sheet.cache_key) if sheet.cache is not None else None
+        if hit is not None:
+            df, stats = hit
+            sheet.cache = None                      # nothing to store back
+            sheet.cardtable = CardTableModel.from_stats(df.columns, stats)
+            sheet.cardtable.apply_profiles(
+                self._workbook_cache.load_profiles(self._path, sheet.cache_key))
+        else:
+            df = self._read(sheet, self._stream, self._chunk_rows)
+            sheet.cardtable = CardTableModel.load_from_df(df)
+
+        sheet.source_rows = RowModel(df)            # rows before pre-processors
+        if sheet.chunks is None:
+            self._compact(sheet)
+        return sheet
+
+    @profiled("file_read")
+    def _read(self, sheet: _Sheet, stream: bool, chunk_rows: int) -> pd.DataFrame:
+        if self._is_frame:
+            return self._path
+        if not stream:
+            return pd.read_excel(self._path, sheet_name=sheet.name or 0)
+
+        reader = XlsxChunkReader(self._path, sheet_name=sheet.name, chunk_rows=chunk_rows)
+        sheet.chunks = reader.chunks()
+        sheet.total_rows = reader.total_rows
+        df = next(sheet.chunks, None)
+        if df is None:                              # header-only sheet
+            sheet.chunks = None
+            return pd.DataFrame(columns=reader.header)
+        return df
+
+    # ── sheets ─────────────────────────────────────────────────────
+    @property
+    def sheet_names(self) -> list[str]:
+        """All sheets of the workbook, from its metadata (no cells parsed)."""
+        if self._sheet_names is None:
+            self._sheet_names = [] if self._is_frame else sheet_names(self._path)
+        return self._sheet_names
+
+    @property
+    def sheet_name(self) -> str | None:
+        return self._sheet.name
+
+    @property
+    def loaded_sheets(self) -> list[str | None]:
+        """Sheets held in memory, least recently selected first."""
+        return list(self._sheets)
+
+    def select_sheet(self, name: str) -> bool:
+        """
+        Make `name` the current sheet. Parsed on first selection (or
+        streamed, with stream=True – then `loading` is true again), and
+        kept in an LRU of `max_sheets` parsed sheets. Returns True when
+        the sheet had to be parsed.
+        """
+        if name == self._sheet.name:
+            return False
+        if self.loading:
+            raise RuntimeError("select_sheet: current sheet is still loading")
+        if name not in self.sheet_names:
+            raise KeyError(f"select_sheet: no sheet named {name!r}")
+
+        sheet = self._sheets.get(name)
+        parsed = sheet is None
+        if parsed:
+            sheet = self._sheets[name] = self._open_sheet(name)
+        elif sheet.chunks is not None:
+            raise RuntimeError(f"select_sheet: {name!r} is still loading in another window")
+        self._sheets.move_to_end(name)
+        self._sheet = sheet
+        while len(self._sheets) > self.max_sheets:
+            self._sheets.popitem(last=False)          # current one is last
+        self._views = {n: v for n, v in self._views.items()
+                       if self._sheets.get(n) is v.sheet or v.sheet is sheet}
+        if parsed and not self.loading:
+            self._store_in_cache()
+        return parsed
+
+    def share(self) -> "SheetsModel":
+        """Another SheetsModel on the same parsed sheets, for a second window."""
+        if self.loading:
+            raise RuntimeError("share: workbook is still loading")
+        other = copy.copy(self)                     # settings; the same _sheets LRU
+        other._views = {}
+        return other
+
+    # ── current sheet ──────────────────────────────────────────────
+    @property
+    def rows(self) -> RowModel:
+        return self._view.rows
+
+    @rows.setter
+    def rows(self, rows: RowModel) -> None:
+        self._view.rows = rows
+
+    @property
+    def _view(self) -> _View:
+        sheet = self._sheet
+        view = self._views.get(sheet.name)
+        if view is None or view.sheet is not sheet:
+            base = sheet.source_rows.view()
+            view = self._views[sheet.name] = _View(sheet, base, base)
+        return view
+
+    @property
+    def cardtable(self) -> CardTableModel:
+        return self._sheet.cardtable
+
+    @property
+    def source_frame(self) -> pd.DataFrame:
+        """Current sheet before pre-processors; column i belongs to card id i."""
+        return self._source_rows._df
+
+    def profile_store(self) -> Callable[[dict], bool] | None:
+        """
+        Writer merging column profiles into the current sheet's cache
+        entry (WorkbookCache.store_profiles); call it off the GUI thread.
+        None without a cache.
+        """
+        cache = self._workbook_cache
+        if cache is None:
+            return None
+        path, key = self._path, self._sheet.cache_key
+        return lambda profiles: cache.store_profiles(path, profiles, key)
+
+    @property
+    def _source_rows(self) -> RowModel:
+        return self._sheet.source_rows
+
+    # ── pre-processors ─────────────────────────────────────────────
+    def join_children(self, columns: Sequence[int], sep: str = "\n",
+                      sort_by: Sequence[int] | None = None) -> JoinResult:
+        """
+        Swap in a joined-children view of the loaded rows (model_join);
+        `columns` and `sort_by` are card ids (see card_ids).
+        """
+        if self.loading:
+            raise RuntimeError("join_children: workbook is still loading")
+        used = {*columns, *(sort_by or ())}
+        self.ensure_derived((c for c in self.cardtable.cards if c.id in used), source=True)
+        result = join_children(self._source_rows, columns, sep, sort_by=sort_by)
+        self.rows = result.rows
+        self._sheet.joined.add(result.rows)
+        return result
+
+    def clear_join(self) -> None:
+        view = self._view
+        view.rows = view.base
+
+    @property
+    def joined(self) -> bool:
+        return not self.rows.same_rows(self._source_rows)
+
+    # ── derived cards ──────────────────────────────────────────────
+    def add_derived(self, title: str, expression: str) -> Card:
+        """
+        New card computed from `expression` over the current sheet's cards,
+        appended last. Checked on the first CHECK_ROWS rows (raises
+        ExpressionError); the column itself is computed by ensure_derived().
+        """
+        if self.loading:
+            raise RuntimeError("add_derived: workbook is still loading")
+        title, expression = title.strip(), expression.strip()
+        if not title or not expression:
+            raise ValueError("a derived field needs a title and an expression")
+        if any(c.title == title for c in self.cardtable.cards):
+            raise ValueError(f"there is already a field named {title!r}")
+        self._derive(expression, self._source_rows._df.iloc[:CHECK_ROWS],
+                     self._cards_by_title(), nested=True)
+
+        # column first: orderChanged repaints, which may compute it at once;
+        # join views of every window get it too (card id == column)
+        for rows in (self._source_rows, *list(self._sheet.joined)):
+            rows.add_column(title)
+        return self.cardtable.add_derived(title, expression)
+
+    @profiled("derived_columns")
+    def ensure_derived(self, cards: Iterable[Card] | None = None, *,
+                       source: bool = False) -> list[int]:
+        """
+        Compute the derived ones among `cards` (None: all) – and the derived
+        cards they use – for the current rows (source=True: the rows
+        before pre-processors), unless done already. Returns the ids
+        computed now. An expression that fails on these rows fills its
+        column with "#ERROR …" instead of raising.
+        """
+        rows = self._source_rows if source else self.rows
+        ct = self.cardtable
+        by_title = self._cards_by_title()
+        todo: dict[int, Card] = {}
+        stack = [c for c in (ct.derived_cards() if cards is None else cards)
+                 if c.expression is not None]
+        while stack:
+            card = stack.pop()
+            if card.id in todo or rows.column_ready(card.id):
+                continue
+            todo[card.id] = card
+            stack.extend(c for t in field_names(card.expression)
+                         if (c := by_title.get(t)) is not None and c.expression is not None)
+
+        for cid in sorted(todo):                # a card only uses earlier ones
+            df = rows._df
+            try:
+                values = self._derive(todo[cid].expression, df, by_title)
+            except ExpressionError as exc:
+                values = pd.Series([f"#ERROR {exc}"] * len(df), index=df.index, dtype=object)
+            rows.set_column(cid, values)
+            ct.set_computed(cid, column_stats(values))
+        return sorted(todo)
+
+    def _derive(self, expression: str, df: pd.DataFrame, by_title: dict[str, Card],
+                nested: bool = False) -> pd.Series:
+        # ensure_derived: the derived fields used are computed columns of
+        # df by now; nested=True (add_derived's check) derives them too
+        fields = {}
+        for title in field_names(expression):
+            card = by_title.get(title)
+            if card is None:
+                continue                            # evaluate() names it
+            if nested and card.expression is not None:
+                fields[title] = self._derive(card.expression, df, by_title, nested)
+            else:
+                fields[title] = widened(df.iloc[:, card.id])    # compacted: no int8 wraparound
+        return evaluate(expression, fields, df.index)
+
+    def apply_layout(self, layout: dict) -> None:
+        """
+        Restore a card layout saved by cardtable.to_dict(): the derived
+        cards it lists are added first (unless the sheet has a field of
+        that title), then order and show / disable state are applied.
+        """
+        by_title = self._cards_by_title()
+        ids: dict[int, int] = {}                    # saved id → id on this sheet
+        for entry in layout.get("derived", ()):
+            card = by_title.get(entry["title"])
+            if card is None:
+                card = self.add_derived(entry["title"], entry["expression"])
+            ids[entry["id"]] = card.id
+        if ids:
+            cards = [{**e, "id": ids.get(e.get("id"), e.get("id"))} for e in layout.get("cards", ())]
+            layout = {**layout, "cards": cards}
+        self.cardtable.apply_dict(layout)
+
+    def card_ids(self, titles: Iterable[str]) -> list[int]:
+        """Card ids (column positions) of `titles`; duplicate headers: the first."""
+        by_title = self._cards_by_title()
+        if unknown := [t for t in titles if t not in by_title]:
+            raise ValueError(f"no field named {', '.join(map(repr, unknown))}")
+        return [by_title[t].id for t in titles]
+
+    def _cards_by_title(self) -> dict[str, Card]:
+        by_title: dict[str, Card] = {}
+        for card in self.cardtable.cards:
+            by_title.setdefault(card.title, card)   # duplicate headers: the first
+        return by_title
+
+    # ── streaming ──────────────────────────────────────────────────
+    @property
+    def loading(self) -> bool:
+        """True while streamed chunks are still outstanding."""
+        return self._sheet.chunks is not None
+
+    def pending_chunks(self) -> Iterator[pd.DataFrame]:
+        """Remaining streamed chunks; safe to iterate on a worker thread."""
+        chunks = self._sheet.chunks
+        if chunks is not None:
+            yield from chunks
+
+    def append_chunk(self, df: pd.DataFrame) -> None:
+        """Add a streamed chunk to the rows and the card statistics."""
+        self._source_rows.append(df)
+        self.cardtable.update_from_df(df)
+
+    def finish_loading(self, defer: bool = False) -> Callable[[], Callable[[], None]] | None:
+        """
+        Mark streaming complete, then compact the sheet (compact=True) and
+        write it to the cache. With defer, both are returned as a job for
+        a worker thread instead; the job returns a callable for the GUI
+        thread that swaps the compacted frame in.
+        """
+        sheet = self._sheet
+        sheet.chunks = None
+        if not defer:
+            self._compact(sheet)
+            self._store_in_cache()
+            return None
+
+        df = sheet.source_rows._df                  # merged now, on the GUI thread
+        compact = self.compact and sheet.compact_report is None
+        store = self._take_cache_job()
+
+        def job() -> Callable[[], None]:
+            frame, report = compact_frame(df) if compact else (df, None)
+            if store is not None:
+                store(frame)
+
+            def swap() -> None:
+                if report is not None and sheet.source_rows.replace_frame(df, frame):
+                    sheet.compact_report = report
+            return swap
+        return job
+
+    def stop_loading(self) -> None:
+        """Cancelled stream: keep the rows so far, never cache a partial sheet."""
+        self._sheet.chunks = None
+        self._sheet.cache = None
+
+    @property
+    def rows_total(self) -> int:
+        """Expected row count (sheet dimension) while loading, else row_count."""
+        total = self._sheet.total_rows
+        if self.loading and total:
+            return max(total, self.row_count)
+        return self.row_count
+
+    @property
+    def compact_report(self) -> CompactReport | None:
+        """Memory before / after compaction of the current sheet (compact=True)."""
+        return self._sheet.compact_report
+
+    def _compact(self, sheet: _Sheet) -> None:
+        # whole sheets only: streamed chunks would concat back to object
+        if self.compact and sheet.compact_report is None:
+            sheet.compact_report = sheet.source_rows.compact()
+
+    def _store_in_cache(self) -> None:
+        job = self._take_cache_job()
+        if job is not None:
+            job(self._sheet.source_rows._df)
+
+    def _take_cache_job(self) -> Callable[[pd.DataFrame], None] | None:
+        # the job writes the frame it is given (the current one, or a
+        # compacted copy of it made on a worker thread)
+        sheet = self._sheet
+        if sheet.cache is None:
+            return None
+        cache, path, key, sheet.cache = sheet.cache, self._path, sheet.cache_key, None
+        stats = sheet.cardtable.stats_to_list()
+        return lambda df: cache.store(path, df.copy(deep=False), stats, key)
 
     # ── convenience projections ────────────────────────────────────
     @property
@@ -33,6 +466,10 @@ class SheetsModel:
     def current_items(self) -> list[tuple[str, object]]:
         return self.rows.items()
 
+    @property
+    def current_values(self) -> list[object]:
+        return self.rows.values()
+
     @property
     def row_count(self) -> int:
         return self.rows.row_count
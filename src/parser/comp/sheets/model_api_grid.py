@@ -0,0 +1,182 @@
+# src/parser/comp/sheets/model_api_grid.py
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from .model import SheetsModel
+from .helper_preview import Preview, make_preview, tooltip_text
+from .helper_profiler import profiled
+
+__all__ = ["RowGridQtModel"]
+
+PAGE_ROWS = 1_000       # rows added per fetchMore
+GRID_CHARS = 120        # cell preview: one line, at most this many characters
+GRID_CACHE = 20_000     # formatted cells kept (LRU)
+
+# data() runs for every role of every painted cell: resolve the enum
+# members once (attribute lookups on Qt are slow in PySide)
+_DISPLAY, _TOOLTIP, _HORIZONTAL = Qt.DisplayRole, Qt.ToolTipRole, Qt.Horizontal
+
+
+class RowGridQtModel(QAbstractTableModel):
+    """
+    Spreadsheet view of the current RowModel: one row per (filtered)
+    row, one column per kept card (shown, not disabled – as exported)
+    in card order.
+
+    • rows are exposed page by page through canFetchMore / fetchMore,
+      so the view never asks for more rows than were scrolled to
+    • a cell is read (Series.iat) and formatted (one-line preview) only
+      when the view paints it; formatted cells are kept in an LRU keyed
+      by (DataFrame row, card) – nothing is built per cell up front
+    • a derived card's column is computed when its first cell is painted
+    """
+
+    def __init__(self, sheets_model: SheetsModel):
+        super().__init__()
+        self.sheets_model = sheets_model
+        self.cardtable = sheets_model.cardtable
+        self._rows = sheets_model.rows
+        self._cards = self._kept_cards()
+        self._loaded = min(PAGE_ROWS, self._rows.row_count)
+        self._frame = None                      # DataFrame the Series belong to
+        self._series: dict[int, object] = {}    # card id → column Series
+        self._cells: OrderedDict[tuple[int, int], Preview] = OrderedDict()
+        self._connect_cardtable(True)
+
+    # ─── Qt API: Structure ───────────────────────────────
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cards)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < self._rows.row_count
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self._fetch_to(self._loaded + PAGE_ROWS)
+
+    # ─── Qt API: Data ─────────────────────────────────────
+    @profiled("grid.data", memory=False)
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role != _DISPLAY and role != _TOOLTIP or not index.isValid():
+            return None
+        pos = self._rows.position_of(index.row())
+        card = self._cards[index.column()]
+        cell = self._cell(pos, card.id)
+        if role == _DISPLAY:
+            return cell.text
+        return tooltip_text(self._value(pos, card.id)) if cell.truncated else None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == _TOOLTIP and orientation == _HORIZONTAL and section < len(self._cards):
+            profile = self._cards[section].profile      # computed from the card view
+            return profile.summary() if profile is not None else None
+        if role != _DISPLAY:
+            return super().headerData(section, orientation, role)
+        if orientation == _HORIZONTAL:
+            return self._cards[section].title if section < len(self._cards) else None
+        return f"{section + 1:,}"
+
+    # ─── Public API ──────────────────────────────────────
+    def reset_rows(self, *_) -> None:
+        """Follow the SheetsModel's current rows / filter; back to the first page."""
+        self.beginResetModel()
+        self._rows = self.sheets_model.rows
+        self._loaded = min(PAGE_ROWS, self._rows.row_count)
+        self._cells.clear()
+        self._series.clear()
+        self._frame = None
+        self.endResetModel()
+
+    def rebind(self) -> None:
+        """Follow the SheetsModel to its current CardTableModel (sheet switch)."""
+        self._connect_cardtable(False)
+        self.cardtable = self.sheets_model.cardtable
+        self._connect_cardtable(True)
+        self._cards = self._kept_cards()
+        self.reset_rows()
+
+    def release(self) -> None:
+        """Stop following the card table (the window closes; the model may be shared)."""
+        self._connect_cardtable(False)
+
+    def ensure_loaded(self, row: int) -> None:
+        """Fetch pages up to view row `row` (go to a row not scrolled to yet)."""
+        if row >= self._loaded:
+            self._fetch_to(row + PAGE_ROWS)
+
+    def grow(self, *_) -> None:
+        """Streamed rows arrived: fill the first page if it is still short."""
+        if self._loaded < PAGE_ROWS:
+            self._fetch_to(PAGE_ROWS)
+
+    # ─── Internal ────────────────────────────────────────
+    def _fetch_to(self, rows: int) -> None:
+        end = min(rows, self._rows.row_count)
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+
+    def _cell(self, pos: int, card_id: int) -> Preview:
+        key = (pos, card_id)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = make_preview(self._value(pos, card_id),
+                                                   max_chars=GRID_CHARS, max_lines=1)
+            if len(self._cells) > GRID_CACHE:
+                self._cells.popitem(last=False)
+        else:
+            self._cells.move_to_end(key)
+        return cell
+
+    def _value(self, pos: int, card_id: int):
+        df = self._rows._df
+        if df is not self._frame:               # streamed chunks merged
+            self._frame = df
+            self._series.clear()
+        series = self._series.get(card_id)
+        if series is None:
+            card = self.cardtable.by_id(card_id)
+            if card.expression is not None and self.sheets_model.ensure_derived([card]):
+                return self._value(pos, card_id)        # computed: a new frame
+            series = self._series[card_id] = df.iloc[:, card_id]
+        return series.iat[pos]
+
+    def _kept_cards(self) -> list:
+        return [c for c in self.cardtable.ordered_cards() if c.show and not c.disabled]
+
+    def _on_cards_changed(self, *_) -> None:
+        cards = self._kept_cards()
+        if [c.id for c in cards] == [c.id for c in self._cards]:
+            return
+        self.beginResetModel()                  # keeps the fetched rows
+        self._cards = cards
+        self.endResetModel()
+
+    def _on_derived_ready(self, card_id: int) -> None:
+        self._series.pop(card_id, None)
+        for key in [k for k in self._cells if k[1] == card_id]:
+            del self._cells[key]
+        column = next((i for i, c in enumerate(self._cards) if c.id == card_id), None)
+        if column is not None and self._loaded:
+            self.dataChanged.emit(self.index(0, column), self.index(self._loaded - 1, column))
+
+    def _connect_cardtable(self, on: bool) -> None:
+        ct = self.cardtable
+        for signal, slot in ((ct.orderChanged, self._on_cards_changed),
+                             (ct.visibilityChanged, self._on_cards_changed),
+                             (ct.cardMoved, self._on_cards_changed),
+                             (ct.cardStateChanged, self._on_cards_changed),
+                             (ct.derivedReady, self._on_derived_ready)):
+            if on:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
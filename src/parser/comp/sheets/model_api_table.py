@@ -1,18 +1,41 @@
 # src/parser/comp/sheets/model_api_table.py
+from collections import OrderedDict
 
 from PySide6.QtCore import (
     Qt,
     QAbstractTableModel,
     QModelIndex,
     QMimeData,
+    QByteArray,
     QSignalBlocker,
+    Signal,
 )
 from .model import SheetsModel
 from .helper_tri_state import TRI_FLAG
+from .helper_profiler import profiled
+from .helper_preview import Preview, make_preview, tooltip_text
 
 __all__ = ["CardTableQtModel"]
 
+PREVIEW_CACHE = 8_192    # (row, card) previews kept across navigation
+
+
 class CardTableQtModel(QAbstractTableModel):
+    """
+    ✓ | Field | Value for the current row of a SheetsModel.
+
+    The Value column shows a bounded preview (helper_preview), cached
+    per (DataFrame row, card); the full value is only stringified on
+    demand – ToolTipRole, full_text() for the detail pane and copy.
+
+    The Field tooltip is the card's column profile; a card without one
+    emits profileWanted(card_id) (→ ProfileController.request).
+    A derived card's column is computed when its value is first shown
+    (SheetsModel.ensure_derived).
+    """
+
+    profileWanted: Signal = Signal(int)
+
     def __init__(self, sheets_model: SheetsModel):
         super().__init__()
         self.sheets_model = sheets_model
@@ -20,8 +43,17 @@ class CardTableQtModel(QAbstractTableModel):
         self._show_all = False
         self._drag_ids = []
 
-        self.cardtable.orderChanged.connect(self._reset_model)
-        self.cardtable.visibilityChanged.connect(self._reset_model)
+        # row → card mapping; rebuilt only on order / visibility changes
+        self._cards_cache: list | None = None
+        # current-row snapshot (keyed by DataFrame position);
+        # dropped on NavigationController.rowChanged
+        self._row_key: int | None = None
+        self._row_values: list = []
+        # (DataFrame row, card id) → Preview, LRU; valid for _preview_rows
+        self._previews: OrderedDict[tuple[int, int], Preview] = OrderedDict()
+        self._preview_rows = None
+
+        self._connect_cardtable(True)
 
     # ─── Public properties ───────────────────────────────
     @property
@@ -36,12 +68,13 @@ class CardTableQtModel(QAbstractTableModel):
 
     # ─── Qt API: Structure ───────────────────────────────
     def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._visible_cards())
+        return 0 if parent.isValid() else len(self._visible_cards())
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return 3
+        return 0 if parent.isValid() else 3
 
     # ─── Qt API: Data ─────────────────────────────────────
+    @profiled("qt.data", memory=False)
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
@@ -50,10 +83,39 @@ class CardTableQtModel(QAbstractTableModel):
             return Qt.PartiallyChecked if card.disabled else Qt.Checked if card.show else Qt.Unchecked
         if index.column() == 1 and role == Qt.DisplayRole:
             return card.title
+        if index.column() == 1 and role == Qt.ToolTipRole:
+            return self._profile_tip(card)
         if index.column() == 2 and role == Qt.DisplayRole:
-            return str(self.sheets_model.current_items[card.id][1])
+            return self._preview(card).text
+        if index.column() == 2 and role == Qt.ToolTipRole:
+            if self._preview(card).truncated:
+                return tooltip_text(self._row_value(card))
         return None
 
+    def full_text(self, row: int) -> str | None:
+        """Untruncated Value text of a table row (detail pane, copy)."""
+        card = self._card_by_row(row)
+        return None if card is None else str(self._row_value(card))
+
+    def is_truncated(self, row: int) -> bool:
+        card = self._card_by_row(row)
+        return card is not None and self._preview(card).truncated
+
+    # ─── Preview cache (RowPrefetcher) ────────────────────
+    def has_previews(self, position: int) -> bool:
+        self._sync_previews()
+        return (position, 0) in self._previews
+
+    def store_previews(self, rows, position: int, previews: list) -> None:
+        """Previews of every card for DataFrame row `position` of `rows`."""
+        self._sync_previews()
+        if rows is not self._preview_rows:          # prefetched for other rows
+            return
+        for card_id, preview in enumerate(previews):
+            self._previews.setdefault((position, card_id), preview)
+        while len(self._previews) > PREVIEW_CACHE:
+            self._previews.popitem(last=False)
+
     def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
         if (
             index.isValid()
@@ -66,8 +128,8 @@ class CardTableQtModel(QAbstractTableModel):
             except ValueError:
                 return False
             card = self._card_by_row(index.row())
+            # → cardStateChanged → _on_card_changed repaints / removes the row
             self.cardtable.update_visibility(card.id, state)
-            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
             return True
         return False
 
@@ -94,7 +156,10 @@ class CardTableQtModel(QAbstractTableModel):
         return ["application/x-qabstractitemmodeldatalist"]
 
     def mimeData(self, indexes):
-        md = super().mimeData(indexes)
+        # internal moves only: dropMimeData works from _drag_ids, so skip
+        # the default payload (itemData() of every role for every cell)
+        md = QMimeData()
+        md.setData(self.mimeTypes()[0], QByteArray())
         self._drag_ids = {
             self._card_by_row(ix.row()).id
             for ix in indexes
@@ -107,15 +172,16 @@ class CardTableQtModel(QAbstractTableModel):
             return super().dropMimeData(mime, action, row, column, parent)
 
         dest_row = self._resolve_drop_row(row, parent)
-        full_ids = [c.id for c in sorted(self.cardtable.cards, key=lambda c: c.order)]
-        vis_ids = [cid for cid in full_ids if self.cardtable.by_id(cid).show or self._show_all]
+        full_ids = [c.id for c in self.cardtable.ordered_cards()]
+        vis_ids = [c.id for c in self._visible_cards()]
+        vis_row = {cid: i for i, cid in enumerate(vis_ids)}
 
-        try:
-            old_indexes = [vis_ids.index(cid) for cid in self._drag_ids]
-        except ValueError:
+        if not all(cid in vis_row for cid in self._drag_ids):
             return False
+        old_indexes = [vis_row[cid] for cid in self._drag_ids]
 
         first, last = min(old_indexes), max(old_indexes)
+        qt_dest = dest_row                  # Qt wants the pre-move row
         if dest_row > last:
             dest_row -= (last - first + 1)
         if first <= dest_row <= last:
@@ -126,20 +192,152 @@ class CardTableQtModel(QAbstractTableModel):
         new_vis = new_vis[:dest_row] + moving + new_vis[dest_row:]
         new_full = self._rebuild_full_ids(full_ids, vis_ids, new_vis)
 
-        self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), dest_row)
+        if not self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), qt_dest):
+            return False
         with QSignalBlocker(self.cardtable):
             self.cardtable.reorder_by_list(new_full)
+        self._cards_cache = None
         self.endMoveRows()
         return True
 
     # ─── Internal Sync ────────────────────────────────────
+    @profiled("qt._reset_model")
     def _reset_model(self):
         self.beginResetModel()
+        self._cards_cache = None
         self.endResetModel()
 
+    def _on_card_changed(self, card_id: int, *_) -> None:
+        """
+        One card moved or changed state: emit only the row-level change
+        (dataChanged / rowsInserted / rowsRemoved / rowsMoved). Anything
+        beyond that one card falls back to a reset.
+        """
+        old = [c.id for c in self._visible_cards()]
+        new_cards = self._sorted_visible()
+        new = [c.id for c in new_cards]
+
+        if old == new:
+            if card_id in new:
+                row = new.index(card_id)
+                self.dataChanged.emit(self.index(row, 0),
+                                      self.index(row, self.columnCount() - 1))
+            return
+        if [i for i in old if i != card_id] != [i for i in new if i != card_id]:
+            self._reset_model()
+            return
+
+        root = QModelIndex()
+        if card_id in old and card_id in new:
+            src, dst = old.index(card_id), new.index(card_id)
+            # Qt's destination is the row *before which* it lands, pre-move
+            self.beginMoveRows(root, src, src, root, dst + 1 if dst > src else dst)
+            self._cards_cache = new_cards
+            self.endMoveRows()
+            self.dataChanged.emit(self.index(dst, 0), self.index(dst, self.columnCount() - 1))
+        elif card_id in new:
+            row = new.index(card_id)
+            self.beginInsertRows(root, row, row)
+            self._cards_cache = new_cards
+            self.endInsertRows()
+        else:
+            row = old.index(card_id)
+            self.beginRemoveRows(root, row, row)
+            self._cards_cache = new_cards
+            self.endRemoveRows()
+
+    def _connect_cardtable(self, on: bool) -> None:
+        ct = self.cardtable
+        for signal, slot in ((ct.orderChanged, self._reset_model),
+                             (ct.visibilityChanged, self._reset_model),
+                             (ct.cardMoved, self._on_card_changed),
+                             (ct.cardStateChanged, self._on_card_changed),
+                             (ct.profileReady, self._on_profile_ready),
+                             (ct.derivedReady, self._on_derived_ready)):
+            if on:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
+
+    def rebind(self) -> None:
+        """Follow the SheetsModel to its current CardTableModel (sheet switch)."""
+        self._connect_cardtable(False)
+        self.cardtable = self.sheets_model.cardtable
+        self._connect_cardtable(True)
+        self._row_key = None
+        self._reset_model()
+
+    def release(self) -> None:
+        """Stop following the card table (the window closes; the model may be shared)."""
+        self._connect_cardtable(False)
+
+    def invalidate_row(self, *_):
+        """Drop the current-row snapshot (connected to rowChanged)."""
+        self._row_key = None
+
     # ─── Private Helpers ──────────────────────────────────
+    def _profile_tip(self, card) -> str:
+        if card.profile is not None:
+            return f"{card.title}\n{card.profile.summary()}"
+        if self.sheets_model.loading:
+            return f"{card.title}\n(profile once the sheet has loaded)"
+        self.profileWanted.emit(card.id)
+        return f"{card.title}\nprofiling…"
+
+    def _on_profile_ready(self, card_id: int) -> None:
+        cards = self._visible_cards()
+        for row, card in enumerate(cards):
+            if card.id == card_id:
+                idx = self.index(row, 1)
+                self.dataChanged.emit(idx, idx, [Qt.ToolTipRole])
+                break
+
+    def _on_derived_ready(self, card_id: int) -> None:
+        self._row_key = None
+        for key in [k for k in self._previews if k[1] == card_id]:
+            del self._previews[key]
+        for row, card in enumerate(self._visible_cards()):
+            if card.id == card_id:
+                self.dataChanged.emit(self.index(row, 2), self.index(row, 2))
+                break
+
     def _visible_cards(self) -> list:
-        return sorted(self.cardtable.visible_cards(self._show_all), key=lambda c: c.order)
+        if self._cards_cache is None:
+            self._cards_cache = self._sorted_visible()
+        return self._cards_cache
+
+    def _sorted_visible(self) -> list:
+        return self.cardtable.visible_cards(self._show_all)       # display order
+
+    def _row_value(self, card):
+        if card.expression is not None:
+            self.sheets_model.ensure_derived([card])
+        idx = self.sheets_model.rows.position
+        if self._row_key != idx:
+            self._row_values = self.sheets_model.current_values
+            self._row_key = idx
+        return self._row_values[card.id]
+
+    def _sync_previews(self) -> None:
+        rows = self.sheets_model.rows
+        if rows is not self._preview_rows:          # join / sheet switch
+            self._previews.clear()
+            self._preview_rows = rows
+            self._row_key = None
+
+    def _preview(self, card) -> Preview:
+        self._sync_previews()
+        if card.expression is not None:             # prefetched before it was computed
+            self.sheets_model.ensure_derived([card])
+        key = (self._preview_rows.position, card.id)
+        preview = self._previews.get(key)
+        if preview is None:
+            preview = self._previews[key] = make_preview(self._row_value(card))
+            if len(self._previews) > PREVIEW_CACHE:
+                self._previews.popitem(last=False)
+        else:
+            self._previews.move_to_end(key)
+        return preview
 
     def _card_by_row(self, row: int):
         cards = self._visible_cards()
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
+from .helper_column_profile import ColumnProfile
+
 
 # ─────────────────── helpers ───────────────────
 
@@ -43,6 +45,10 @@ class _CardOrder:
         #   reset order position to previous
         self._current, self._previous = self._previous, self._current
 
+    def _shift(self, pos: int) -> None:
+        #   moved by another card's move: previous stays
+        self._current = pos
+
 
 # ───────────────────── Card ─────────────────────
 
@@ -53,12 +59,19 @@ class Card:
     size: _CardSize
     _order: _CardOrder
     _state: _CardState = _CardState.VISIBLE
+    profile: ColumnProfile | None = None    # computed on demand (ProfileController)
+    expression: str | None = None           # derived card (helper_derived), else a sheet column
 
     # read-only ----------------------------
     @property
     def order(self) -> int:
         return self._order._current
 
+    @property
+    def state(self) -> str:
+        """"VISIBLE", "HIDDEN" or "DISABLED"."""
+        return self._state.name
+
     @property
     def disabled(self) -> bool:
         return self._state is _CardState.DISABLED
@@ -89,6 +102,9 @@ class Card:
     def _restore_order(self) -> None:
         self._order._reset()
 
+    def _shift_to(self, pos: int) -> None:
+        self._order._shift(pos)
+
     # serialisation ----------------------------------------------------
     def to_dict(self) -> dict:
         as_int = int        # shorthand
@@ -6,6 +6,9 @@ from typing import Iterable, List
 import pandas as pd
 from PySide6.QtCore import QObject, Signal, Qt
 from .model_card import Card, _CardSize, _CardOrder
+from .helper_card_stats import EMPTY, LenStats, column_stats, frame_stats
+from .helper_column_profile import ColumnProfile
+from .helper_profiler import profiled
 
 
 class CardTableModel(QObject):
@@ -13,37 +16,56 @@ class CardTableModel(QObject):
     Column metadata holder.
 
     • Keeps original order and tri-state visibility for every column.
+    • Indexed: id → card dict and a position → id order array; each
+      card's order is its index in that array (moves shift the others).
     • Computes once:
          - _title_len   – longest header (chars) → widget “Field” width
          - _value_len   – typical cell len  (chars) → widget “Value” width
-    • Emits orderChanged / visibilityChanged when columns are reordered
-      or disabled/enabled.
+    • Emits, per card:
+         - cardMoved(id, old order, new order)
+         - cardStateChanged(id, old state, new state)   (Card.state names)
+      and for bulk edits (reorder_by_list, apply_dict) orderChanged /
+      visibilityChanged; statsChanged when streamed rows update sizes;
+      profileReady(id) when a card's column profile was computed.
+    • Derived cards (add_derived) follow the sheet's columns: next id,
+      last in order, size 0/0/0 until their values are computed
+      (set_computed → derivedReady(id)). They are left out of the
+      cached stats and profiles, which describe the sheet itself.
     """
 
     orderChanged: Signal = Signal()
     visibilityChanged: Signal = Signal()
+    statsChanged: Signal = Signal()
+    cardMoved: Signal = Signal(int, int, int)
+    cardStateChanged: Signal = Signal(int, str, str)
+    profileReady: Signal = Signal(int)
+    derivedReady: Signal = Signal(int)
 
     # -----------------------------------------------------------------
     def __init__(self, cards: List[Card]) -> None:
         super().__init__()
-        self._cards = cards
+        self._cards = cards                                 # id (column) order
+        self._by_id: dict[int, Card] = {c.id: c for c in cards}
+        self._order: list[int] = []                         # position → id
+        self._renumber()
+        # per-card length stats incl. count/total → running avg while streaming
+        self._len_acc: dict[int, LenStats] = {}
 
         # pre-computed stats for the whole table
         self._title_len: int = max((len(c.title) for c in cards), default=0)
         self._value_len: int = self._calc_avg_value_len()
 
     def by_id(self, cid: int) -> Card:
-        return next(c for c in self._cards if c.id == cid)
+        return self._by_id[cid]
 
     # ── visibility API ─────────────────────────────────────────────
-    def update_visibility(self, row: int, state: Qt.CheckState) -> None:
+    def update_visibility(self, card_id: int, state: Qt.CheckState) -> None:
         """
         Updates the card's .show and .disabled flags based on tri-state checkbox.
-        Emits visibilityChanged if the state changes.
+        Emits cardStateChanged if the state changes.
         """
-        card = self._cards[row]
-        prev_show = card.show
-        prev_disabled = card.disabled
+        card = self._by_id[card_id]
+        prev = card.state
 
         if state == Qt.Checked:
             card.set_disabled(False)
@@ -55,63 +77,194 @@ class CardTableModel(QObject):
             card.set_disabled(True)
             card.show = False
 
-        if (card.show != prev_show) or (card.disabled != prev_disabled):
-            self.visibilityChanged.emit()
+        if card.state != prev:
+            self.cardStateChanged.emit(card.id, prev, card.state)
 
     def visible_cards(self, show_all: bool) -> list[Card]:
-        """Return either all cards (if show_all) or only those with card.show."""
-        return list(self._cards) if show_all else [c for c in self._cards if c.show]
+        """All cards (if show_all) or only those with card.show, in display order."""
+        cards = self.ordered_cards()
+        return cards if show_all else [c for c in cards if c.show]
+
+    def ordered_cards(self) -> list[Card]:
+        """Every card in display order."""
+        by_id = self._by_id
+        return [by_id[cid] for cid in self._order]
 
     # ── ordering API ────────────────────────────────────────────────
     def reorder(self, card_id: int, pos: int) -> None:
-        """Re-orders a single card by ID → position, emits orderChanged."""
-        self._cards[card_id]._move_to(pos)
-        self.orderChanged.emit()
+        """Move one card to `pos` (the cards between shift by one), emits cardMoved."""
+        card = self._by_id[card_id]
+        prev = card.order
+        self._move(card, pos)
+        if card.order != prev:
+            self.cardMoved.emit(card.id, prev, card.order)
 
     def reorder_by_list(self, new_id_order: List[int]) -> None:
         """
         Re-orders all cards to match the given list of IDs, updating each
         card’s ._order._current accordingly and emitting orderChanged.
+        Cards missing from the list follow in their current order.
         """
-        id2card = {c.id: c for c in self._cards}
-        for idx, cid in enumerate(new_id_order):
-            id2card[cid]._move_to(idx)
+        listed = dict.fromkeys(cid for cid in new_id_order if cid in self._by_id)
+        order = list(listed) + [cid for cid in self._order if cid not in listed]
+        for idx, cid in enumerate(order):
+            self._by_id[cid]._move_to(idx)
+        self._order = order
         self.orderChanged.emit()
 
     def disable(self, card_id: int) -> None:
-        """Disable a card (moves it to end) and emit both order and visibility signals."""
-        card = next(c for c in self._cards if c.id == card_id)
+        """Disable a card (moves it to end), emit cardMoved + cardStateChanged."""
+        card = self._by_id[card_id]
         if card.disabled:
             return
-        card._move_to(len(self._cards) - 1)
+        prev_order, prev_state = card.order, card.state
+        self._move(card, len(self._order) - 1)
         card.set_disabled(True)
-        self.orderChanged.emit()
-        self.visibilityChanged.emit()
+        self._emit_card(card, prev_order, prev_state)
 
     def enable(self, card_id: int) -> None:
         """Re-enable a disabled card, restoring its previous order."""
-        card = next(c for c in self._cards if c.id == card_id)
+        card = self._by_id[card_id]
         if not card.disabled:
             return
+        prev_order, prev_state = card.order, card.state
         card.set_disabled(False)
-        card._restore_order()
+        self._move(card, card._order._previous)
+        self._emit_card(card, prev_order, prev_state)
+
+    # ── order array ─────────────────────────────────────────────────
+    def _move(self, card: Card, pos: int) -> None:
+        """
+        Move `card` to `pos` in the order array: one list pop/insert, and
+        only the cards in between are renumbered (they keep `previous`).
+        """
+        pos = max(0, min(pos, len(self._order) - 1))
+        src = card.order
+        if pos == src:
+            return
+        card._move_to(pos)                              # records previous = src
+        self._order.insert(pos, self._order.pop(src))
+        for i in range(min(src, pos), max(src, pos) + 1):
+            if self._order[i] != card.id:
+                self._by_id[self._order[i]]._shift_to(i)
+
+    def _emit_card(self, card: Card, prev_order: int, prev_state: str) -> None:
+        if card.order != prev_order:
+            self.cardMoved.emit(card.id, prev_order, card.order)
+        if card.state != prev_state:
+            self.cardStateChanged.emit(card.id, prev_state, card.state)
+
+    # ── streaming ───────────────────────────────────────────────────
+    @profiled("card_stats.update")
+    def update_from_df(self, df: pd.DataFrame) -> None:
+        """
+        Fold a streamed chunk (same columns as the cards) into every
+        card's size stats and refresh value_len; emits statsChanged.
+        """
+        for card, (_, series) in zip(self._cards, df.items()):
+            chunk = column_stats(series)
+            if not chunk.count:
+                continue
+            acc = self._len_acc[card.id] = self._len_acc.get(card.id, EMPTY).merge(chunk)
+            card.size = _CardSize(min=acc.min, avg=acc.avg, max=acc.max)
+
+        self._value_len = self._calc_avg_value_len()
+        self.statsChanged.emit()
+
+    # ── derived cards ───────────────────────────────────────────────
+    def add_derived(self, title: str, expression: str) -> Card:
+        """Append a card computed from `expression`; emits orderChanged."""
+        cid = len(self._cards)
+        card = Card(id=cid, title=title, size=_CardSize(min=0, avg=0, max=0),
+                    _order=_CardOrder(default=cid), expression=expression)
+        self._cards.append(card)
+        self._by_id[cid] = card
+        self._order.append(cid)
+        self._title_len = max(self._title_len, len(title))
         self.orderChanged.emit()
-        self.visibilityChanged.emit()
+        return card
+
+    def derived_cards(self) -> list[Card]:
+        return [c for c in self._cards if c.expression is not None]
+
+    def set_computed(self, card_id: int, stats: LenStats) -> None:
+        """A derived card's values were computed: its size stats; emits derivedReady."""
+        card = self._by_id[card_id]
+        card.size = _CardSize(min=stats.min, avg=stats.avg, max=stats.max)
+        self._len_acc[card_id] = stats
+        self._value_len = self._calc_avg_value_len()
+        self.derivedReady.emit(card_id)
 
     # ── factory & projections ────────────────────────────────────────
     @classmethod
-    def load_from_df(cls, df: pd.DataFrame) -> "CardTableModel":
+    def load_from_df(cls, df: pd.DataFrame, sample: int | None = None,
+                     workers: int | None = None) -> "CardTableModel":
+        """
+        Build one card per column. Sizes come from helper_card_stats
+        (dtype-aware, no full string copy of the sheet); sample=N uses N
+        evenly spaced rows per column for an approximate result.
+        """
+        stats = frame_stats(df, sample=sample, workers=workers)
         cards: list[Card] = []
-        for idx, col in enumerate(df.columns):
-            lens = df[col].astype(str).str.rstrip().str.len()
-            size = _CardSize(min=lens.min(), avg=int(lens.mean()), max=lens.max())
+        for idx, (col, st) in enumerate(zip(df.columns, stats)):
             cards.append(Card(
                 id=idx,
                 title=str(col),
-                size=size,
+                size=_CardSize(min=st.min, avg=st.avg, max=st.max),
                 _order=_CardOrder(default=idx),
             ))
-        return cls(cards)
+        table = cls(cards)
+        table._len_acc = {idx: st for idx, st in enumerate(stats) if st.count}
+        return table
+
+    @classmethod
+    def from_stats(cls, titles: Iterable, stats: list[dict]) -> "CardTableModel":
+        """Rebuild from stats_to_list() output (e.g. the workbook cache)."""
+        cards = [
+            Card(
+                id=idx,
+                title=str(title),
+                size=_CardSize(min=st["min"], avg=st["avg"], max=st["max"]),
+                _order=_CardOrder(default=idx),
+            )
+            for idx, (title, st) in enumerate(zip(titles, stats))
+        ]
+        table = cls(cards)
+        table._len_acc = {
+            idx: LenStats(st["count"], st["total"], st["min"], st["max"])
+            for idx, st in enumerate(stats) if st["count"]
+        }
+        return table
+
+    # ── column profiles ─────────────────────────────────────────────
+    def set_profile(self, card_id: int, profile: ColumnProfile) -> None:
+        self._by_id[card_id].profile = profile
+        self.profileReady.emit(card_id)
+
+    def profiles_to_dict(self) -> dict[str, dict]:
+        """Computed profiles by card id (JSON keys), e.g. for the cache."""
+        return {str(c.id): c.profile.to_dict() for c in self._cards
+                if c.profile is not None and c.expression is None}
+
+    def apply_profiles(self, profiles: dict[str, dict]) -> None:
+        """Restore profiles_to_dict() output (no signals: cards just built)."""
+        for cid, d in profiles.items():
+            card = self._by_id.get(int(cid))
+            if card is not None:
+                card.profile = ColumnProfile.from_dict(d)
+
+    def stats_to_list(self) -> list[dict]:
+        """Per-card size stats + running counters, in card-id order (sheet columns only)."""
+        out = []
+        for c in self._cards:
+            if c.expression is not None:
+                continue
+            acc = self._len_acc.get(c.id)
+            out.append({
+                "min": int(c.size.min), "avg": int(c.size.avg), "max": int(c.size.max),
+                "count": acc.count if acc else 0, "total": acc.total if acc else 0,
+            })
+        return out
 
     @property
     def cards(self) -> Iterable[Card]:
@@ -128,6 +281,12 @@ class CardTableModel(QObject):
         return self._value_len
 
     # ── internal helpers ─────────────────────────────────────────────
+    def _renumber(self) -> None:
+        """Rebuild the order array from the cards' order (ties by id), dense 0..n-1."""
+        self._order = [c.id for c in sorted(self._cards, key=lambda c: (c.order, c.id))]
+        for i, cid in enumerate(self._order):
+            self._by_id[cid]._shift_to(i)
+
     def _calc_avg_value_len(self, gap: int = 50) -> int:
         """
         Average of per-column max lengths, ignoring the long-text block
@@ -141,11 +300,45 @@ class CardTableModel(QObject):
         return int(sum(maxima[:cut]) / cut) if cut else 0
 
     # ── serialization ───────────────────────────────────────────────
+    LAYOUT_VERSION = 2          # 2: derived cards listed under "derived"
+
     def to_dict(self) -> dict:
-        return {"cards": [c.to_dict() for c in self._cards]}
+        return {
+            "version": self.LAYOUT_VERSION,
+            "cards": [c.to_dict() for c in self._cards],
+            "derived": [{"id": c.id, "title": c.title, "expression": c.expression}
+                        for c in self.derived_cards()],
+        }
 
     def to_json(self, indent: int | None = 2) -> str:
         return json.dumps(self.to_dict(), indent=indent)
 
+    def apply_dict(self, layout: dict) -> None:
+        """
+        Restore order and show/disable state saved by to_dict(). Cards are
+        matched by id and title; unknown entries are ignored – derived
+        cards must exist already (SheetsModel.apply_layout adds them).
+        Emits orderChanged and visibilityChanged once.
+        """
+        by_id = self._by_id
+        for entry in layout.get("cards", []):
+            card = by_id.get(entry.get("id"))
+            if card is None or str(card.title) != str(entry.get("title")):
+                continue
+            order = entry.get("order", {})
+            card._order._current = order.get("current", card._order._current)
+            card._order._previous = order.get("previous", card._order._previous)
+            if entry.get("disable"):
+                card.set_disabled(True)
+            else:
+                card.set_disabled(False)
+                card.show = bool(entry.get("show", True))
+        self._renumber()
+        self.orderChanged.emit()
+        self.visibilityChanged.emit()
+
+    def apply_json(self, text: str) -> None:
+        self.apply_dict(json.loads(text))
+
 
 __all__ = ["CardTableModel"]
\ No newline at end of file
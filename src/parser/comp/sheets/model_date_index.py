@@ -0,0 +1,50 @@
+# src/parser/comp/sheets/model_date_index.py
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["DateIndex"]
+
+
+class DateIndex:
+    """
+    Sorted index over one datetime column.
+
+    • Parsed once: row positions sorted by date (NaT left out).
+    • count(start, end) – rows with start ≤ date ≤ end, O(log n)
+    • positions(start, end) – those rows in sheet order, for RowModel
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        values = series.to_numpy(dtype="datetime64[ns]")
+        valid = np.flatnonzero(~np.isnat(values))
+        order = np.argsort(values[valid], kind="stable")
+        self._positions: np.ndarray = valid[order]
+        self._keys: np.ndarray = values[self._positions]
+
+    # ── range info ──────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def min(self) -> pd.Timestamp | None:
+        return pd.Timestamp(self._keys[0]) if len(self._keys) else None
+
+    @property
+    def max(self) -> pd.Timestamp | None:
+        return pd.Timestamp(self._keys[-1]) if len(self._keys) else None
+
+    # ── queries ─────────────────────────────────────────────────────
+    def count(self, start, end) -> int:
+        lo, hi = self._bounds(start, end)
+        return hi - lo
+
+    def positions(self, start, end) -> np.ndarray:
+        lo, hi = self._bounds(start, end)
+        return np.sort(self._positions[lo:hi])
+
+    def _bounds(self, start, end) -> tuple[int, int]:
+        lo = np.searchsorted(self._keys, np.datetime64(pd.Timestamp(start), "ns"), side="left")
+        hi = np.searchsorted(self._keys, np.datetime64(pd.Timestamp(end), "ns"), side="right")
+        return int(lo), int(max(lo, hi))
@@ -0,0 +1,122 @@
+# src/parser/comp/sheets/model_duplicate_index.py
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .helper_profiler import profiled
+
+__all__ = ["DuplicateIndex", "row_hashes"]
+
+
+def row_hashes(frame: pd.DataFrame, normalize: bool = False) -> np.ndarray:
+    """
+    One uint64 per row over all columns of `frame`, vectorized per column
+    (pd.util.hash_pandas_object). normalize=True: text case-folded, runs
+    of whitespace collapsed and trimmed first, so near-duplicates match.
+    """
+    if normalize:
+        frame = frame.apply(_normalized)
+    try:
+        hashes = pd.util.hash_pandas_object(frame, index=False)
+    except TypeError:                           # unhashable cells (lists …)
+        hashes = pd.util.hash_pandas_object(frame.astype(str), index=False)
+    return hashes.to_numpy()
+
+
+class DuplicateIndex:
+    """
+    Rows of a frame grouped by equal values.
+
+    • Built once: a 64-bit hash per row (row_hashes), grouped with
+      pd.factorize – linear in rows, no pairwise comparisons; only the
+      rows that have a twin are then ordered by group.
+    • groups: 2+ rows sharing a hash, largest first (ties: sheet order);
+      group(g) – its rows in sheet order, for RowModel.set_filter
+    • positions: optional sorted DataFrame rows the frame was taken from
+      (a filtered view); everything returned is in DataFrame positions.
+
+    Distinct rows share a hash with probability ~ n² / 2⁶⁵ – none in
+    practice for sheet-sized data.
+    """
+
+    @profiled("duplicate_index")
+    def __init__(self, frame: pd.DataFrame, positions: np.ndarray | None = None,
+                 *, normalize: bool = False) -> None:
+        self._positions = (np.arange(len(frame), dtype=np.int64) if positions is None
+                           else np.asarray(positions, dtype=np.int64))
+        self.rows = len(frame)
+        self.normalize = normalize
+
+        codes, _ = pd.factorize(row_hashes(frame, normalize))    # hash table: O(n)
+        sizes = np.bincount(codes) if len(codes) else np.zeros(0, dtype=np.int64)
+        members = np.flatnonzero(sizes[codes] > 1)               # rows with a twin
+        by_group = members[np.argsort(codes[members], kind="stable")]
+        member_codes = codes[by_group]
+        starts = np.flatnonzero(np.r_[True, member_codes[1:] != member_codes[:-1]]) \
+            if len(by_group) else np.zeros(0, dtype=np.int64)
+        counts = np.diff(np.r_[starts, len(by_group)])
+
+        rank = np.lexsort((by_group[starts], -counts))           # largest first
+        self._members = by_group                 # frame rows, group-major
+        self._starts = starts[rank]
+        self._sizes = counts[rank]
+        self._group_of_code = np.full(len(sizes), -1, dtype=np.int64)
+        self._group_of_code[member_codes[starts[rank]]] = np.arange(len(rank))
+        self._codes = codes
+        self._duplicated = members               # sorted (flatnonzero)
+
+    # ── summary ─────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        """Number of groups."""
+        return len(self._sizes)
+
+    @property
+    def duplicated_rows(self) -> int:
+        """Rows that belong to a group."""
+        return len(self._members)
+
+    @property
+    def surplus_rows(self) -> int:
+        """Rows beyond the first of each group (what de-duplicating drops)."""
+        return self.duplicated_rows - len(self)
+
+    def sizes(self) -> np.ndarray:
+        """Row count of each group, in group order."""
+        return self._sizes
+
+    def __str__(self) -> str:
+        if not len(self):
+            return f"no duplicates in {self.rows:,} rows"
+        return (f"{len(self):,} groups · {self.duplicated_rows:,} of {self.rows:,} rows "
+                f"· largest {int(self._sizes[0]):,} · {self.surplus_rows:,} surplus")
+
+    # ── queries ─────────────────────────────────────────────────────
+    def group(self, g: int) -> np.ndarray:
+        """DataFrame rows of group g, sorted."""
+        start = self._starts[g]
+        return self._positions[self._members[start:start + self._sizes[g]]]
+
+    def group_of(self, position: int) -> int | None:
+        """Group holding DataFrame row `position`, None if it is unique / not indexed."""
+        i = int(np.searchsorted(self._positions, position))
+        if i >= len(self._positions) or self._positions[i] != position:
+            return None
+        g = int(self._group_of_code[self._codes[i]])
+        return None if g < 0 else g
+
+    def positions(self) -> np.ndarray:
+        """DataFrame rows of every group, sorted."""
+        return self._positions[self._duplicated]
+
+
+def _normalized(s: pd.Series) -> pd.Series:
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        s = s.astype(object)
+    elif dtype != object and not isinstance(dtype, pd.StringDtype):
+        return s                                # numbers, dates: as they are
+    if pd.api.types.infer_dtype(s, skipna=True) not in ("string", "mixed", "mixed-integer"):
+        return s                                # object without text: times, bools …
+    text = s.str.replace(r"\s+", " ", regex=True).str.strip().str.casefold()
+    return text.where(text.notna(), s)          # non-text cells keep their value
@@ -0,0 +1,115 @@
+# src/parser/comp/sheets/model_join.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .model_row import RowModel
+
+__all__ = ["JoinResult", "join_children"]
+
+
+@dataclass(frozen=True, slots=True)
+class JoinResult:
+    rows: RowModel          # new view: one row per child
+    parents: int            # source rows
+    multi_child: int        # source rows holding more than one child
+    new_rows: int           # rows after the join
+    seconds: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.parents:,} records, {self.multi_child:,} with multiple children "
+            f"→ {self.new_rows:,} rows ({self.seconds:.2f}s)"
+        )
+
+
+def join_children(rows: RowModel, columns: Sequence[int], sep: str = "\n",
+                  strip: bool = True,
+                  sort_by: Sequence[int] | None = None) -> JoinResult:
+    """
+    Pre-processor "join children": cells in `columns` (positions, i.e.
+    card ids) holding several child values separated by `sep` become one
+    extra row per child.
+
+    • Parent rows keep their order, children follow their parent
+      (or the result is stably re-sorted by the `sort_by` positions).
+    • Several child columns are split in lockstep and must hold the
+      same number of children per row.
+    • Untouched columns are gathered once per block by position; object
+      cells keep referencing the original values, nothing is deep-copied.
+    """
+    t0 = time.perf_counter()
+    df = rows._df
+    if not len(columns):
+        raise ValueError("join_children: no child columns given")
+
+    parts: dict[int, pd.Series] = {}
+    counts: np.ndarray | None = None
+    for pos in columns:
+        parts[pos], n = _split(df.iloc[:, pos], sep)
+        if counts is None:
+            counts = n
+        elif (bad := int((counts != n).sum())):
+            titles = [str(df.columns[p]) for p in columns]
+            raise ValueError(
+                f"join_children: {bad:,} rows have different child counts in {titles}"
+            )
+
+    positions = np.repeat(np.arange(len(df)), counts)
+    out = df.take(positions).reset_index(drop=True)
+    for pos, split in parts.items():
+        values = split.explode()
+        if strip:
+            values = _strip(values)
+        out.isetitem(pos, values.to_numpy())
+
+    if sort_by:                                     # by position: duplicate titles ok
+        keys = pd.DataFrame({i: out.iloc[:, p] for i, p in enumerate(sort_by)})
+        order = keys.sort_values(list(keys.columns), kind="stable").index
+        out = out.take(order).reset_index(drop=True)
+
+    return JoinResult(
+        rows=RowModel(out),
+        parents=len(df),
+        multi_child=int((counts > 1).sum()),
+        new_rows=len(out),
+        seconds=time.perf_counter() - t0,
+    )
+
+
+def _split(s: pd.Series, sep: str) -> tuple[pd.Series, np.ndarray]:
+    """Split text cells into child lists; returns (lists, children per row)."""
+    ones = np.ones(len(s), dtype=np.int64)
+    if s.dtype != object:
+        if not _is_text(s):
+            return s, ones
+        s = s.astype(object)                        # compacted: category / string
+    try:
+        split = s.str.split(sep, regex=False)
+    except AttributeError:                          # no text cells at all
+        return s, ones
+    split = split.mask(split.isna(), s)             # non-text cells stay as is
+    counts = split.str.len().fillna(1).clip(lower=1).to_numpy(dtype=np.int64)
+    return split, counts
+
+
+def _is_text(s: pd.Series) -> bool:
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return dtype == object or pd.api.types.is_string_dtype(dtype)
+
+
+def _strip(values: pd.Series) -> pd.Series:
+    if values.dtype != object:
+        return values
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        return values
+    return stripped.mask(stripped.isna(), values)
@@ -1,15 +1,123 @@
 # src/parser/comp/sheets/model_row.py
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
 import pandas as pd
 
+from .model_date_index import DateIndex
+from .model_duplicate_index import DuplicateIndex
+from .helper_compact import CompactReport, compact_frame
+
+
+@dataclass(slots=True)
+class _RowData:
+    """The frame and what is derived from it, shared by RowModel views."""
+    frame: pd.DataFrame
+    pending: list[pd.DataFrame] = field(default_factory=list)    # streamed, not yet merged
+    pending_len: int = 0
+    date_indexes: dict[str, DateIndex] = field(default_factory=dict)
+    duplicate_indexes: dict[tuple, DuplicateIndex] = field(default_factory=dict)
+    computed: set[int] = field(default_factory=set)              # derived columns filled in
+    version: int = 0
+
 
 class RowModel:
-    """Holds the DataFrame and the current-row index."""
+    """
+    Holds the DataFrame and the current-row index.
+
+    An optional filter (sorted row positions) narrows navigation without
+    copying the DataFrame: index / row_count then count filtered rows and
+    `position` maps the current one back to the DataFrame. view() gives
+    another index / filter over the same frame.
+
+    Derived cards get a column of their own (add_column), filled in when
+    first needed (set_column). Both swap in a shallow copy of the frame,
+    so snapshots held by background tasks never change under them;
+    `version` counts those swaps.
+    """
 
     def __init__(self, df: pd.DataFrame) -> None:
-        self._df = df.reset_index(drop=True)
+        self._data = _RowData(df.reset_index(drop=True))
         self._idx: int = 0
+        self._filter: np.ndarray | None = None
+
+    def view(self) -> "RowModel":
+        """
+        Another cursor (index, filter) over the same rows – e.g. one per
+        window; streamed rows, columns and indexes stay shared.
+        """
+        rows = RowModel.__new__(RowModel)
+        rows._data, rows._idx, rows._filter = self._data, 0, None
+        return rows
+
+    def same_rows(self, other: "RowModel") -> bool:
+        """True if `other` is this RowModel or a view() of the same rows."""
+        return self._data is other._data
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever add_column / set_column swap the frame."""
+        return self._data.version
+
+    # ── data ────────────────────────────────────────────────────
+    @property
+    def _df(self) -> pd.DataFrame:
+        # merge streamed chunks lazily: one concat per read, not per chunk
+        data = self._data
+        if data.pending:
+            data.frame = pd.concat([data.frame, *data.pending], ignore_index=True)
+            data.pending.clear()
+            data.pending_len = 0
+        return data.frame
+
+    def compact(self, **options) -> CompactReport:
+        """Swap the frame for a memory-compact copy (see helper_compact)."""
+        self._data.frame, report = compact_frame(self._df, **options)
+        return report
+
+    def replace_frame(self, old: pd.DataFrame, new: pd.DataFrame) -> bool:
+        """
+        Swap in `new` – the same rows and values, e.g. compacted off the
+        GUI thread from `old` – unless the frame is no longer `old`
+        (columns added or rows appended since). True if swapped.
+        """
+        data = self._data
+        if data.frame is not old or data.pending:
+            return False
+        data.frame = new
+        return True
+
+    def add_column(self, title: str) -> int:
+        """Append a blank column (a derived card not computed yet); its position."""
+        frame = self._df.copy(deep=False)
+        frame.insert(frame.shape[1], title, np.nan, allow_duplicates=True)
+        self._data.frame = frame
+        self._data.version += 1
+        return frame.shape[1] - 1
+
+    def set_column(self, position: int, values: pd.Series) -> None:
+        """Fill in column `position` (computed derived values, one per row)."""
+        frame = self._df.copy(deep=False)
+        frame.isetitem(position, values)
+        self._data.frame = frame
+        self._data.computed.add(position)
+        self._data.version += 1
+        self._data.date_indexes.pop(frame.columns[position], None)
+        self._data.duplicate_indexes.clear()
+
+    def column_ready(self, position: int) -> bool:
+        """True once set_column() filled column `position` of these rows."""
+        return position in self._data.computed
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Queue a streamed chunk of rows (same columns) behind the current ones."""
+        self._data.pending.append(df)
+        self._data.pending_len += len(df)
+        self._data.date_indexes.clear()
+        self._data.duplicate_indexes.clear()
 
     # ── navigation ──────────────────────────────────────────────
     @property
@@ -18,13 +126,103 @@ class RowModel:
 
     @index.setter
     def index(self, i: int) -> None:
-        if 0 <= i < len(self._df):
+        if 0 <= i < self.row_count:
             self._idx = i
 
     @property
     def row_count(self) -> int:
-        return len(self._df)
+        if self._filter is not None:
+            return len(self._filter)
+        return self.total_count
+
+    @property
+    def total_count(self) -> int:
+        """All rows, ignoring the filter."""
+        return len(self._data.frame) + self._data.pending_len
+
+    @property
+    def position(self) -> int:
+        """DataFrame row of the current index."""
+        return self.position_of(self._idx)
+
+    def position_of(self, index: int) -> int:
+        """DataFrame row of view row `index` (filtered, else the same)."""
+        return int(self._filter[index]) if self._filter is not None else index
+
+    def seek(self, position: int) -> bool:
+        """Make DataFrame row `position` current; False if the view excludes it."""
+        if self._filter is None:
+            if 0 <= position < self.total_count:
+                self._idx = int(position)
+                return True
+            return False
+        i = int(np.searchsorted(self._filter, position))
+        if i < len(self._filter) and self._filter[i] == position:
+            self._idx = i
+            return True
+        return False
 
     def items(self) -> list[tuple[str, object]]:
         """Return (column/field, value) pairs for the current row."""
-        return list(self._df.iloc[self._idx].items())
\ No newline at end of file
+        return list(self._df.iloc[self.position].items())
+
+    def values(self) -> list[object]:
+        """Return the current row's values in column order (no field names)."""
+        return self.values_at(self.position)
+
+    def values_at(self, position: int) -> list[object]:
+        """Values of DataFrame row `position`, as values() returns them."""
+        return list(self._df.iloc[position])
+
+    # ── filter ──────────────────────────────────────────────────
+    @property
+    def filtered(self) -> bool:
+        return self._filter is not None
+
+    def view_positions(self) -> np.ndarray:
+        """DataFrame rows of the current view: the filter, else all rows."""
+        if self._filter is not None:
+            return self._filter
+        return np.arange(self.total_count)
+
+    def set_filter(self, positions: np.ndarray | None) -> None:
+        """
+        Navigate only `positions` (sorted DataFrame rows), or all rows
+        with None. Keeps the current row when it is still included.
+        """
+        current = self.position if self.row_count else 0
+        self._filter = None if positions is None else np.asarray(positions, dtype=np.int64)
+        if self._filter is None:
+            self._idx = current
+        else:
+            i = int(np.searchsorted(self._filter, current))
+            hit = i < len(self._filter) and self._filter[i] == current
+            self._idx = i if hit else 0
+
+    # ── indexes ─────────────────────────────────────────────────
+    def datetime_columns(self) -> list:
+        df = self._df
+        return [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+
+    def date_index(self, column) -> DateIndex:
+        """Sorted DateIndex of a datetime column, built once per column."""
+        idx = self._data.date_indexes.get(column)
+        if idx is None:
+            idx = self._data.date_indexes[column] = DateIndex(self._df[column])
+        return idx
+
+    def duplicate_index(self, columns: Sequence[int] | None = None,
+                        normalize: bool = False) -> DuplicateIndex:
+        """
+        DuplicateIndex of the current view's rows over column positions
+        `columns` (None: all). The unfiltered one is kept (latest only).
+        """
+        df = self._df if columns is None else self._df.iloc[:, list(columns)]
+        if self._filter is not None:
+            return DuplicateIndex(df.take(self._filter), self._filter, normalize=normalize)
+        key = (None if columns is None else tuple(columns), normalize)
+        idx = self._data.duplicate_indexes.get(key)
+        if idx is None:
+            self._data.duplicate_indexes.clear()
+            idx = self._data.duplicate_indexes[key] = DuplicateIndex(df, normalize=normalize)
+        return idx
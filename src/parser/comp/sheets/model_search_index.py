@@ -0,0 +1,113 @@
+# src/parser/comp/sheets/model_search_index.py
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["SearchIndex", "SearchCancelled", "tokenize"]
+
+_TOKEN = re.compile(r"\w+")
+_EMPTY = np.empty(0, dtype=np.int64)
+_MAX_CHAR = "\U0010ffff"
+
+
+class SearchCancelled(Exception):
+    """Raised inside SearchIndex.build() when `cancelled()` turns true."""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens, as indexed."""
+    return _TOKEN.findall(str(text).lower())
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnIndex:
+    """token → row positions of one column, in three flat arrays."""
+    tokens: np.ndarray          # sorted unique tokens
+    starts: np.ndarray          # positions[starts[i]:starts[i+1]] hold tokens[i]
+    positions: np.ndarray       # int64, sorted within each token
+
+    def lookup(self, term: str, prefix: bool) -> np.ndarray:
+        lo = int(np.searchsorted(self.tokens, term, "left"))
+        if prefix:
+            hi = int(np.searchsorted(self.tokens, term + _MAX_CHAR, "left"))
+        else:
+            hi = lo + 1 if lo < len(self.tokens) and self.tokens[lo] == term else lo
+        if hi <= lo:
+            return _EMPTY
+        hits = self.positions[self.starts[lo]:self.starts[hi]]
+        return hits if hi - lo == 1 else np.unique(hits)
+
+
+class SearchIndex:
+    """
+    Inverted full-text index over a DataFrame: word token → row positions,
+    one index per column so a query can be scoped to some columns
+    (e.g. the visible cards) without a rebuild.
+
+    • build(df)            – tokenizes every cell (numbers / dates as text)
+    • query(text, columns) – sorted row positions containing all terms;
+                             the last term matches as a prefix
+    """
+
+    def __init__(self, columns: dict[int, _ColumnIndex], rows: int, seconds: float) -> None:
+        self._columns = columns
+        self.rows = rows
+        self.seconds = seconds
+
+    @classmethod
+    def build(cls, df: pd.DataFrame,
+              cancelled: Callable[[], bool] | None = None) -> "SearchIndex":
+        t0 = time.perf_counter()
+        columns: dict[int, _ColumnIndex] = {}
+        for pos in range(df.shape[1]):
+            if cancelled is not None and cancelled():
+                raise SearchCancelled("search index build cancelled")
+            col = _index_column(df.iloc[:, pos])
+            if col is not None:
+                columns[pos] = col
+        return cls(columns, len(df), time.perf_counter() - t0)
+
+    def query(self, text: str, columns: Iterable[int] | None = None) -> np.ndarray:
+        terms = tokenize(text)
+        if not terms:
+            return _EMPTY
+        scope = [self._columns[c] for c in (self._columns if columns is None else columns)
+                 if c in self._columns]
+        result: np.ndarray | None = None
+        for i, term in enumerate(terms):
+            prefix = i == len(terms) - 1            # search as you type
+            parts = [c.lookup(term, prefix) for c in scope]
+            hits = np.unique(np.concatenate(parts)) if len(parts) > 1 else \
+                (parts[0] if parts else _EMPTY)
+            result = hits if result is None else np.intersect1d(result, hits, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def __len__(self) -> int:
+        return sum(len(c.tokens) for c in self._columns.values())
+
+
+def _index_column(series: pd.Series) -> _ColumnIndex | None:
+    values = pd.Series(series.to_numpy(), index=np.arange(len(series))).dropna()
+    if values.empty:
+        return None
+    tokens = values.astype(str).str.lower().str.findall(_TOKEN.pattern).explode().dropna()
+    if tokens.empty:
+        return None
+
+    codes, uniques = pd.factorize(tokens.to_numpy(), sort=True)
+    pos = tokens.index.to_numpy(dtype=np.int64)
+    order = np.lexsort((pos, codes))
+    codes, pos = codes[order], pos[order]
+    keep = np.ones(len(pos), dtype=bool)                 # one hit per (token, row)
+    keep[1:] = (codes[1:] != codes[:-1]) | (pos[1:] != pos[:-1])
+    codes, pos = codes[keep], pos[keep]
+    starts = np.searchsorted(codes, np.arange(len(uniques) + 1))
+    return _ColumnIndex(np.asarray(uniques, dtype=object), starts, pos)
@@ -1,12 +1,15 @@
 # src/parser/comp/sheets/view.py
 from PySide6.QtWidgets import QMainWindow, QApplication
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 
 class SheetsView(QMainWindow):
+    closed: Signal = Signal()       # just before the window is deleted
+
     def __init__(self, widget):
         super().__init__()
         self.setWindowTitle("Excel Viewer")
         self.setWindowFlag(Qt.WindowMinimizeButtonHint, True)
+        self.setAttribute(Qt.WA_DeleteOnClose)      # frees the widget tree
         self.setCentralWidget(widget)
         self._centered = False
 
@@ -16,6 +19,11 @@ class SheetsView(QMainWindow):
             QTimer.singleShot(0, self._center_on_screen)
             self._centered = True
 
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        if event.isAccepted():
+            self.closed.emit()
+
     def _center_on_screen(self):
         screen = QApplication.primaryScreen()
         screen_geometry = screen.availableGeometry()
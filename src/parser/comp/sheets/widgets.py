@@ -2,10 +2,11 @@
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableView, QHBoxLayout, QPushButton,
-    QSpacerItem, QSizePolicy, QHeaderView, QAbstractItemView
+    QWidget, QVBoxLayout, QTableView, QHBoxLayout, QPushButton, QLabel,
+    QSpacerItem, QSizePolicy, QHeaderView, QAbstractItemView,
+    QComboBox, QDateEdit, QCheckBox, QLineEdit, QPlainTextEdit,
 )
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QIntValidator
 
 
 class SheetsWidget(QWidget):
@@ -41,23 +42,132 @@ class SheetsWidget(QWidget):
         hdr.setFont(header_font)
         hdr.setSectionResizeMode(QHeaderView.Fixed)
 
+        # ---- grid: every row as in a spreadsheet (second view mode) --
+        self.grid = QTableView(self)
+        self.grid.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.grid.setWordWrap(False)
+        self.grid.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.grid.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.grid.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.grid.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.grid.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        grid_rows = self.grid.verticalHeader()            # uniform heights:
+        grid_rows.setSectionResizeMode(QHeaderView.Fixed)  # nothing measured
+        grid_rows.setDefaultSectionSize(self.grid.fontMetrics().height() + 6)
+        self.grid.horizontalHeader().setDefaultSectionSize(140)
+        self.grid.setVisible(False)
+
+        # ---- full value of a truncated cell (shown on demand) ---------
+        self.value_detail = QPlainTextEdit(self)
+        self.value_detail.setReadOnly(True)
+        self.value_detail.setMaximumHeight(160)
+        self.value_detail.setVisible(False)
+
+        # ---- sheet selector (hidden for single-sheet workbooks) -------
+        self.sheet_label     = QLabel("Sheet:", self)
+        self.sheet_combo     = QComboBox(self)
+        self.sheet_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+
         # ---- navigation buttons ---------------------------------------
         self.toggle_show_btn = QPushButton("Show/Hide", self)
+        self.view_mode_btn   = QPushButton("Grid view", self)
+        self.join_btn        = QPushButton("Join children…", self)
+        self.dup_btn         = QPushButton("Duplicates…", self)
+        self.export_btn      = QPushButton("Export…", self)
         self.prev_btn        = QPushButton("← Previous", self)
         self.next_btn        = QPushButton("Next →", self)
+        self.row_label       = QLabel(self)
+        self.goto_edit       = QLineEdit(self)
+        self.goto_edit.setPlaceholderText("Go to row")
+        self.goto_edit.setValidator(QIntValidator(1, 2**31 - 1, self))
+        self.goto_edit.setFixedWidth(90)
+        for btn in (self.prev_btn, self.next_btn):      # hold to step; the
+            btn.setAutoRepeat(True)                     # navigation coalesces
+
+        # ---- date filter ----------------------------------------------
+        self.date_filter_chk = QCheckBox("Filter by date", self)
+        self.date_col        = QComboBox(self)
+        self.date_from       = QDateEdit(self)
+        self.date_to         = QDateEdit(self)
+        self.date_count      = QLabel(self)
+        for edit in (self.date_from, self.date_to):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+
+        # ---- duplicates (shown while browsing groups) ------------------
+        self.dup_label       = QLabel(self)
+        self.dup_prev_btn    = QPushButton("◀ Group", self)
+        self.dup_group_label = QLabel(self)
+        self.dup_next_btn    = QPushButton("Group ▶", self)
+        self.dup_all_btn     = QPushButton("All", self)
+        self.dup_clear_btn   = QPushButton("Clear", self)
+
+        # ---- search ---------------------------------------------------
+        self.search_edit      = QLineEdit(self)
+        self.search_edit.setPlaceholderText("Search…  (Enter: next, Shift+Enter: previous)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_prev_btn  = QPushButton("▲", self)
+        self.search_next_btn  = QPushButton("▼", self)
+        self.search_scope_chk = QCheckBox("Visible fields only", self)
+        self.search_count     = QLabel(self)
+
+        # ---- layout: search -------------------------------------------
+        search_row = QHBoxLayout()
+        search_row.addWidget(self.search_edit, stretch=1)
+        search_row.addWidget(self.search_prev_btn)
+        search_row.addWidget(self.search_next_btn)
+        search_row.addWidget(self.search_scope_chk)
+        search_row.addWidget(self.search_count)
+
+        # ---- layout: date filter --------------------------------------
+        self.date_bar = QWidget(self)
+        date_row = QHBoxLayout(self.date_bar)
+        date_row.setContentsMargins(0, 0, 0, 0)
+        date_row.addWidget(self.date_filter_chk)
+        date_row.addWidget(self.date_col)
+        date_row.addWidget(self.date_from)
+        date_row.addWidget(QLabel("–", self))
+        date_row.addWidget(self.date_to)
+        date_row.addWidget(self.date_count)
+        date_row.addStretch()
+
+        # ---- layout: duplicates ---------------------------------------
+        self.dup_bar = QWidget(self)
+        dup_row = QHBoxLayout(self.dup_bar)
+        dup_row.setContentsMargins(0, 0, 0, 0)
+        dup_row.addWidget(self.dup_label)
+        dup_row.addStretch()
+        dup_row.addWidget(self.dup_prev_btn)
+        dup_row.addWidget(self.dup_group_label)
+        dup_row.addWidget(self.dup_next_btn)
+        dup_row.addWidget(self.dup_all_btn)
+        dup_row.addWidget(self.dup_clear_btn)
 
         # ---- layout: buttons ------------------------------------------
         buttons = QHBoxLayout()
+        buttons.addWidget(self.sheet_label)
+        buttons.addWidget(self.sheet_combo)
         buttons.addWidget(self.toggle_show_btn)
+        buttons.addWidget(self.view_mode_btn)
+        buttons.addWidget(self.join_btn)
+        buttons.addWidget(self.dup_btn)
         buttons.addStretch()
         buttons.addWidget(self.prev_btn)
         buttons.addWidget(self.next_btn)
         buttons.addStretch()
+        buttons.addWidget(self.row_label)
+        buttons.addWidget(self.goto_edit)
+        buttons.addWidget(self.export_btn)
 
         # ---- main layout ----------------------------------------------
         root = QVBoxLayout(self)
+        root.addLayout(search_row)
         root.addWidget(self.table, stretch=1)
+        root.addWidget(self.grid, stretch=1)
+        root.addWidget(self.value_detail)
         root.addItem(QSpacerItem(0, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
         #root.addStretch()
+        root.addWidget(self.date_bar)
+        root.addWidget(self.dup_bar)
         root.addLayout(buttons)
         self.setLayout(root)
\ No newline at end of file
@@ -0,0 +1,37 @@
+# src/parser/comp/sheets/window.py
+from .model                 import SheetsModel     #  main Sheets Model
+from .widgets               import SheetsWidget
+from .view                  import SheetsView
+from .controller            import SheetsController   # main Sheets Controller
+
+
+__all__ = ["SheetsWindow"]
+
+
+class SheetsWindow:
+    """Top-level façade used by the application."""
+
+    def __init__(self, source, stream: bool = False, cache=None, loader=None,
+                 compact=None):
+        # 1. model layer – source is a path, a DataFrame or a ready
+        #    SheetsModel (e.g. from a SheetsLoader still streaming rows).
+        #    stream=True: first chunk now, rest in background;
+        #    cache: WorkbookCache restoring unchanged workbooks from disk;
+        #    compact: memory-compact dtypes (None: PARSER_COMPACT in .env)
+        if isinstance(source, SheetsModel):
+            self.model = source
+        else:
+            self.model = SheetsModel(source, stream=stream, cache=cache, compact=compact)
+
+        # 2. view layer
+        self.widget = SheetsWidget()
+        self.view   = SheetsView(self.widget)
+
+        # 3. controller layer (CardViewController internally
+        #    creates NavigationController & TableSizer)
+        self.controller = SheetsController(self.model, self.widget, loader)
+        self.view.closed.connect(self.controller.close)
+
+    # delegate show ----------------------------------------------------
+    def show(self):
+        self.view.show()
\ No newline at end of file
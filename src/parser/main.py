@@ -9,10 +9,11 @@ def main():
     # Resolve path to project root
     root_path = Path(__file__).resolve().parents[2]
     excel_path = root_path / "temp" / "sheets_old.xlsx"
+    cache_dir  = root_path / "temp" / "cache"     # parsed-workbook cache
     print(excel_path)
 
     app = QApplication(sys.argv)
-    main_app = MainApp(excel_path=excel_path)
+    main_app = MainApp(excel_path=excel_path, cache_dir=cache_dir)
     main_app.show()
 
     sys.exit(app.exec())
@@ -0,0 +1,84 @@
+# tests/test_card_stats.py
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from comp.sheets.helper_card_stats import column_stats, frame_stats
+from comp.sheets.model_card_table import CardTableModel
+
+
+def old_stats(series: pd.Series) -> tuple[int, int, int]:
+    """(min, avg, max) as load_from_df computed them before helper_card_stats."""
+    lens = series.astype(str).str.rstrip().str.len()
+    return lens.min(), int(lens.mean()), lens.max()
+
+
+def _dates(*values) -> pd.Series:
+    return pd.Series(pd.to_datetime(list(values), format="ISO8601"))
+
+
+COLUMNS = {
+    "mixed": pd.Series([1, "two ", 3.5, None, dt.date(2024, 1, 2), True], dtype=object),
+    "text": pd.Series(["a", "bb  ", "", "ccc\n", "ünïcode"]),
+    "int64": pd.Series([0, 7, -12, 123_456_789, -(2 ** 63), 2 ** 63 - 1]),
+    "int8": pd.Series([-128, 0, 5, 127], dtype=np.int8),
+    "uint64": pd.Series([0, 9, 10, 2 ** 64 - 1], dtype=np.uint64),
+    "bool": pd.Series([True, False, False]),
+    "float": pd.Series([0.0, -0.0, 1.5, -2.25, 1e16, 1e-7, 123456789.0, np.inf, -np.inf]),
+    "float_nan": pd.Series([np.nan, 1.0, np.nan, 0.1 + 0.2]),
+    "all_nan": pd.Series([np.nan, np.nan]),
+    "dates": _dates("2024-01-31", "2023-12-01"),
+    "datetimes": _dates("2024-01-31 12:30:00", "2024-02-01 00:00:00"),
+    "millis": _dates("2024-01-31 12:30:00.123", "2024-02-01 00:00:00"),
+    "micros": _dates("2024-01-31 12:30:00.123456", "2024-02-01 00:00:00"),
+    "nanos": _dates("2024-01-31 12:30:00.123456789", "2024-02-01 00:00:00"),
+    "dates_nat": _dates("2024-01-31", None),
+    "all_nat": _dates(None, None),
+    "category": pd.Series(["x", "yy", "x", None], dtype="category"),
+    "int_category": pd.Series([1, 22, 1], dtype="category"),
+    "nullable_int": pd.Series([1, None, -30], dtype="Int64"),
+    "timedelta": pd.Series(pd.to_timedelta(["1 day", "2 hours"])),
+}
+
+
+@pytest.mark.parametrize("name", COLUMNS)
+def test_column_stats_match_stringified(name):
+    series = COLUMNS[name]
+    st = column_stats(series)
+    assert (st.min, st.avg, st.max) == old_stats(series)
+    assert st.count == len(series)
+
+
+@pytest.mark.parametrize("name", ["int64", "float", "datetimes", "text"])
+def test_column_stats_chunks_merge(name, monkeypatch):
+    import comp.sheets.helper_card_stats as card_stats
+
+    series = pd.concat([COLUMNS[name]] * 5, ignore_index=True)
+    monkeypatch.setattr(card_stats, "CHUNK_ROWS", 3)
+    st = column_stats(series)
+    assert (st.min, st.avg, st.max) == old_stats(series)
+
+
+def test_frame_stats_parallel_equals_serial():
+    df = pd.DataFrame({name: s.reindex(range(9)) for name, s in COLUMNS.items()
+                       if name not in ("all_nan", "all_nat")})
+    assert frame_stats(df, workers=4) == frame_stats(df, workers=1)
+
+
+def test_load_from_df_sizes_and_value_len():
+    df = pd.DataFrame({
+        "id": np.arange(100),
+        "price": np.linspace(0, 10, 100),
+        "when": pd.date_range("2024-01-01", periods=100, freq="h"),
+        "note": ["x" * (i % 7) for i in range(100)],
+        "long": ["y" * 300] * 100,
+    })
+    table = CardTableModel.load_from_df(df)
+    for card, col in zip(table.cards, df.columns):
+        size = card.size
+        assert (size.min, size.avg, size.max) == old_stats(df[col]), col
+
+    maxima = sorted(old_stats(df[c])[2] for c in df.columns)   # long column cut off
+    assert table.value_len == int(sum(maxima[:-1]) / (len(maxima) - 1))
@@ -0,0 +1,126 @@
+# tests/test_card_table.py
+import pandas as pd
+import pytest
+from PySide6.QtCore import Qt
+
+from comp.sheets.helper_card_stats import column_stats
+from comp.sheets.model_card_table import CardTableModel
+
+
+@pytest.fixture
+def table():
+    df = pd.DataFrame({c: [c * (i + 1) for i in range(3)] for c in "abcde"})
+    return CardTableModel.load_from_df(df)
+
+
+def record(signal) -> list[tuple]:
+    calls = []
+    signal.connect(lambda *args: calls.append(args))
+    return calls
+
+
+def order(table) -> list[str]:
+    return [c.title for c in table.ordered_cards()]
+
+
+def assert_dense(table):
+    assert [c.order for c in table.ordered_cards()] == list(range(len(table.ordered_cards())))
+
+
+def test_reorder_shifts_between(table):
+    moved = record(table.cardMoved)
+    table.reorder(4, 1)
+    assert order(table) == list("aebcd") and moved == [(4, 4, 1)]
+    table.reorder(0, 99)                                         # clamped to the end
+    assert order(table) == list("ebcda") and moved[-1] == (0, 0, 4)
+    assert_dense(table)
+
+
+def test_reorder_same_position_is_silent(table):
+    moved = record(table.cardMoved)
+    table.reorder(2, 2)
+    assert moved == [] and order(table) == list("abcde")
+
+
+def test_reorder_by_list(table):
+    changed = record(table.orderChanged)
+    table.reorder_by_list([3, 1, 99, 3])                          # unknown / repeated ids ignored
+    assert order(table) == list("dbace") and changed == [()]
+    assert_dense(table)
+
+
+def test_disable_moves_last_and_enable_restores(table):
+    moved, states = record(table.cardMoved), record(table.cardStateChanged)
+    table.disable(1)
+    assert order(table) == list("acdeb") and table.by_id(1).disabled
+    assert moved == [(1, 1, 4)] and states == [(1, "VISIBLE", "DISABLED")]
+    table.disable(1)                                             # already disabled
+    assert len(moved) == 1 and len(states) == 1
+
+    table.enable(1)
+    assert order(table) == list("abcde") and table.by_id(1).show
+    assert moved[-1] == (1, 4, 1) and states[-1] == (1, "DISABLED", "VISIBLE")
+    assert_dense(table)
+
+
+def test_enable_after_other_moves(table):
+    table.disable(0)
+    table.reorder(4, 0)
+    table.enable(0)
+    assert table.by_id(0).order == 0 and not table.by_id(0).disabled
+    assert sorted(order(table)) == list("abcde")
+    assert_dense(table)
+
+
+def test_update_visibility(table):
+    states = record(table.cardStateChanged)
+    table.update_visibility(2, Qt.Unchecked)
+    table.update_visibility(2, Qt.Unchecked)
+    table.update_visibility(3, Qt.PartiallyChecked)
+    assert states == [(2, "VISIBLE", "HIDDEN"), (3, "VISIBLE", "DISABLED")]
+    assert [c.title for c in table.visible_cards(show_all=False)] == list("abe")
+    assert len(table.visible_cards(show_all=True)) == 5
+    table.update_visibility(3, Qt.Checked)
+    assert table.by_id(3).show and states[-1] == (3, "DISABLED", "VISIBLE")
+
+
+def test_derived_cards(table):
+    changed, ready = record(table.orderChanged), record(table.derivedReady)
+    card = table.add_derived("total", "a + b")
+    assert card.id == 5 and card.order == 5 and changed == [()]
+    assert table.derived_cards() == [card] and len(table.stats_to_list()) == 5
+    table.set_computed(card.id, column_stats(pd.Series(["xyz", "x"])))
+    assert ready == [(5,)] and (card.size.min, card.size.max) == (1, 3)
+
+
+def test_layout_round_trip(table):
+    table.reorder(4, 0)
+    table.update_visibility(1, Qt.Unchecked)
+    table.disable(2)
+    table.add_derived("total", "a + b")
+    layout = table.to_dict()
+    assert layout["version"] == CardTableModel.LAYOUT_VERSION
+    assert layout["derived"] == [{"id": 5, "title": "total", "expression": "a + b"}]
+    assert all("expression" not in c for c in layout["cards"])
+
+    df = pd.DataFrame({c: ["x"] for c in "abcde"})
+    fresh = CardTableModel.load_from_df(df)
+    fresh.add_derived("total", "a + b")
+    fresh.apply_json(table.to_json())
+    assert order(fresh) == order(table)
+    assert [c.state for c in fresh.ordered_cards()] == [c.state for c in table.ordered_cards()]
+
+
+def test_apply_dict_skips_mismatched_titles(table):
+    layout = table.to_dict()
+    layout["cards"][0].update(title="renamed", show=False)
+    layout["cards"][1]["show"] = False
+    table.apply_dict(layout)
+    assert table.by_id(0).show and not table.by_id(1).show
+
+
+def test_update_from_df_running_stats(table):
+    changed = record(table.statsChanged)
+    table.update_from_df(pd.DataFrame({c: [c * 10] for c in "abcde"}))
+    assert table.by_id(0).size.max == 10 and table.by_id(0).size.min == 1
+    assert changed == [()]
@@ -0,0 +1,49 @@
+# tests/test_column_profile.py
+import datetime as dt
+import warnings
+
+import pandas as pd
+import pytest
+
+from comp.sheets.helper_column_profile import ColumnProfile, profile_column
+
+CASES = {
+    "text": ["a", "b", None, "a"],
+    "integer": [1, 2, 1, 1],
+    "datetime": [dt.datetime(2024, 1, 1), None, dt.datetime(2024, 2, 1), dt.datetime(2024, 1, 1)],
+}
+
+
+@pytest.mark.parametrize("kind", CASES)
+def test_category_reports_values_kind(kind):
+    values = CASES[kind]
+    assert profile_column(pd.Series(values, dtype=object)).kind == kind
+    assert profile_column(pd.Series(values, dtype="category")).kind == kind
+
+
+def test_counts_and_range():
+    profile = profile_column(pd.Series([3, None, 1, 3, 7]))
+    assert (profile.kind, profile.rows, profile.nulls, profile.distinct) == ("float", 5, 1, 3)
+    assert profile.top[0] == ("3.0", 2) and (profile.min, profile.max) == (1.0, 7.0)
+
+
+def test_unused_categories_not_counted():
+    series = pd.Series(["x", "y"], dtype="category").iloc[:1]
+    assert profile_column(series).distinct == 1
+
+
+def test_object_numbers_without_warning():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        profile = profile_column(pd.Series([1, 2, 2, None], dtype=object))
+    assert profile.kind == "integer" and profile.top[0] == ("2", 2)
+
+
+def test_empty_and_mixed():
+    assert profile_column(pd.Series([None, None])).kind == "empty"
+    assert profile_column(pd.Series([1, "a", [1]], dtype=object)).kind == "mixed"
+
+
+def test_dict_round_trip():
+    profile = profile_column(pd.Series(CASES["datetime"]))
+    assert ColumnProfile.from_dict(profile.to_dict()) == profile
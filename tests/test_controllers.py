@@ -0,0 +1,73 @@
+# tests/test_controllers.py
+import pandas as pd
+import pytest
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QCheckBox, QLabel, QLineEdit, QPushButton, QWidget
+
+from comp.sheets.controller_prefetch import RowPrefetcher
+from comp.sheets.controller_search import SearchController
+from comp.sheets.model import SheetsModel
+from comp.sheets.model_api_table import CardTableQtModel
+
+
+def wait_until(condition, ms: int) -> bool:
+    """Process events until `condition()` holds (background tasks report back)."""
+    for _ in range(ms // 10):
+        if condition():
+            return True
+        QTest.qWait(10)
+    return condition()
+
+
+@pytest.fixture
+def sheets(qapp):
+    return SheetsModel(pd.DataFrame({
+        "name": ["Ann Lee", "Bob", "Annie", "Cy", "ann"],
+        "city": ["Oslo", "Bergen", "Annecy", "Oslo", "Rome"],
+    }), compact=False)
+
+
+@pytest.fixture
+def search_widget(qapp):
+    w = QWidget()
+    w.search_edit, w.search_count = QLineEdit(w), QLabel(w)
+    w.search_next_btn, w.search_prev_btn = QPushButton(w), QPushButton(w)
+    w.search_scope_chk = QCheckBox(w)
+    return w
+
+
+def test_search_builds_in_background_and_steps(sheets, search_widget):
+    search = SearchController(sheets, search_widget)
+    search_widget.search_edit.setText("ann")
+    assert wait_until(lambda: "match" in search_widget.search_count.text(), 2000)
+    assert search_widget.search_count.text() == "1 / 3 rows match"
+
+    search_widget.search_next_btn.click()
+    assert sheets.rows.position == 2
+    search_widget.search_next_btn.click()
+    search_widget.search_next_btn.click()                        # wraps around
+    assert sheets.rows.position == 0
+    search_widget.search_prev_btn.click()
+    assert sheets.rows.position == 4
+
+    sheets.rows.set_filter([1, 2, 3])
+    search.refresh()
+    assert search_widget.search_count.text() == "1 rows match"
+
+
+def test_search_scope_follows_visible_cards(sheets, search_widget):
+    search_widget.search_scope_chk.setChecked(True)
+    SearchController(sheets, search_widget)
+    search_widget.search_edit.setText("oslo")
+    assert wait_until(lambda: "match" in search_widget.search_count.text(), 2000)
+    sheets.cardtable.disable(1)
+    assert search_widget.search_count.text() == "0 rows match"
+
+
+def test_prefetch_fills_previews(sheets):
+    qt_model = CardTableQtModel(sheets)
+    prefetch = RowPrefetcher(sheets, qt_model, rows_each_way=2)
+    sheets.rows.seek(0)
+    prefetch.schedule()
+    assert wait_until(lambda: all(qt_model.has_previews(p) for p in (1, 2, 3, 4)), 2000)
+    assert qt_model.data(qt_model.index(0, 2)) == "Ann Lee"
@@ -0,0 +1,43 @@
+# tests/test_date_index.py
+import pandas as pd
+
+from comp.sheets.model_date_index import DateIndex
+
+SERIES = pd.Series(pd.to_datetime(
+    ["2024-03-01", None, "2024-01-15", "2024-02-01 12:00", "2024-01-15", "2023-12-31"],
+    format="ISO8601"))
+
+
+def test_range_info():
+    idx = DateIndex(SERIES)
+    assert len(idx) == 5                                          # NaT left out
+    assert idx.min == pd.Timestamp("2023-12-31") and idx.max == pd.Timestamp("2024-03-01")
+
+
+def test_count_and_positions_inclusive():
+    idx = DateIndex(SERIES)
+    assert idx.count("2024-01-15", "2024-02-01 12:00") == 3
+    assert idx.positions("2024-01-15", "2024-02-01 12:00").tolist() == [2, 3, 4]
+    assert idx.positions("2000-01-01", "2100-01-01").tolist() == [0, 2, 3, 4, 5]
+
+
+def test_empty_ranges():
+    idx = DateIndex(SERIES)
+    assert idx.count("2024-02-02", "2024-02-28") == 0
+    assert idx.count("2024-03-01", "2024-01-01") == 0             # start after end
+    assert idx.positions("2025-01-01", "2025-12-31").tolist() == []
+
+
+def test_all_nat():
+    idx = DateIndex(pd.Series(pd.to_datetime([None, None])))
+    assert len(idx) == 0 and idx.min is None and idx.max is None
+    assert idx.count("2000-01-01", "2100-01-01") == 0
+
+
+def test_matches_mask():
+    dates = pd.Series(pd.date_range("2024-01-01", periods=500, freq="7h")).sample(frac=1, random_state=1)
+    dates = dates.reset_index(drop=True)
+    idx = DateIndex(dates)
+    start, end = pd.Timestamp("2024-02-03"), pd.Timestamp("2024-03-10 05:00")
+    mask = (dates >= start) & (dates <= end)
+    assert idx.positions(start, end).tolist() == mask[mask].index.tolist()
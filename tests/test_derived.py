@@ -0,0 +1,40 @@
+# tests/test_derived.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from comp.sheets.helper_derived import ExpressionError, evaluate, field_names
+
+FIELDS = {
+    "A": pd.Series([1, 2, 3]),
+    "First name": pd.Series(["Ann", None, "Cy"]),
+    "When": pd.Series(pd.to_datetime(["2024-01-31", "2023-05-01", None])),
+}
+INDEX = FIELDS["A"].index
+
+
+def test_field_names():
+    assert field_names("`First name` + text(A)") == {"First name", "A"}
+
+
+def test_arithmetic_and_functions():
+    assert evaluate("A * 2 - 1", FIELDS, INDEX).tolist() == [1, 3, 5]
+    assert evaluate("where(A > 1, A, 0)", FIELDS, INDEX).tolist() == [0, 2, 3]
+    assert evaluate("text(`First name`) + '!'", FIELDS, INDEX).tolist() == ["Ann!", "!", "Cy!"]
+    years = evaluate("`When`.dt.year", FIELDS, INDEX)
+    assert years.iloc[:2].tolist() == [2024, 2023] and np.isnan(years.iloc[2])
+
+
+def test_boolean_operators():
+    assert evaluate("A > 1 and A < 3", FIELDS, INDEX).tolist() == [False, True, False]
+    assert evaluate("not True", FIELDS, INDEX).tolist() == [False] * 3
+    assert evaluate("not (A > 1)", FIELDS, INDEX).tolist() == [True, False, False]
+
+
+@pytest.mark.parametrize("expression", [
+    "A.to_string('x')", "A.to_csv('x')", "A.to_pickle('x')", "A.__class__", "A.plot()",
+    "__import__('os')", "[A][0]", "lambda: A", "B + 1", "A +",
+])
+def test_rejected(expression):
+    with pytest.raises(ExpressionError):
+        evaluate(expression, FIELDS, INDEX)
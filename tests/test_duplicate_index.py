@@ -0,0 +1,74 @@
+# tests/test_duplicate_index.py
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from comp.sheets.model_duplicate_index import DuplicateIndex, row_hashes
+
+FRAME = pd.DataFrame({
+    "a": [1, 2, 1, 3, 2, 1, 4],
+    "b": ["x", "y", "x", "z", "y", "x", "w"],
+})
+
+
+def test_groups_largest_first():
+    idx = DuplicateIndex(FRAME)
+    assert len(idx) == 2
+    assert idx.sizes().tolist() == [3, 2]
+    assert idx.group(0).tolist() == [0, 2, 5] and idx.group(1).tolist() == [1, 4]
+    assert idx.duplicated_rows == 5 and idx.surplus_rows == 3
+    assert idx.positions().tolist() == [0, 1, 2, 4, 5]
+
+
+def test_group_of():
+    idx = DuplicateIndex(FRAME)
+    assert [idx.group_of(p) for p in range(7)] == [0, 1, 0, None, 1, 0, None]
+    assert idx.group_of(99) is None
+
+
+def test_ties_in_sheet_order():
+    idx = DuplicateIndex(pd.DataFrame({"a": [5, 7, 5, 7]}))
+    assert idx.group(0).tolist() == [0, 2] and idx.group(1).tolist() == [1, 3]
+
+
+def test_no_duplicates():
+    idx = DuplicateIndex(pd.DataFrame({"a": [1, 2, 3]}))
+    assert len(idx) == 0 and idx.duplicated_rows == 0 and idx.positions().tolist() == []
+    assert str(idx) == "no duplicates in 3 rows"
+
+
+def test_filtered_positions():
+    positions = np.array([1, 3, 4, 6])
+    idx = DuplicateIndex(FRAME.take(positions), positions)
+    assert len(idx) == 1 and idx.group(0).tolist() == [1, 4]
+    assert idx.group_of(4) == 0 and idx.group_of(0) is None      # 0 not in the view
+
+
+def test_matches_pandas_duplicated():
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame({"a": rng.integers(0, 5, 300), "b": rng.choice(list("xyz"), 300)})
+    idx = DuplicateIndex(frame)
+    expected = np.flatnonzero(frame.duplicated(keep=False).to_numpy())
+    assert idx.positions().tolist() == expected.tolist()
+    assert idx.surplus_rows == int(frame.duplicated().sum())
+
+
+def test_unhashable_cells():
+    frame = pd.DataFrame({"a": [[1, 2], [1, 2], [3]]})
+    assert len(row_hashes(frame)) == 3
+    assert DuplicateIndex(frame).group(0).tolist() == [0, 1]
+
+
+def test_normalize_text_and_other_objects():
+    t = dt.time(8, 30)
+    frame = pd.DataFrame({
+        "time": pd.Series([t, t, dt.time(9), t], dtype=object),
+        "number": pd.Series([1, 1, 2.5, 1], dtype=object),
+        "flag": pd.Series([True, True, None, True], dtype=object),
+        "code": pd.Series([1, 1, 2, 1], dtype="category"),
+        "text": pd.Series(["Ann  Lee", "ann lee", "Bo", " ANN LEE "], dtype=object),
+    })
+    index = DuplicateIndex(frame, normalize=True)
+    assert index.group(0).tolist() == [0, 1, 3], str(index)
+    assert DuplicateIndex(frame, normalize=False).duplicated_rows == 0
@@ -0,0 +1,93 @@
+# tests/test_model_cache.py
+import os
+
+import pytest
+
+from comp.sheets.helper_model_cache import SheetsModelCache
+
+
+class Model:
+    def __init__(self, loading: bool = False) -> None:
+        self.loading = loading
+
+
+@pytest.fixture
+def books(tmp_path):
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.xlsx"
+        path.write_bytes(name.encode())
+        paths.append(path)
+    return paths
+
+
+def test_acquire_counts_refs(books):
+    cache, model = SheetsModelCache(), Model()
+    assert cache.acquire(books[0]) is None
+    cache.add(books[0], model)
+    assert cache.refs(model) == 1
+    assert cache.acquire(str(books[0])) is model and cache.refs(model) == 2
+    cache.release(model)
+    cache.release(model)
+    cache.release(model)                                         # never below 0
+    assert cache.refs(model) == 0 and len(cache) == 1
+
+
+def test_loading_model_not_shared(books):
+    cache, model = SheetsModelCache(), Model(loading=True)
+    cache.add(books[0], model)
+    assert cache.acquire(books[0]) is None and cache.refs(model) == 1
+    model.loading = False
+    assert cache.acquire(books[0]) is model
+
+
+def test_evicts_idle_least_recently_used(books):
+    cache = SheetsModelCache(max_models=2)
+    models = [Model() for _ in books]
+    for path, model in zip(books[:2], models):
+        cache.add(path, model)
+        cache.release(model)
+    cache.acquire(books[0])                                      # a used more recently than b
+    cache.release(models[0])
+    cache.add(books[2], models[2])
+    assert len(cache) == 2
+    assert cache.acquire(books[1]) is None and cache.acquire(books[0]) is models[0]
+
+
+def test_held_and_loading_models_kept(books):
+    cache = SheetsModelCache(max_models=1)
+    held, loading = Model(), Model(loading=True)
+    cache.add(books[0], held)
+    cache.add(books[1], loading)
+    loading_refs = cache.refs(loading)
+    cache.release(loading)
+    assert len(cache) == 2 and loading_refs == 1                 # streaming: kept
+    cache.release(held)
+    assert len(cache) == 1 and cache.refs(held) == 0 and cache.acquire(books[0]) is None
+
+
+def test_edited_file_is_new_entry(books):
+    cache, model = SheetsModelCache(), Model()
+    cache.add(books[0], model)
+    books[0].write_bytes(b"edited, longer")
+    os.utime(books[0], ns=(1, 1))
+    assert cache.acquire(books[0]) is None
+
+
+def test_discard_and_clear(books):
+    cache = SheetsModelCache(max_models=5)
+    a, b, c = Model(), Model(), Model()
+    cache.add(books[0], a)
+    cache.add(books[1], b)
+    cache.add(books[2], c)
+    cache.discard(a)
+    assert cache.acquire(books[0]) is None and cache.refs(a) == 0
+    cache.release(b)
+    cache.clear()
+    assert len(cache) == 1 and cache.refs(c) == 1
+
+
+def test_not_a_path():
+    cache = SheetsModelCache()
+    cache.add(None, Model())
+    assert len(cache) == 0 and cache.acquire(None) is None
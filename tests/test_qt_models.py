@@ -0,0 +1,145 @@
+# tests/test_qt_models.py
+import numpy as np
+import pandas as pd
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QAbstractItemModelTester, QTest
+from PySide6.QtWidgets import QPushButton
+
+from comp.sheets.controller_nav import COALESCE_MS, NavigationController
+from comp.sheets.model import SheetsModel
+from comp.sheets.model_api_grid import PAGE_ROWS, RowGridQtModel
+from comp.sheets.model_api_table import CardTableQtModel
+
+
+@pytest.fixture
+def sheets(qapp):
+    n = 2 * PAGE_ROWS + 10
+    return SheetsModel(pd.DataFrame({c: [f"{c}{i}" for i in range(n)] for c in "abcd"}),
+                       compact=False)
+
+
+def record(signal) -> list[tuple]:
+    calls = []
+    signal.connect(lambda *args: calls.append(args))
+    return calls
+
+
+def titles(model) -> list[str]:
+    return [model.data(model.index(r, 1)) for r in range(model.rowCount())]
+
+
+# ── CardTableQtModel ────────────────────────────────────────────────
+def test_card_rows_follow_visibility(sheets):
+    model = CardTableQtModel(sheets)
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    removed, inserted = record(model.rowsRemoved), record(model.rowsInserted)
+    resets = record(model.modelReset)
+
+    sheets.cardtable.update_visibility(1, Qt.Unchecked)
+    assert titles(model) == list("acd") and len(removed) == 1 and removed[0][1:] == (1, 1)
+    sheets.cardtable.update_visibility(1, Qt.Checked)
+    assert titles(model) == list("abcd") and inserted[0][1:] == (1, 1)
+    assert resets == []                                          # row-level only
+
+    model.show_all = True
+    sheets.cardtable.update_visibility(2, Qt.Unchecked)
+    assert model.rowCount() == 4 and len(removed) == 1
+
+
+def test_card_rows_move(sheets):
+    model = CardTableQtModel(sheets)
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    moved, resets = record(model.rowsMoved), record(model.modelReset)
+    sheets.cardtable.reorder(3, 0)
+    assert titles(model) == list("dabc") and len(moved) == 1 and resets == []
+    sheets.cardtable.reorder_by_list([0, 1, 2, 3])
+    assert titles(model) == list("abcd") and len(resets) == 1
+
+
+def test_card_values_follow_row(sheets):
+    model = CardTableQtModel(sheets)
+    value = model.index(1, 2)
+    assert model.data(value) == "b0"
+    sheets.rows.seek(7)                                          # snapshot keyed by position
+    assert model.data(value) == "b7" and model.full_text(1) == "b7"
+    sheets.rows.set_column(1, pd.Series([f"B{i}" for i in range(sheets.row_count)]))
+    assert model.full_text(1) == "b7"
+    model.invalidate_row()
+    assert model.full_text(1) == "B7"
+
+
+def test_card_previews_prefetched(sheets):
+    model = CardTableQtModel(sheets)
+    rows = sheets.rows
+    assert not model.has_previews(5)
+    model.store_previews(rows, 5, [model._preview(c) for c in sheets.cards])
+    assert model.has_previews(5)
+    sheets.join_children([0])                                    # other rows: dropped
+    assert not model.has_previews(5)
+
+
+def test_card_derived_value(sheets):
+    model = CardTableQtModel(sheets)
+    sheets.add_derived("ab", "a + b")
+    assert titles(model)[-1] == "ab"
+    assert model.data(model.index(4, 2)) == "a0b0"
+
+
+# ── RowGridQtModel ──────────────────────────────────────────────────
+def test_grid_pages(sheets):
+    grid = RowGridQtModel(sheets)
+    assert grid.rowCount() == PAGE_ROWS and grid.canFetchMore()
+    grid.fetchMore()
+    grid.fetchMore()
+    assert grid.rowCount() == sheets.row_count and not grid.canFetchMore()
+    assert grid.data(grid.index(PAGE_ROWS + 5, 2)) == f"c{PAGE_ROWS + 5}"
+    assert grid.headerData(0, Qt.Vertical) == "1"
+
+
+def test_grid_ensure_loaded_and_filter(sheets):
+    grid = RowGridQtModel(sheets)
+    grid.ensure_loaded(PAGE_ROWS - 1)
+    assert grid.rowCount() == PAGE_ROWS
+    grid.ensure_loaded(PAGE_ROWS + 1)
+    assert grid.rowCount() == 2 * PAGE_ROWS + 1
+    sheets.rows.set_filter(np.array([3, 2 * PAGE_ROWS + 9]))
+    grid.reset_rows()
+    assert grid.rowCount() == 2 and grid.data(grid.index(1, 0)) == f"a{2 * PAGE_ROWS + 9}"
+
+
+def test_grid_columns_are_kept_cards(sheets):
+    grid = RowGridQtModel(sheets)
+    ct = sheets.cardtable
+    ct.update_visibility(0, Qt.Unchecked)
+    ct.disable(2)
+    ct.reorder(3, 0)
+    assert [grid.headerData(i, Qt.Horizontal) for i in range(grid.columnCount())] == ["d", "b"]
+
+
+# ── NavigationController ────────────────────────────────────────────
+def test_nav_go_to_clamps(sheets):
+    prev_btn, next_btn = QPushButton(), QPushButton()
+    nav = NavigationController(sheets.rows, prev_btn, next_btn)
+    changed = record(nav.rowChanged)
+    nav.go_to(5)
+    nav.go_to(10 ** 6)
+    assert changed == [(5,), (sheets.row_count - 1,)]
+    next_btn.click()                                             # wraps around
+    assert sheets.rows.index == 0
+
+
+def test_nav_coalesces_steps(sheets):
+    prev_btn, next_btn = QPushButton(), QPushButton()
+    nav = NavigationController(sheets.rows, prev_btn, next_btn)
+    changed = record(nav.rowChanged)
+    for _ in range(5):
+        next_btn.click()
+    assert changed == [(1,)]                                      # first step at once
+    QTest.qWait(COALESCE_MS * 3)
+    assert changed[-1] == (5,) and len(changed) == 2
+
+    prev_btn.click()
+    prev_btn.click()
+    nav.flush()
+    assert changed[-1] == (3,)
@@ -0,0 +1,117 @@
+# tests/test_row_model.py
+import numpy as np
+import pandas as pd
+
+from comp.sheets.model_row import RowModel
+
+
+def make_rows(n: int = 10) -> RowModel:
+    return RowModel(pd.DataFrame({"n": np.arange(n), "s": [f"r{i}" for i in range(n)]}))
+
+
+def test_seek_unfiltered():
+    rows = make_rows()
+    assert rows.seek(7) and rows.index == 7 and rows.position == 7
+    assert rows.values() == [7, "r7"]
+    assert not rows.seek(10) and not rows.seek(-1)
+    assert rows.index == 7
+
+
+def test_filter_maps_positions():
+    rows = make_rows()
+    rows.set_filter(np.array([1, 4, 8]))
+    assert rows.filtered and rows.row_count == 3 and rows.total_count == 10
+    assert [rows.position_of(i) for i in range(3)] == [1, 4, 8]
+    assert rows.seek(8) and rows.index == 2 and rows.position == 8
+    assert not rows.seek(5)
+    assert rows.index == 2                                       # unchanged on a miss
+    assert rows.view_positions().tolist() == [1, 4, 8]
+
+
+def test_filter_keeps_current_row():
+    rows = make_rows()
+    rows.seek(4)
+    rows.set_filter([1, 4, 8])
+    assert rows.position == 4
+    rows.set_filter([0, 9])                                      # current row dropped
+    assert rows.index == 0 and rows.position == 0
+    rows.seek(9)
+    rows.set_filter(None)
+    assert not rows.filtered and rows.index == 9
+    assert rows.view_positions().tolist() == list(range(10))
+
+
+def test_empty_filter():
+    rows = make_rows()
+    rows.set_filter([])
+    assert rows.row_count == 0 and not rows.seek(0)
+    rows.set_filter(None)
+    assert rows.row_count == 10
+
+
+def test_index_setter_bounds():
+    rows = make_rows()
+    rows.index = 3
+    rows.index = 10
+    rows.index = -1
+    assert rows.index == 3
+
+
+def test_append_merges_lazily():
+    rows = make_rows(3)
+    chunk = pd.DataFrame({"n": [3, 4], "s": ["r3", "r4"]})
+    rows.append(chunk)
+    assert rows.total_count == 5 and len(rows._data.frame) == 3     # not merged yet
+    assert rows.seek(4) and rows.values() == [4, "r4"]
+    assert len(rows._data.frame) == 5 and not rows._data.pending
+
+
+def test_views_share_rows_not_cursor():
+    rows = make_rows()
+    view = rows.view()
+    assert rows.same_rows(view) and not rows.same_rows(make_rows())
+    rows.seek(5)
+    view.set_filter([2, 3])
+    assert view.position == 2 and rows.position == 5 and not rows.filtered
+    rows.append(pd.DataFrame({"n": [10], "s": ["r10"]}))
+    assert view.total_count == 11
+
+
+def test_add_and_set_column():
+    rows = make_rows(3)
+    before = rows._df
+    pos = rows.add_column("d")
+    assert pos == 2 and rows.version == 1 and not rows.column_ready(pos)
+    assert before.shape[1] == 2                                  # snapshots unchanged
+    rows.set_column(pos, pd.Series([10, 11, 12]))
+    assert rows.column_ready(pos) and rows.version == 2
+    assert rows.values_at(1) == [1, "r1", 11]
+
+
+def test_replace_frame_only_if_unchanged():
+    rows = make_rows(3)
+    old = rows._df
+    new = old.copy()
+    assert rows.replace_frame(old, new) and rows._df is new
+    assert not rows.replace_frame(old, old.copy())              # no longer `old`
+    rows.append(pd.DataFrame({"n": [3], "s": ["r3"]}))
+    assert not rows.replace_frame(new, new.copy())              # rows pending
+
+
+def test_date_index_cached_until_append():
+    rows = RowModel(pd.DataFrame({"d": pd.date_range("2024-01-01", periods=3), "n": [1, 2, 3]}))
+    assert rows.datetime_columns() == ["d"]
+    idx = rows.date_index("d")
+    assert rows.date_index("d") is idx
+    rows.append(pd.DataFrame({"d": [pd.Timestamp("2024-02-01")], "n": [4]}))
+    assert len(rows.date_index("d")) == 4
+
+
+def test_duplicate_index_follows_filter():
+    rows = RowModel(pd.DataFrame({"a": [1, 2, 1, 2, 1], "b": ["x", "y", "x", "z", "x"]}))
+    assert rows.duplicate_index().group(0).tolist() == [0, 2, 4]
+    assert rows.duplicate_index([0]) is rows.duplicate_index([0])
+    assert len(rows.duplicate_index([0])) == 2
+    rows.set_filter([1, 2, 3, 4])
+    idx = rows.duplicate_index()
+    assert idx.group(0).tolist() == [2, 4] and idx.group_of(1) is None
@@ -0,0 +1,67 @@
+# tests/test_search_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from comp.sheets.model_search_index import SearchCancelled, SearchIndex, tokenize
+
+FRAME = pd.DataFrame({
+    "name": ["Ann Lee", "Bob Stone", "ann-marie", None, "Cy"],
+    "city": ["Oslo", "Bergen", "Oslo", "Annecy", None],
+    "n": [10, 200, 10, np.nan, 3],
+    "when": pd.to_datetime(["2024-01-31", None, "2023-05-01", "2024-01-31", "2022-02-02"]),
+})
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SearchIndex.build(FRAME)
+
+
+def test_tokenize():
+    assert tokenize("Ann-Marie  O'Neil 42") == ["ann", "marie", "o", "neil", "42"]
+
+
+def test_query_all_terms(index):
+    assert index.query("ann oslo").tolist() == [0, 2]
+    assert index.query("oslo bob").tolist() == []
+
+
+def test_last_term_is_prefix(index):
+    assert index.query("an").tolist() == [0, 2, 3]               # ann, annecy
+    assert index.query("ann oslo").tolist() == index.query("ann osl").tolist()
+    assert index.query("an oslo").tolist() == []                 # only the last term
+
+
+def test_numbers_and_dates_as_text(index):
+    assert index.query("10").tolist() == [0, 2]
+    assert index.query("2024").tolist() == [0, 3]
+
+
+def test_scoped_to_columns(index):
+    assert index.query("ann", columns=[0]).tolist() == [0, 2]
+    assert index.query("ann", columns=[1]).tolist() == [3]
+    assert index.query("ann", columns=[2, 99]).tolist() == []
+
+
+def test_empty_query(index):
+    assert index.query("").tolist() == [] and index.query(" - ").tolist() == []
+    assert index.rows == len(FRAME) and len(index) > 0
+
+
+def test_matches_scan():
+    rng = np.random.default_rng(0)
+    words = np.array(["alpha", "beta", "gamma", "alphabet", "delta"])
+    df = pd.DataFrame({c: [" ".join(rng.choice(words, 2)) for _ in range(200)] for c in "abc"})
+    index = SearchIndex.build(df)
+    for text in ("alpha", "alphab", "beta gam", "delta alpha"):
+        *whole, last = text.split()
+        expected = [i for i, row in enumerate(df.itertuples(index=False))
+                    if all(w in " ".join(row).split() for w in whole)
+                    and any(t.startswith(last) for t in " ".join(row).split())]
+        assert index.query(text).tolist() == expected, text
+
+
+def test_build_cancelled():
+    with pytest.raises(SearchCancelled):
+        SearchIndex.build(FRAME, cancelled=lambda: True)
@@ -0,0 +1,164 @@
+# tests/test_sheets_model.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from comp.sheets.helper_cache import WorkbookCache
+from comp.sheets.helper_derived import ExpressionError
+from comp.sheets.model import SheetsModel
+
+SHEETS = {
+    name: pd.DataFrame({"id": np.arange(n), "name": [f"{name}{i}" for i in range(n)]})
+    for name, n in (("First", 25), ("Second", 7), ("Third", 3))
+}
+
+
+@pytest.fixture(scope="module")
+def book(tmp_path_factory):
+    path = tmp_path_factory.mktemp("books") / "book.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        for name, df in SHEETS.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    return path
+
+
+def test_read_first_sheet(book):
+    model = SheetsModel(book, compact=False)
+    assert model.sheet_names == list(SHEETS) and model.sheet_name == "First"
+    assert model.row_count == 25 and not model.loading
+    assert [c.title for c in model.cards] == ["id", "name"]
+
+
+def test_stream_chunks(book):
+    model = SheetsModel(book, stream=True, chunk_rows=10, compact=False)
+    assert model.loading and model.rows.total_count == 10
+    with pytest.raises(RuntimeError):
+        model.share()
+    for chunk in model.pending_chunks():
+        model.append_chunk(chunk)
+    model.finish_loading()
+    assert not model.loading and model.rows.total_count == 25
+    pd.testing.assert_frame_equal(model.source_frame, SHEETS["First"], check_dtype=False)
+    assert model.cardtable.by_id(1).size.max == len("First24")
+
+
+def test_deferred_finish_compacts_off_thread(book):
+    model = SheetsModel(book, stream=True, chunk_rows=10, compact=True)
+    for chunk in model.pending_chunks():
+        model.append_chunk(chunk)
+    swap = model.finish_loading(defer=True)()
+    assert model.compact_report is None
+    swap()
+    assert model.compact_report is not None and model.source_frame["id"].dtype == np.int8
+
+
+def test_select_sheet_lru(book):
+    model = SheetsModel(book, max_sheets=2, compact=False)
+    assert model.select_sheet("Second") and model.row_count == 7
+    assert not model.select_sheet("Second")
+    assert model.select_sheet("Third") and model.loaded_sheets == ["Second", "Third"]
+    assert not model.select_sheet("Second")                     # still parsed
+    assert model.loaded_sheets == ["Third", "Second"]
+    with pytest.raises(KeyError):
+        model.select_sheet("Missing")
+
+
+def test_sheet_keeps_its_row(book):
+    model = SheetsModel(book, compact=False)
+    model.rows.seek(5)
+    model.select_sheet("Second")
+    assert model.rows.position == 0
+    model.select_sheet("First")
+    assert model.rows.position == 5
+
+
+def test_cache_restores_each_sheet(book, tmp_path):
+    cache = WorkbookCache(tmp_path / "cache")
+    model = SheetsModel(book, cache=cache, compact=False)
+    model.select_sheet("Second")
+    assert len(cache.entries()) == 2
+    again = SheetsModel(book, cache=cache, sheet="Second", compact=False)
+    assert again.row_count == 7 and again.current_values == [0, "Second0"]
+
+
+def test_share_has_own_rows(book):
+    model = SheetsModel(book, compact=False)
+    other = model.share()
+    model.rows.seek(3)
+    other.select_sheet("Third")
+    assert model.sheet_name == "First" and model.rows.position == 3
+    assert other.rows.position == 0 and other.row_count == 3
+    other.select_sheet("First")
+    assert other.rows.same_rows(model.rows) and other.rows is not model.rows
+    assert other.cardtable is model.cardtable
+
+
+def test_join_under_numeric_date_and_duplicate_headers():
+    day = pd.Timestamp("2024-01-31")
+    df = pd.DataFrame([["a;b", "x", 2], ["c", "y", 1]], columns=[2024, day, 2024])
+    model = SheetsModel(df)
+    ids = model.card_ids(["2024", str(day)])
+    assert ids == [0, 1]                                         # duplicate title: the first
+    with pytest.raises(ValueError):
+        model.card_ids(["missing"])
+
+    result = model.join_children([0], ";", sort_by=[2])          # sorted by the second 2024
+    got = model.rows._df
+    assert result.new_rows == 3 and got.iloc[:, 0].tolist() == ["c", "a", "b"]
+    assert got.iloc[:, 1].tolist() == ["y", "x", "x"]
+    assert model.joined
+    model.clear_join()
+    assert not model.joined
+
+
+def test_derived_over_compacted_columns():
+    n = 300
+    df = pd.DataFrame({
+        "Qty": np.arange(n) % 3,                                                  # → int8
+        "First": np.array(["Ann", "Bo", "Cy"], dtype=object)[np.arange(n) % 3],  # → category
+        "Last": [f"L{i}" for i in range(n)],                                      # → Arrow strings
+    })
+    model = SheetsModel(df, compact=True)
+    dtypes = [str(t) for t in model.source_frame.dtypes]
+    assert dtypes[0] == "int8" and dtypes[1] == "category", dtypes
+
+    cases = {
+        "Qty * 100": df["Qty"] * 100,
+        "First + ' ' + Last": df["First"] + " " + df["Last"],
+        "where(Qty > 1, First, Last)": pd.Series(np.where(df["Qty"] > 1, df["First"], df["Last"])),
+    }
+    for i, (expression, expected) in enumerate(cases.items()):
+        card = model.add_derived(f"d{i}", expression)
+        assert model.ensure_derived([card]) == [card.id]
+        got = model.rows._df.iloc[:, card.id]
+        assert got.astype(object).tolist() == expected.astype(object).tolist(), expression
+
+
+def test_derived_uses_derived_and_reaches_join_views():
+    model = SheetsModel(pd.DataFrame({"a": ["x;y", "z"], "n": [1, 2]}), compact=False)
+    model.join_children([0], ";")
+    double = model.add_derived("double", "n * 2")
+    quad = model.add_derived("quad", "double * 2")
+    assert sorted(model.ensure_derived([quad])) == [double.id, quad.id]
+    assert model.rows._df["quad"].tolist() == [4, 4, 8]
+    assert model.ensure_derived() == []                          # computed already
+    with pytest.raises(ValueError):
+        model.add_derived("double", "n")
+    with pytest.raises(ExpressionError):
+        model.add_derived("bad", "missing + 1")
+
+
+def test_apply_layout_recreates_derived():
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    model = SheetsModel(df, compact=False)
+    card = model.add_derived("sum", "a + b")
+    model.cardtable.reorder(card.id, 0)
+    model.cardtable.disable(0)
+    layout = model.cardtable.to_dict()
+
+    fresh = SheetsModel(df, compact=False)
+    fresh.apply_layout(layout)
+    assert [c.title for c in fresh.cardtable.ordered_cards()] == ["sum", "b", "a"]
+    assert fresh.cardtable.by_id(0).disabled
+    fresh.ensure_derived()
+    assert fresh.rows._df["sum"].tolist() == [4, 6]
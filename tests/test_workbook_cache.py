@@ -0,0 +1,81 @@
+# tests/test_workbook_cache.py
+import json
+import pickle
+
+import pandas as pd
+import pytest
+
+from comp.sheets.helper_cache import WorkbookCache
+from comp.sheets.helper_compact import ARROW_STRING
+
+DF = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+STATS = [{"min": 1, "avg": 1, "max": 1, "count": 2, "total": 2}] * 2
+
+
+@pytest.fixture
+def book(tmp_path):
+    src = tmp_path / "book.xlsx"
+    src.write_bytes(b"not parsed, only hashed")
+    return src
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return WorkbookCache(tmp_path / "cache")
+
+
+def test_round_trip(cache, book):
+    assert cache.load(book) is None
+    cache.store(book, DF, STATS)
+    df, stats = cache.load(book)
+    pd.testing.assert_frame_equal(df, DF)
+    assert stats == STATS
+    assert cache.load(book, "Other") is None                     # sheets keyed apart
+
+
+def test_changed_file_misses(cache, book):
+    cache.store(book, DF, STATS)
+    book.write_bytes(b"edited")
+    assert cache.load(book) is None
+
+
+def test_profiles_merge(cache, book):
+    assert not cache.store_profiles(book, {"0": {"kind": "integer"}})
+    cache.store(book, DF, STATS)
+    assert cache.store_profiles(book, {"0": {"kind": "integer"}})
+    assert cache.store_profiles(book, {"1": {"kind": "text"}})
+    assert cache.load_profiles(book) == {"0": {"kind": "integer"}, "1": {"kind": "text"}}
+
+
+@pytest.mark.skipif(ARROW_STRING is None, reason="needs pyarrow")
+def test_restores_only_compacted_strings(cache, book):
+    df = pd.DataFrame({"plain": pd.Series(["a", None], dtype="string"),
+                       "compact": pd.Series(["b", None], dtype=ARROW_STRING),
+                       "obj": ["c", "d"]})
+    cache.store(book, df, STATS)
+    got, _ = cache.load(book)
+    assert list(got.dtypes) == list(df.dtypes)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "pickle"])
+def test_corrupt_frame_dropped(cache, book, fmt):
+    cache.store(book, DF, STATS)
+    entry = cache.root / cache.key(book)
+    meta = json.loads((entry / "meta.json").read_text())
+    for frame in entry.glob("frame.*"):
+        frame.unlink()
+    meta["format"] = fmt
+    (entry / "meta.json").write_text(json.dumps(meta))
+    (entry / f"frame.{fmt}").write_bytes(pickle.dumps(DF)[:20])     # truncated
+    assert cache.load(book) is None
+    assert not entry.exists()
+
+
+@pytest.mark.parametrize("part", ["frame.*", "stats.json"])
+def test_incomplete_entry_dropped(cache, book, part):
+    cache.store(book, DF, STATS)
+    entry = cache.root / cache.key(book)
+    for path in entry.glob(part):
+        path.unlink()
+    assert cache.load(book) is None
+    assert not entry.exists()